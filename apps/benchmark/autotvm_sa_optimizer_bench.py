@@ -0,0 +1,96 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Microbenchmark of the autotvm simulated annealing optimizer.
+
+Compares the vectorized and the per-point implementations of
+SimulatedAnnealingOptimizer.find_maximums across config space sizes,
+using a cheap synthetic cost model so that the optimizer overhead dominates.
+"""
+import argparse
+import time
+
+import numpy as np
+
+from tvm.autotvm.task.space import ConfigSpace
+from tvm.autotvm.tuner.sa_model_optimizer import SimulatedAnnealingOptimizer
+
+
+class SyntheticTask:
+    """A task whose config space has `num_knobs` knobs with `knob_size` candidates each"""
+
+    def __init__(self, num_knobs, knob_size):
+        self.config_space = ConfigSpace()
+        for i in range(num_knobs):
+            self.config_space.define_knob("knob_%d" % i, list(range(knob_size)))
+
+
+class SyntheticModel:
+    """A cost model that is a cheap deterministic function of the index"""
+
+    def predict(self, xs):
+        xs = np.asarray(xs, dtype="float64")
+        return np.sin(xs * 1e-3) + np.cos(xs * 7.3e-5) + 2.0
+
+
+def benchmark(num_knobs, knob_size, args):
+    task = SyntheticTask(num_knobs, knob_size)
+    model = SyntheticModel()
+    exclusive = set(range(0, min(len(task.config_space), 100000), 7))
+    results = {}
+    for vectorized in [False, True]:
+        np.random.seed(0)
+        optimizer = SimulatedAnnealingOptimizer(
+            task,
+            n_iter=args.n_iter,
+            parallel_size=args.parallel_size,
+            early_stop=None,
+            log_interval=0,
+            vectorized=vectorized,
+        )
+        tic = time.time()
+        for _ in range(args.repeat):
+            maximums = optimizer.find_maximums(model, args.num, exclusive)
+        results[vectorized] = (time.time() - tic) / args.repeat
+        best = model.predict(maximums[:1])[0] if maximums else float("nan")
+        results[(vectorized, "best")] = best
+    print(
+        "%12d %12.3f %12.3f %8.1fx %10.4f %10.4f"
+        % (
+            len(task.config_space),
+            results[False],
+            results[True],
+            results[False] / results[True],
+            results[(False, "best")],
+            results[(True, "best")],
+        )
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--n-iter", type=int, default=500)
+    parser.add_argument("--parallel-size", type=int, default=128)
+    parser.add_argument("--num", type=int, default=64, help="the size of the top-k set")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(
+        "%12s %12s %12s %9s %10s %10s"
+        % ("space size", "scalar (s)", "vector (s)", "speedup", "best-sca", "best-vec")
+    )
+    for num_knobs, knob_size in [(2, 16), (4, 16), (6, 16), (8, 16), (10, 16), (12, 16)]:
+        benchmark(num_knobs, knob_size, args)
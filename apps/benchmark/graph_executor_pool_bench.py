@@ -0,0 +1,95 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Benchmark of the throughput and latency of GraphExecutorPool against the number of instances.
+
+Keeps a fixed number of requests in flight per instance and reports requests/s and
+the p50/p99 latency of a CPU model.
+"""
+import argparse
+import threading
+import time
+
+import numpy as np
+
+import tvm
+from tvm import relay
+from tvm.relay import testing
+from tvm.contrib.graph_executor_pool import GraphExecutorPool
+
+
+def benchmark(lib, input_shape, num_instances, args):
+    data = np.random.uniform(size=input_shape).astype("float32")
+    latencies = []
+    lock = threading.Lock()
+    with GraphExecutorPool(lib, num_instances=num_instances) as pool:
+        # warm up every instance
+        for future in [pool.submit({"data": data}) for _ in range(num_instances * 2)]:
+            future.result()
+
+        in_flight = threading.Semaphore(num_instances * args.in_flight)
+
+        def on_done(start):
+            def callback(_):
+                with lock:
+                    latencies.append(time.perf_counter() - start)
+                in_flight.release()
+
+            return callback
+
+        tic = time.perf_counter()
+        for _ in range(args.num_requests):
+            in_flight.acquire()
+            pool.submit({"data": data}).add_done_callback(on_done(time.perf_counter()))
+        for _ in range(num_instances * args.in_flight):
+            in_flight.acquire()
+        elapsed = time.perf_counter() - tic
+
+    latencies = np.array(latencies) * 1000.0
+    print(
+        "%10d %14.1f %10.2f %10.2f"
+        % (
+            num_instances,
+            args.num_requests / elapsed,
+            np.percentile(latencies, 50),
+            np.percentile(latencies, 99),
+        )
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--network", type=str, default="resnet-18", choices=["resnet-18", "mlp"])
+    parser.add_argument("--target", type=str, default="llvm")
+    parser.add_argument("--num-requests", type=int, default=200)
+    parser.add_argument(
+        "--in-flight", type=int, default=2, help="the number of requests in flight per instance"
+    )
+    parser.add_argument("--num-instances", type=int, nargs="+", default=[1, 2, 4, 8])
+    args = parser.parse_args()
+
+    if args.network == "mlp":
+        mod, params = testing.mlp.get_workload(batch_size=1)
+        input_shape = (1, 1, 28, 28)
+    else:
+        mod, params = testing.resnet.get_workload(num_layers=18, batch_size=1)
+        input_shape = (1, 3, 224, 224)
+    with tvm.transform.PassContext(opt_level=3):
+        lib = relay.build(mod, target=args.target, params=params)
+
+    print("%10s %14s %10s %10s" % ("instances", "requests/s", "p50 (ms)", "p99 (ms)"))
+    for num_instances in args.num_instances:
+        benchmark(lib, input_shape, num_instances, args)
@@ -0,0 +1,72 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Benchmark of iterating tvm.ir.container.Array and Map from Python.
+
+Compares the per-element FFI access against the bulk conversion APIs.
+"""
+import argparse
+import time
+
+import tvm
+from tvm import te
+from tvm.runtime import _ffi_api
+
+
+def measure(func, repeat):
+    tic = time.time()
+    for _ in range(repeat):
+        func()
+    return (time.time() - tic) / repeat
+
+
+def benchmark(name, per_element, bulk, repeat):
+    t_per_element = measure(per_element, repeat)
+    t_bulk = measure(bulk, repeat)
+    print(
+        "%-20s %14.2f %10.2f %8.1fx"
+        % (name, t_per_element * 1e3, t_bulk * 1e3, t_per_element / t_bulk)
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    arr = tvm.runtime.convert(list(range(args.size)))
+    amap = tvm.runtime.convert({te.var("v%d" % i): i for i in range(args.size)})
+
+    print("%-20s %14s %10s %9s" % ("case", "per-elem (ms)", "bulk (ms)", "speedup"))
+    benchmark(
+        "Array iteration",
+        lambda: [arr[i] for i in range(len(arr))],
+        lambda: list(arr),
+        args.repeat,
+    )
+    benchmark(
+        "Array to int64",
+        lambda: [arr[i].value for i in range(len(arr))],
+        arr.numpy,
+        args.repeat,
+    )
+
+    def map_items_per_element():
+        akvs = _ffi_api.MapItems(amap)
+        return [(akvs[i], akvs[i + 1]) for i in range(0, len(akvs), 2)]
+
+    benchmark("Map items", map_items_per_element, amap.items, args.repeat)
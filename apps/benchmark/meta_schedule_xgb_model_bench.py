@@ -0,0 +1,76 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Benchmark the per-round update latency of the meta_schedule XGBModel
+against the size of the tuning history.
+
+Example:
+
+    python3 meta_schedule_xgb_model_bench.py --num-rounds 50 --batch-size 64
+    python3 meta_schedule_xgb_model_bench.py --num-rounds 50 --batch-size 64 \
+        --incremental --full-rebuild-interval 10
+"""
+import argparse
+import time
+
+import numpy as np
+
+from tvm import meta_schedule as ms
+from tvm.meta_schedule.cost_model import XGBModel
+from tvm.meta_schedule.feature_extractor import RandomFeatureExtractor
+from tvm.meta_schedule.runner import RunnerResult
+from tvm.meta_schedule.search_strategy import MeasureCandidate
+from tvm.meta_schedule.testing.te_workload import create_te_workload
+from tvm.tir.schedule import Schedule
+
+
+def main(args):
+    """Update the model for the given number of rounds and print the latency of each"""
+    mod = create_te_workload("GMM", 0)
+    context = ms.TuneContext(mod=mod)
+    model = XGBModel(
+        extractor=RandomFeatureExtractor(feature_size=args.feature_size),
+        num_warmup_samples=0,
+        incremental=args.incremental,
+        num_incremental_rounds=args.num_incremental_rounds,
+        full_rebuild_interval=args.full_rebuild_interval,
+    )
+    candidates = [MeasureCandidate(Schedule(mod), []) for _ in range(args.batch_size)]
+    print(f"{'Round':>6} {'History':>8} {'Update (ms)':>12} {'Full rebuild':>13}")
+    latencies = []
+    for i in range(args.num_rounds):
+        results = [
+            RunnerResult(list(np.random.rand(3) * 10 + 1e-6), None) for _ in range(args.batch_size)
+        ]
+        start = time.perf_counter()
+        model.update(context, candidates, results)
+        latency = (time.perf_counter() - start) * 1000.0
+        latencies.append(latency)
+        rebuilt = model.num_updates_since_rebuild == 0
+        print(f"{i:>6} {model.data_size:>8} {latency:>12.2f} {str(rebuilt):>13}")
+    print(f"Total update time: {sum(latencies) / 1000.0:.2f} s")
+    print(f"Mean update latency: {np.mean(latencies):.2f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--num-rounds", type=int, default=50)
+    parser.add_argument("--batch-size", type=int, default=64)
+    parser.add_argument("--feature-size", type=int, default=164)
+    parser.add_argument("--incremental", action="store_true")
+    parser.add_argument("--num-incremental-rounds", type=int, default=100)
+    parser.add_argument("--full-rebuild-interval", type=int, default=8)
+    main(parser.parse_args())
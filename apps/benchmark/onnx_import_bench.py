@@ -0,0 +1,95 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Benchmark of the Relay ONNX importer against the number of nodes.
+
+Imports synthetic chains of MatMul -> Add -> Relu blocks, whose converters
+query the types of their inputs, with and without incremental type inference.
+"""
+import argparse
+import time
+
+import numpy as np
+from onnx import TensorProto, helper, numpy_helper
+
+from tvm import relay
+
+
+def make_chain(num_blocks, hidden):
+    """A graph of `num_blocks` MatMul -> Add -> Relu blocks, i.e. 3 * num_blocks nodes"""
+    nodes, initializers = [], []
+    last = "input"
+    for i in range(num_blocks):
+        weight = numpy_helper.from_array(
+            np.random.uniform(size=(hidden, hidden)).astype("float32"), "w%d" % i
+        )
+        bias = numpy_helper.from_array(
+            np.random.uniform(size=(hidden,)).astype("float32"), "b%d" % i
+        )
+        initializers += [weight, bias]
+        nodes.append(helper.make_node("MatMul", [last, "w%d" % i], ["mm%d" % i]))
+        nodes.append(helper.make_node("Add", ["mm%d" % i, "b%d" % i], ["add%d" % i]))
+        nodes.append(helper.make_node("Relu", ["add%d" % i], ["relu%d" % i]))
+        last = "relu%d" % i
+    graph = helper.make_graph(
+        nodes,
+        "chain",
+        inputs=[helper.make_tensor_value_info("input", TensorProto.FLOAT, [1, 16, hidden])],
+        outputs=[helper.make_tensor_value_info(last, TensorProto.FLOAT, [1, 16, hidden])],
+        initializer=initializers,
+    )
+    return helper.make_model(graph, producer_name="onnx_import_bench")
+
+
+def benchmark(num_blocks, args):
+    model = make_chain(num_blocks, args.hidden)
+    results = {}
+    for incremental in [False, True]:
+        tic = time.time()
+        for _ in range(args.repeat):
+            relay.frontend.from_onnx(
+                model,
+                shape={"input": (1, 16, args.hidden)},
+                convert_config={"incremental_type_inference": incremental},
+            )
+        results[incremental] = (time.time() - tic) / args.repeat
+    print(
+        "%8d %12.3f %12.3f %8.1fx"
+        % (
+            len(model.graph.node),
+            results[False],
+            results[True],
+            results[False] / results[True],
+        )
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--hidden", type=int, default=64)
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument(
+        "--num-blocks",
+        type=int,
+        nargs="+",
+        default=[25, 50, 100, 200, 400],
+        help="the numbers of MatMul -> Add -> Relu blocks to import",
+    )
+    args = parser.parse_args()
+
+    print("%8s %12s %12s %9s" % ("nodes", "full (s)", "incr (s)", "speedup"))
+    for num_blocks in args.num_blocks:
+        benchmark(num_blocks, args)
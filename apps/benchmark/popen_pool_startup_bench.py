@@ -0,0 +1,76 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Benchmark of the worker startup of PopenPoolExecutor for each start method.
+
+Every worker is recycled after `--uses` jobs, so that the throughput of short jobs
+is dominated by the startup of the workers, as in tuning with frequent timeouts.
+"""
+import argparse
+import os
+import time
+
+from tvm.contrib.popen_pool import PopenPoolExecutor, PopenWorker
+
+
+def startup_latency(start_method, repeat):
+    """Mean time to start a worker and get the result of its first job"""
+    worker = PopenWorker(maximum_uses=1, start_method=start_method)
+    # the zygote is started once per process, do not count it
+    worker.send(os.getpid)
+    worker.recv()
+    tic = time.time()
+    for _ in range(repeat):
+        worker.send(os.getpid)
+        worker.recv()
+    latency = (time.time() - tic) / repeat
+    worker.kill()
+    return latency
+
+
+def churn_throughput(start_method, args):
+    """Number of jobs per second of a pool recycling its workers"""
+    pool = PopenPoolExecutor(
+        max_workers=args.workers, maximum_process_uses=args.uses, start_method=start_method
+    )
+    # warm up
+    list(pool.map_with_error_catching(abs, range(args.workers)))
+    tic = time.time()
+    results = list(pool.map_with_error_catching(abs, range(args.jobs)))
+    elapsed = time.time() - tic
+    assert all(result.value == i for i, result in enumerate(results))
+    return args.jobs / elapsed
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--jobs", type=int, default=256)
+    parser.add_argument("--uses", type=int, default=1, help="jobs per worker before recycling")
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--start-methods", nargs="+", default=["popen", "zygote"])
+    args = parser.parse_args()
+
+    print("%8s %14s %14s" % ("method", "startup (ms)", "jobs/s"))
+    for start_method in args.start_methods:
+        print(
+            "%8s %14.2f %14.1f"
+            % (
+                start_method,
+                startup_latency(start_method, args.repeat) * 1000,
+                churn_throughput(start_method, args),
+            )
+        )
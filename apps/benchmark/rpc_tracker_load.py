@@ -0,0 +1,180 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Load generator for the scheduler of the RPC tracker.
+
+Simulates thousands of RPC servers and many clients of several users over TCP.
+Each client repeatedly requests a server, holds it for a while, and then the
+server reports itself free again, as a real server does at the end of a session.
+Reports the scheduling throughput, the wait time of the requests, and the share
+of the servers granted to each user.
+
+Example:
+
+    python apps/benchmark/rpc_tracker_load.py --servers 2000 --clients 4000 --users 4 \
+        --scheduler fair_share --user-weights u0=2
+"""
+import argparse
+import asyncio
+import json
+import struct
+import time
+
+import numpy as np
+
+from tvm.rpc.base import RPC_TRACKER_MAGIC, TrackerCode
+from tvm.rpc.tracker import Tracker
+
+
+async def _send(writer, data):
+    payload = json.dumps(data).encode("utf-8")
+    writer.write(struct.pack("<i", len(payload)) + payload)
+    await writer.drain()
+
+
+async def _recv(reader):
+    size = struct.unpack("<i", await reader.readexactly(4))[0]
+    return json.loads(await reader.readexactly(size))
+
+
+async def _connect(addr):
+    reader, writer = await asyncio.open_connection(*addr)
+    writer.write(struct.pack("<i", RPC_TRACKER_MAGIC))
+    await writer.drain()
+    magic = struct.unpack("<i", await reader.readexactly(4))[0]
+    assert magic == RPC_TRACKER_MAGIC
+    return reader, writer
+
+
+class SimulatedServer:
+    """A server which reports itself to the tracker again after each session"""
+
+    def __init__(self, index, key, servers_by_matchkey):
+        self.index = index
+        self.key = key
+        self.num_sessions = 0
+        self._servers_by_matchkey = servers_by_matchkey
+        self._reader = None
+        self._writer = None
+        self._lock = asyncio.Lock()
+
+    async def start(self, addr):
+        self._reader, self._writer = await _connect(addr)
+        info = {"key": "server:" + self.key, "addr": [None, self.index]}
+        await _send(self._writer, [TrackerCode.UPDATE_INFO, info])
+        assert await _recv(self._reader) == TrackerCode.SUCCESS
+        await self.put()
+
+    async def put(self):
+        async with self._lock:
+            matchkey = "%s:%d:%d" % (self.key, self.index, self.num_sessions)
+            self._servers_by_matchkey[matchkey] = self
+            await _send(self._writer, [TrackerCode.PUT, self.key, [self.index, matchkey], None])
+            assert await _recv(self._reader) == TrackerCode.SUCCESS
+
+    def close(self):
+        self._writer.close()
+
+
+async def _client(addr, key, user, args, servers_by_matchkey, stats, deadline):
+    reader, writer = await _connect(addr)
+    while time.time() < deadline:
+        start = time.time()
+        await _send(writer, [TrackerCode.REQUEST, key, user, 1, {}])
+        value = await _recv(reader)
+        assert value[0] == TrackerCode.SUCCESS
+        stats.append((user, time.time() - start))
+        server = servers_by_matchkey.pop(value[1][2])
+        # hold the server for the session, then the server becomes free again
+        await asyncio.sleep(np.random.exponential(args.hold_ms / 1000.0))
+        server.num_sessions += 1
+        await server.put()
+    writer.close()
+
+
+async def run(args, addr):
+    """Run the simulation against the tracker at addr"""
+    servers_by_matchkey = {}
+    servers = [SimulatedServer(i, args.key, servers_by_matchkey) for i in range(args.servers)]
+    for i in range(0, len(servers), 256):
+        await asyncio.gather(*[server.start(addr) for server in servers[i : i + 256]])
+    stats = []
+    start = time.time()
+    await asyncio.gather(
+        *[
+            _client(
+                addr,
+                args.key,
+                "u%d" % (i % args.users),
+                args,
+                servers_by_matchkey,
+                stats,
+                start + args.duration,
+            )
+            for i in range(args.clients)
+        ]
+    )
+    elapsed = time.time() - start
+    for server in servers:
+        server.close()
+
+    waits = np.array([wait for _, wait in stats]) * 1000
+    print("servers %d, clients %d, users %d" % (args.servers, args.clients, args.users))
+    print("grants: %d, %.1f grants/s" % (len(stats), len(stats) / elapsed))
+    print(
+        "wait ms: mean %.2f, p50 %.2f, p99 %.2f, max %.2f"
+        % (waits.mean(), np.percentile(waits, 50), np.percentile(waits, 99), waits.max())
+    )
+    for user in sorted(set(user for user, _ in stats)):
+        count = sum(1 for u, _ in stats if u == user)
+        print("  %-6s %6.1f%% of the grants" % (user, 100.0 * count / len(stats)))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tracker", type=str, help="host:port of a running tracker")
+    parser.add_argument("--scheduler", type=str, default="fair_share")
+    parser.add_argument("--user-weights", type=str, help="e.g. u0=2,u1=1")
+    parser.add_argument("--key", type=str, default="sim")
+    parser.add_argument("--servers", type=int, default=2000)
+    parser.add_argument("--clients", type=int, default=4000)
+    parser.add_argument("--users", type=int, default=4)
+    parser.add_argument("--hold-ms", type=float, default=10.0, help="mean session duration")
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds")
+    args = parser.parse_args()
+
+    tracker = None
+    if args.tracker:
+        host, port = args.tracker.rsplit(":", 1)
+        addr = (host, int(port))
+    else:
+        weights = None
+        if args.user_weights:
+            weights = {
+                user: float(weight)
+                for user, weight in (item.split("=") for item in args.user_weights.split(","))
+            }
+        tracker = Tracker("127.0.0.1", scheduler=args.scheduler, user_weights=weights, silent=True)
+        addr = ("127.0.0.1", tracker.port)
+    try:
+        asyncio.run(run(args, addr))
+    finally:
+        if tracker is not None:
+            tracker.terminate()
+
+
+if __name__ == "__main__":
+    main()
@@ -43,7 +43,15 @@ from .measure import (
     LocalRPCMeasureContext,
     register_task_input_check_func,
 )
-from .measure_record import RecordToFile, RecordReader, load_best_record, load_records, save_records
+from .measure_record import (
+    RecordToFile,
+    RecordReader,
+    iter_records,
+    load_best_record,
+    load_best_records,
+    load_records,
+    save_records,
+)
 from .relay_integration import (
     extract_tasks,
     remove_index_check,
@@ -33,7 +33,7 @@ from tvm.contrib.utils import tempdir
 from tvm.tir.expr import FloatImm
 from .cost_model import RandomModel, XGBModel
 from .measure import LocalRPCMeasureContext
-from .measure_record import RecordToFile, load_records
+from .measure_record import RecordToFile, iter_records, load_best_records
 from .search_policy import PreloadMeasuredStates, SketchPolicy
 from .search_task import SearchTask, TuningOptions
 from .utils import calc_workload_dis_factor, decode_workload_key
@@ -142,11 +142,16 @@ class ApplyHistoryBest(DispatchContext):
         if it is not None, only load the first `n_lines` lines of log.
     include_compatible: bool
         When set to True, compatible records will also be considered.
+    cache_best_records: bool
+        When set to True, the best records of each log file are saved to
+        "<log file>.best", and later loads read this much smaller file instead
+        until the log file is modified. Only applies when `n_lines` is None.
     """
 
-    def __init__(self, records, n_lines=None, include_compatible=False):
+    def __init__(self, records, n_lines=None, include_compatible=False, cache_best_records=False):
         super(ApplyHistoryBest, self).__init__()
         self.include_compatible = include_compatible
+        self.cache_best_records = cache_best_records
 
         # Dict[str (target key),
         #   Dict[str (workload hash),
@@ -199,29 +204,31 @@ class ApplyHistoryBest(DispatchContext):
         n_lines: Optional[int]
             if it is not None, only load the first `n_lines` lines of log
         """
-        joint_records = []
         if not isinstance(records, Iterable) or isinstance(records, str):
             records = [records]
 
-        for rec in records:
-            if isinstance(rec, pathlib.Path):
-                rec = str(rec)
-
-            if isinstance(rec, str):
-                rec = load_records(rec)
-                joint_records += rec
-            else:
-                if rec is not None:
-                    joint_records.append(rec)
-
-        if not joint_records:
-            return
+        def joint_records():
+            # Stream the records instead of loading all files into memory first.
+            # When all lines are loaded, only the best records of each file can win,
+            # so a file is reduced to its best records in a single pass.
+            for rec in records:
+                if isinstance(rec, pathlib.Path):
+                    rec = str(rec)
+
+                if isinstance(rec, str):
+                    if n_lines is None:
+                        cache_file = rec + ".best" if self.cache_best_records else None
+                        yield from load_best_records(rec, cache_file=cache_file)
+                    else:
+                        yield from iter_records(rec)
+                elif rec is not None:
+                    yield rec
 
         best_by_targetkey = self.best_by_targetkey
         best_by_model = self.best_by_model
 
         counter = 0
-        for inp, res in joint_records:
+        for inp, res in joint_records():
             if n_lines is not None and counter >= n_lines:
                 break
             counter += 1
@@ -18,9 +18,11 @@
 
 """ Serialization and other I/O support for measurement records (tuning logs). """
 import argparse
+import json
 import logging
 import os
 import itertools
+import threading
 
 import numpy as np
 
@@ -32,6 +34,9 @@ from . import _ffi_api
 
 logger = logging.getLogger("auto_scheduler")
 
+# The header of a best-only record cache file, followed by the metadata of its source log
+BEST_RECORD_CACHE_HEADER = "# auto_scheduler best records of "
+
 
 @tvm._ffi.register_object("auto_scheduler.RecordToFile")
 class RecordToFile(MeasureCallback):
@@ -194,6 +199,114 @@ def load_records(filename):
     return zip(*RecordReader(filename).read_lines())
 
 
+def iter_records(filename, chunk_size=4096):
+    """
+    Generator: load measurement records from a file, `chunk_size` lines at a time.
+    Unlike :code:`load_records`, the whole file is never held in memory.
+
+    Parameters
+    ----------
+    filename : str
+        File name to load log from.
+    chunk_size : int
+        The number of lines read from the file at a time.
+
+    Yields
+    ------
+    input : auto_scheduler.measure.MeasureInput
+    result : auto_scheduler.measure.MeasureResult
+    """
+    reader = RecordReader(filename)
+    while True:
+        inputs, results = reader.read_lines(max_lines=chunk_size)
+        if len(inputs) == 0:
+            break
+        yield from zip(inputs, results)
+
+
+def _source_metadata(filename):
+    stat = os.stat(filename)
+    return {"path": os.path.abspath(filename), "mtime": stat.st_mtime, "size": stat.st_size}
+
+
+def _load_best_record_cache(filename, cache_file):
+    """Load a best-only record cache, or return None if it is missing or stale"""
+    try:
+        with open(cache_file) as f:
+            header = f.readline()
+        if not header.startswith(BEST_RECORD_CACHE_HEADER):
+            return None
+        if json.loads(header[len(BEST_RECORD_CACHE_HEADER) :]) != _source_metadata(filename):
+            return None
+    except (OSError, ValueError):
+        return None
+    return list(iter_records(cache_file))
+
+
+def load_best_records(filename, cache_file=None, chunk_size=4096):
+    """
+    Load the records that are the best of their (target key, workload) or
+    (target model, workload) from a file, in a single streaming pass.
+    Only the current best records are kept in memory.
+
+    Parameters
+    ----------
+    filename : str
+        File name to load log from.
+    cache_file : Optional[str]
+        If not None, the best records are also saved to this file, together with the
+        modification time and the size of the log file. The next calls read the best records
+        from this file directly, until the log file is modified.
+    chunk_size : int
+        The number of lines read from the file at a time.
+
+    Returns
+    -------
+    logs : List[Tuple[auto_scheduler.measure.MeasureInput, auto_scheduler.measure.MeasureResult]]
+        The best records, in the order of the log file.
+    """
+    if cache_file is not None:
+        records = _load_best_record_cache(filename, cache_file)
+        if records is not None:
+            return records
+        metadata = _source_metadata(filename)
+
+    # Dict[(target key or model, workload hash, workload args), (cost, index, input, result)]
+    best = {}
+    for index, (inp, res) in enumerate(iter_records(filename, chunk_size)):
+        if res.error_no != MeasureErrorNo.NO_ERROR:
+            continue
+        cost = np.mean([x.value for x in res.costs if isinstance(x, tvm.tir.expr.FloatImm)])
+        workload_hash, workload_args = decode_workload_key(inp.task.workload_key)
+        target = inp.task.target
+        keys = [(k, workload_hash, workload_args) for k in target.keys]
+        if target.model != "unknown":
+            keys.append((target.model, workload_hash, workload_args))
+        for key in keys:
+            if key not in best or best[key][0] > cost:
+                best[key] = (cost, index, inp, res)
+
+    # Remove duplications by multiple keys, and restore the order of the log file
+    records = {index: (inp, res) for _, index, inp, res in best.values()}
+    records = [records[index] for index in sorted(records)]
+
+    if cache_file is not None:
+        # the processes and threads writing the same cache each write their own temporary file
+        tmp_file = "%s.%d.%d.tmp" % (cache_file, os.getpid(), threading.get_ident())
+        try:
+            with open(tmp_file, "w") as f:
+                f.write(BEST_RECORD_CACHE_HEADER + json.dumps(metadata) + "\n")
+            if records:
+                save_records(tmp_file, *zip(*records))
+            os.replace(tmp_file, cache_file)
+        except OSError:
+            logger.warning("Failed to write the best record cache %s", cache_file)
+        finally:
+            if os.path.exists(tmp_file):
+                os.remove(tmp_file)
+    return records
+
+
 def save_records(filename, inputs, results):
     """
     Append measure records to file.
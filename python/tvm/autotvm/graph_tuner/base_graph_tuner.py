@@ -17,6 +17,7 @@
 # pylint: disable=too-many-arguments,too-many-locals,too-many-statements,too-many-instance-attributes,too-many-branches,too-many-nested-blocks,invalid-name,unused-argument,unused-variable,no-member,no-value-for-parameter
 """Base class for graph tuner."""
 import logging
+import os
 from abc import abstractmethod
 
 import numpy as np
@@ -27,7 +28,7 @@ from tvm import te
 from tvm import autotvm, relay
 from tvm.autotvm.task import get_config
 from tvm.autotvm.record import encode, load_from_file
-from tvm.autotvm.measure import MeasureResult, MeasureInput
+from tvm.autotvm.measure import MeasureResult, MeasureInput, MeasureErrorNo, create_measure_batch
 from tvm.target import Target
 
 from ...target import Target
@@ -376,6 +377,7 @@ class BaseGraphTuner(object):
         target_host=None,
         infer_layout=False,
         runner=None,
+        cache_file=None,
     ):
         """Benchmark all possible layout transformation in the graph,
         given a set of schedule candidates for each workload of target operator.
@@ -441,6 +443,12 @@ class BaseGraphTuner(object):
             This might bring performance loss comparing to benchmarking layout transformation.
         runner : Runner, optional
             Accept a user-supplied runner
+
+        cache_file : str, optional
+            Filename of a persistent layout_transform records log shared between graphs.
+            The records of the same target in this file are reused, and the layout
+            transformations measured by this call are appended to it, so that repeated and
+            related graphs skip their measurement.
         """
         self._logger.info("Start to benchmark layout transformation...")
         self._target, target_host = Target.canon_target_and_host(self._target, target_host)
@@ -466,6 +474,21 @@ class BaseGraphTuner(object):
                 total_time += record[1].costs[0]
         avg_time = total_time / num_flops if num_flops > 0 else 0
 
+        if cache_file is not None and os.path.isfile(cache_file):
+            num_cached = 0
+            target_str = str(self._target)
+            for inp, res in load_from_file(cache_file):
+                if inp.task is None or inp.task.name != "layout_transform":
+                    continue
+                if str(inp.target) != target_str:
+                    continue
+                if inp.task.workload not in self._layout_transform_perf_records:
+                    if res.error_no != MeasureErrorNo.NO_ERROR:
+                        res = res._replace(costs=(INVALID_LAYOUT_TIME,))
+                    self._layout_transform_perf_records[inp.task.workload] = (inp, res)
+                    num_cached += 1
+            self._logger.info("Loaded %d layout transformations from %s.", num_cached, cache_file)
+
         args_list = []
 
         def _fetch_args_callback(from_node_idx, to_node_idx, from_sch_idx, to_sch_idx, args):
@@ -476,16 +499,7 @@ class BaseGraphTuner(object):
 
         self._iterate_layout_transform(_fetch_args_callback)
 
-        def _log_to_list(record_list):
-            """Callback to log result to a list."""
-
-            def _callback(_, inputs, results):
-                """Callback implementation"""
-                record_list.append((inputs[0], results[0]))
-
-            return _callback
-
-        builder = autotvm.LocalBuilder(n_parallel=n_parallel, build_func=build_func)
+        builder = autotvm.LocalBuilder(n_parallel=n_parallel, build_func=build_func, do_fork=True)
         if use_rpc:
             if device_key is None:
                 raise RuntimeError("device_key need to be set to use rpc tracker mode.")
@@ -501,10 +515,13 @@ class BaseGraphTuner(object):
         elif not runner:
             runner = autotvm.LocalRunner(number=min_exec_num, repeat=1, timeout=timeout)
         measure_option = autotvm.measure_option(builder=builder, runner=runner)
+        # The same layout transformation usually appears between many pairs of schedules
+        # in the graph, only measure it once
+        measure_args = {}
         for args in args_list:
             data, in_layout, out_layout = args
             ltf_workload = autotvm.task.args_to_workload(args, "layout_transform")
-            if ltf_workload in self._layout_transform_perf_records:
+            if ltf_workload in self._layout_transform_perf_records or ltf_workload in measure_args:
                 continue
 
             if infer_layout:
@@ -531,17 +548,47 @@ class BaseGraphTuner(object):
                 self._layout_transform_perf_records[ltf_workload] = (record_input, record_output)
                 continue
 
-            records = []
-            task = autotvm.task.create("layout_transform", args=args, target=self._target)
-            tuner = autotvm.tuner.GridSearchTuner(task)
-            tuner.tune(n_trial=1, measure_option=measure_option, callbacks=[_log_to_list(records)])
-            if not isinstance(records[0][1].costs[0], float):
-                records[0] = (records[0][0], records[0][1]._replace(costs=(INVALID_LAYOUT_TIME,)))
-            self._layout_transform_perf_records[ltf_workload] = records[0]
+            measure_args[ltf_workload] = args
+
+        if measure_args:
+            self._measure_layout_transform(list(measure_args.items()), measure_option, cache_file)
 
         self._iterate_layout_transform(self._create_matrix_callback)
         self._logger.info("Benchmarking layout transformation successful.")
 
+    def _measure_layout_transform(self, workload_args, measure_option, cache_file):
+        """Measure layout transformations in batches of the parallelism of the builder,
+        and append the measurements to cache_file if it is set. Runtime errors and timeouts
+        may not happen again, so only successes and build errors are cached.
+        """
+        tasks = [
+            (ltf_workload, autotvm.task.create("layout_transform", args=args, target=self._target))
+            for ltf_workload, args in workload_args
+        ]
+        # The layout transformations only differ by their task, while the runner only
+        # depends on the target, so a single measure batch measures all of them.
+        measure_batch = create_measure_batch(tasks[0][1], measure_option)
+        batch_size = measure_batch.n_parallel
+        for start in range(0, len(tasks), batch_size):
+            batch = tasks[start : start + batch_size]
+            inputs = [
+                MeasureInput(self._target, task, task.config_space.get(0)) for _, task in batch
+            ]
+            results = measure_batch(inputs)
+            cache_rows = []
+            for (ltf_workload, _), inp, res in zip(batch, inputs, results):
+                if res.error_no < MeasureErrorNo.RUNTIME_DEVICE:
+                    cache_rows.append(encode(inp, res))
+                if not isinstance(res.costs[0], float):
+                    res = res._replace(costs=(INVALID_LAYOUT_TIME,))
+                self._layout_transform_perf_records[ltf_workload] = (inp, res)
+            if cache_file is not None and cache_rows:
+                with open(cache_file, "a") as out_file:
+                    out_file.write("".join(row + "\n" for row in cache_rows))
+            self._logger.info(
+                "Measured %d/%d layout transformations.", start + len(batch), len(tasks)
+            )
+
     @property
     def layout_transform_perf_records(self):
         """Get layout transformation dictionary for input graph.
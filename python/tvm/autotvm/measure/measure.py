@@ -16,8 +16,15 @@
 # under the License.
 # pylint: disable=pointless-string-statement,consider-using-enumerate,invalid-name
 """User facing API for specifying how to measure the generated code"""
+import concurrent.futures
 import enum
+import functools
 import multiprocessing
+import os
+import shutil
+import tempfile
+import threading
+import time
 from collections import namedtuple
 
 
@@ -260,6 +267,49 @@ def measure_option(builder, runner):
     return opt
 
 
+class MeasureUtilization(object):
+    """The utilization of the build slots and the devices during measurement.
+
+    Parameters
+    ----------
+    n_build_slots: int
+        The number of builds that run in parallel.
+    n_devices: int
+        The number of measurements that run in parallel.
+    """
+
+    def __init__(self, n_build_slots, n_devices):
+        self.n_build_slots = n_build_slots
+        self.n_devices = n_devices
+        self.start_time = time.time()
+        self.build_time = 0.0
+        self.run_time = 0.0
+        self._lock = threading.Lock()
+
+    def add(self, build_result, result):
+        """Account the time of a build and of the measurement of its program."""
+        if isinstance(build_result, MeasureResult):
+            build_time, run_time = build_result.all_cost, 0.0
+        else:
+            build_time = build_result.time_cost
+            run_time = max(result.all_cost - build_time, 0.0)
+        with self._lock:
+            self.build_time += build_time
+            self.run_time += run_time
+
+    @property
+    def build_slot_utilization(self):
+        """The fraction of time the build slots were busy."""
+        elapsed = max(time.time() - self.start_time, 1e-9)
+        return self.build_time / (self.n_build_slots * elapsed)
+
+    @property
+    def device_utilization(self):
+        """The fraction of time the devices were busy."""
+        elapsed = max(time.time() - self.start_time, 1e-9)
+        return self.run_time / (self.n_devices * elapsed)
+
+
 def create_measure_batch(task, option):
     """Get a standard measure_batch function.
 
@@ -274,7 +324,11 @@ def create_measure_batch(task, option):
     Returns
     -------
     measure_batch: callable
-        a callback function to measure a batch of configs
+        a callback function to measure a batch of configs.
+        If both the builder and the runner can start their work without waiting for it,
+        `measure_batch.submit` is a function that starts measuring a batch of configs and
+        returns the futures of their results. Each program is measured as soon as it is built.
+        `measure_batch.utilization` is the MeasureUtilization of the measurements.
     """
     builder = option["builder"]
     runner = option["runner"]
@@ -286,11 +340,66 @@ def create_measure_batch(task, option):
     build_kwargs = runner.get_build_kwargs()
     builder.set_task(task, build_kwargs)
 
+    utilization = MeasureUtilization(builder.n_parallel, runner.n_parallel)
+
     def measure_batch(measure_inputs):
         build_results = builder.build(measure_inputs)
         results = runner.run(measure_inputs, build_results)
+        for build_result, result in zip(build_results, results):
+            utilization.add(build_result, result)
         return results
 
+    def on_measured(build_result, future, run_future):
+        try:
+            result = run_future.result()
+            utilization.add(build_result, result)
+            # The program is no longer needed once it has been measured
+            if os.path.isfile(build_result.filename):
+                os.remove(build_result.filename)
+            future.set_result(result)
+        except Exception as ex:  # pylint: disable=broad-except
+            future.set_exception(ex)
+
+    def on_built(measure_input, future, build_future):
+        try:
+            build_result = build_future.result()
+            if isinstance(build_result, MeasureResult):
+                utilization.add(build_result, build_result)
+                future.set_result(build_result)
+                return
+            run_future = runner.submit(measure_input, build_result)
+            run_future.add_done_callback(functools.partial(on_measured, build_result, future))
+        except Exception as ex:  # pylint: disable=broad-except
+            future.set_exception(ex)
+
+    def submit(measure_inputs):
+        # The programs of each batch are exported to their own directory, removed
+        # once all of them are measured, including the ones that failed or timed out.
+        batch_dir = tempfile.mkdtemp(prefix="autotvm_batch_")
+        remaining = [len(measure_inputs)]
+        lock = threading.Lock()
+
+        def on_done(_):
+            with lock:
+                remaining[0] -= 1
+                if remaining[0] > 0:
+                    return
+            shutil.rmtree(batch_dir, ignore_errors=True)
+
+        if not measure_inputs:
+            shutil.rmtree(batch_dir, ignore_errors=True)
+        futures = []
+        build_futures = builder.submit(measure_inputs, batch_dir)
+        for measure_input, build_future in zip(measure_inputs, build_futures):
+            future = concurrent.futures.Future()
+            future.add_done_callback(on_done)
+            build_future.add_done_callback(functools.partial(on_built, measure_input, future))
+            futures.append(future)
+        return futures
+
     measure_batch.n_parallel = builder.n_parallel
     measure_batch.attach_objects = attach_objects
+    measure_batch.utilization = utilization
+    if hasattr(builder, "submit") and hasattr(runner, "submit"):
+        measure_batch.submit = submit
     return measure_batch
@@ -22,6 +22,7 @@ These functions are responsible for building the tvm module, uploading it to
 remote devices, recording the running time costs, and checking the correctness of the output.
 """
 
+import concurrent.futures
 import contextlib
 import logging
 import os
@@ -54,6 +55,20 @@ from .measure import Builder, MeasureErrorNo, MeasureResult, Runner
 logger = logging.getLogger("autotvm")
 
 
+def _then(future, func):
+    """Return a future of `func(future)`, which is called once `future` is done."""
+    ret = concurrent.futures.Future()
+
+    def _callback(done):
+        try:
+            ret.set_result(func(done))
+        except Exception as ex:  # pylint: disable=broad-except
+            ret.set_exception(ex)
+
+    future.add_done_callback(_callback)
+    return ret
+
+
 class BuildResult(namedtuple("BuildResult", ("filename", "arg_info", "error", "time_cost"))):
     """
     Stores all the necessary inputs for a measurement.
@@ -121,96 +136,126 @@ class LocalBuilder(Builder):
                 1,
             ), f"if do_fork=False, need n_parallel=None or 1; got {n_parallel}"
         self.executor = PopenPoolExecutor(
-            timeout=timeout, initializer=reset_global_scope, initargs=(AutotvmGlobalScope.current,)
+            max_workers=self.n_parallel,
+            timeout=timeout,
+            initializer=reset_global_scope,
+            initargs=(AutotvmGlobalScope.current,),
         )
         self.tmp_dir = tempfile.mkdtemp()
 
     def build(self, measure_inputs):
-        results = []
-
         shutil.rmtree(self.tmp_dir, ignore_errors=True)
         self.tmp_dir = tempfile.mkdtemp()
 
-        for i in range(0, len(measure_inputs), self.n_parallel):
-            futures = []
-            for inp in measure_inputs[i : i + self.n_parallel]:
-                ret = self.executor.submit(self.build_func, inp, self.tmp_dir, **self.build_kwargs)
-                futures.append(ret)
+        # The executor runs n_parallel builds at a time, and starts the next build as soon as
+        # a build slot is free, so a slow build does not hold up the other slots.
+        futures = [
+            self.executor.submit(self.build_func, inp, self.tmp_dir, **self.build_kwargs)
+            for inp in measure_inputs
+        ]
+        return [self._get_build_result(future) for future in futures]
 
-            for future in futures:
-                try:
-                    res = future.result()
-                    if res.error is not None:
-                        assert len(res.error) == 2, (
-                            f"BuildResult errors should be a 2-tuple, but it is a {len(res.error)}"
-                            "-tuple. This should not happen!"
-                        )
-                        tb, exception = res.error
-                        # instantiation error
-                        if isinstance(exception, InstantiationError):
-                            res = MeasureResult(
-                                (
-                                    tb,
-                                    exception,
-                                ),
-                                MeasureErrorNo.INSTANTIATION_ERROR,
-                                res.time_cost,
-                                time.time(),
-                            )
-
-                        else:
-                            if "InstantiationError" in str(exception):
-                                msg = str(exception)
-                                try:
-                                    msg = msg.split("\n")[-2].split(": ")[1]
-                                except Exception:  # pylint: disable=broad-except
-                                    pass
-                                res = MeasureResult(
-                                    (
-                                        tb,
-                                        InstantiationError(msg),
-                                    ),
-                                    MeasureErrorNo.INSTANTIATION_ERROR,
-                                    res.time_cost,
-                                    time.time(),
-                                )
-
-                            else:  # tvm error
-                                res = MeasureResult(
-                                    (
-                                        tb,
-                                        res.error,
-                                    ),
-                                    MeasureErrorNo.COMPILE_HOST,
-                                    res.time_cost,
-                                    time.time(),
-                                )
-                except TimeoutError as ex:
-                    tb = traceback.format_exc()
-                    res = MeasureResult(
-                        (
-                            tb,
-                            ex,
-                        ),
-                        MeasureErrorNo.BUILD_TIMEOUT,
-                        self.timeout,
-                        time.time(),
-                    )
-                except ChildProcessError as ex:
-                    tb = traceback.format_exc()
+    def submit(self, measure_inputs, tmp_dir=None):
+        """Start building programs without waiting for them to finish.
+
+        Parameters
+        ----------
+        measure_inputs: List of MeasureInput
+            The measure input
+
+        tmp_dir: Optional[str]
+            The directory to export the programs to. Unlike `build`, `submit` does not
+            clean up the programs of previous calls, which may still be measured, so the
+            caller should give each call its own directory and remove it once the
+            programs are measured. Defaults to the directory of the builder.
+
+        Returns
+        -------
+        futures: List of concurrent.futures.Future
+            The futures of the build results, which are the same as the ones of `build`.
+        """
+        tmp_dir = tmp_dir or self.tmp_dir
+        return [
+            _then(
+                self.executor.submit(self.build_func, inp, tmp_dir, **self.build_kwargs),
+                self._get_build_result,
+            )
+            for inp in measure_inputs
+        ]
+
+    def _get_build_result(self, future):
+        """Get the build result of a future, or the MeasureResult of its error."""
+        try:
+            res = future.result()
+            if res.error is not None:
+                assert len(res.error) == 2, (
+                    f"BuildResult errors should be a 2-tuple, but it is a {len(res.error)}"
+                    "-tuple. This should not happen!"
+                )
+                tb, exception = res.error
+                # instantiation error
+                if isinstance(exception, InstantiationError):
                     res = MeasureResult(
                         (
                             tb,
-                            ex,
+                            exception,
                         ),
-                        MeasureErrorNo.RUNTIME_DEVICE,
-                        self.timeout,
+                        MeasureErrorNo.INSTANTIATION_ERROR,
+                        res.time_cost,
                         time.time(),
                     )
 
-                results.append(res)
+                else:
+                    if "InstantiationError" in str(exception):
+                        msg = str(exception)
+                        try:
+                            msg = msg.split("\n")[-2].split(": ")[1]
+                        except Exception:  # pylint: disable=broad-except
+                            pass
+                        res = MeasureResult(
+                            (
+                                tb,
+                                InstantiationError(msg),
+                            ),
+                            MeasureErrorNo.INSTANTIATION_ERROR,
+                            res.time_cost,
+                            time.time(),
+                        )
+
+                    else:  # tvm error
+                        res = MeasureResult(
+                            (
+                                tb,
+                                res.error,
+                            ),
+                            MeasureErrorNo.COMPILE_HOST,
+                            res.time_cost,
+                            time.time(),
+                        )
+        except TimeoutError as ex:
+            tb = traceback.format_exc()
+            res = MeasureResult(
+                (
+                    tb,
+                    ex,
+                ),
+                MeasureErrorNo.BUILD_TIMEOUT,
+                self.timeout,
+                time.time(),
+            )
+        except ChildProcessError as ex:
+            tb = traceback.format_exc()
+            res = MeasureResult(
+                (
+                    tb,
+                    ex,
+                ),
+                MeasureErrorNo.RUNTIME_DEVICE,
+                self.timeout,
+                time.time(),
+            )
 
-        return results
+        return res
 
 
 class RPCRunner(Runner):
@@ -291,6 +336,7 @@ class RPCRunner(Runner):
         self.module_loader = module_loader
 
         self.executor = PopenPoolExecutor(
+            max_workers=self.n_parallel,
             timeout=timeout * (self.n_parallel + 1),
             initializer=reset_global_scope,
             initargs=(AutotvmGlobalScope.current,),
@@ -351,7 +397,28 @@ class RPCRunner(Runner):
         return kwargs
 
     def run(self, measure_inputs, build_results):
-        results = []
+        # The executor runs n_parallel measurements at a time
+        futures = [
+            self.submit(measure_inp, build_res)
+            for measure_inp, build_res in zip(measure_inputs, build_results)
+        ]
+        return [future.result() for future in futures]
+
+    def submit(self, measure_input, build_result):
+        """Start running a program without waiting for it to finish.
+
+        Parameters
+        ----------
+        measure_input: MeasureInput
+            The measure input
+        build_result: BuildResult
+            The build result of the measure input
+
+        Returns
+        -------
+        future: concurrent.futures.Future
+            The future of the MeasureResult.
+        """
         remote_kwargs = dict(
             device_key=self.key,
             host=self.host,
@@ -359,51 +426,39 @@ class RPCRunner(Runner):
             priority=self.priority,
             timeout=self.timeout,
         )
+        module_loader = (
+            self.module_loader if self.module_loader is not None else default_module_loader()
+        )
+        future = self.executor.submit(
+            run_through_rpc,
+            measure_input,
+            build_result,
+            self.number,
+            self.repeat,
+            self.min_repeat_ms,
+            self.cooldown_interval,
+            remote_kwargs,
+            self.ref_input,
+            self.enable_cpu_cache_flush,
+            module_loader,
+        )
+        return _then(future, self._get_run_result)
 
-        for i in range(0, len(measure_inputs), self.n_parallel):
-            futures = []
-            for measure_inp, build_res in zip(
-                measure_inputs[i : i + self.n_parallel], build_results[i : i + self.n_parallel]
-            ):
-                module_loader = (
-                    self.module_loader
-                    if self.module_loader is not None
-                    else default_module_loader()
-                )
-                ret = self.executor.submit(
-                    run_through_rpc,
-                    measure_inp,
-                    build_res,
-                    self.number,
-                    self.repeat,
-                    self.min_repeat_ms,
-                    self.cooldown_interval,
-                    remote_kwargs,
-                    self.ref_input,
-                    self.enable_cpu_cache_flush,
-                    module_loader,
-                )
-                futures.append(ret)
-
-            for future in futures:
-                try:
-                    res = future.result()
-                    results.append(res)
-                except Exception as ex:  # pylint: disable=broad-except
-                    tb = traceback.format_exc()
-                    results.append(
-                        MeasureResult(
-                            (
-                                tb,
-                                ex,
-                            ),
-                            MeasureErrorNo.RUN_TIMEOUT,
-                            self.timeout,
-                            time.time(),
-                        )
-                    )
-
-        return results
+    def _get_run_result(self, future):
+        """Get the MeasureResult of a future, or the MeasureResult of its error."""
+        try:
+            return future.result()
+        except Exception as ex:  # pylint: disable=broad-except
+            tb = traceback.format_exc()
+            return MeasureResult(
+                (
+                    tb,
+                    ex,
+                ),
+                MeasureErrorNo.RUN_TIMEOUT,
+                self.timeout,
+                time.time(),
+            )
 
 
 class LocalRunner(RPCRunner):
@@ -20,9 +20,12 @@
 
 import argparse
 import base64
+import functools
+import hashlib
 import logging
 import pickle
 import json
+import threading
 import time
 import os
 import itertools
@@ -38,6 +41,7 @@ from .task import ConfigEntity, ApplyHistoryBest
 from .measure import MeasureInput, MeasureResult
 
 AUTOTVM_LOG_VERSION = 0.2
+RECORD_INDEX_VERSION = 1
 _old_version_warning = True
 logger = logging.getLogger("autotvm")
 
@@ -73,6 +77,16 @@ def measure_str_key(inp, include_config=True):
     )
 
 
+@functools.lru_cache(maxsize=1024)
+def _parse_target(tgt):
+    """Parse a target string of a log row, caching the result since a log
+    usually contains very few distinct targets"""
+    if "-target" in tgt:
+        logger.warning('"-target" is deprecated, use "-mtriple" instead.')
+        tgt = tgt.replace("-target", "-mtriple")
+    return Target(tgt)
+
+
 def encode(inp, result, protocol="json"):
     """encode (MeasureInput, MeasureResult) pair to a string
 
@@ -150,11 +164,7 @@ def decode(row, protocol="json"):
             return None
 
         tgt, task_name, task_args, task_kwargs = row["input"]
-        tgt = str(tgt)
-        if "-target" in tgt:
-            logger.warning('"-target" is deprecated, use "-mtriple" instead.')
-            tgt = tgt.replace("-target", "-mtriple")
-        tgt = Target(str(tgt))
+        tgt = _parse_target(str(tgt))
 
         def clean_json_to_python(x):
             """1. Convert all list in x to tuple (hashable)
@@ -182,7 +192,7 @@ def decode(row, protocol="json"):
                 logger.warning("AutoTVM log version 0.1 is no longer supported.")
                 _old_version_warning = False
             return None
-        tgt = Target(items[0])
+        tgt = _parse_target(items[0])
         task_tuple = pickle.loads(base64.b64decode(items[1].encode()))
         config = pickle.loads(base64.b64decode(items[2].encode()))
         result = MeasureResult(*pickle.loads(base64.b64decode(items[3].encode())))
@@ -216,6 +226,134 @@ def load_from_file(filename):
                 yield ret
 
 
+def _index_row(best, row, offset):
+    """Update the best records of an index with a raw row of a log file"""
+    row = row.strip()
+    if not row or row.startswith(b"#"):
+        return
+    row = json.loads(row)
+    if "v" in row and row["v"] == 0.1:
+        return
+    tgt, task_name, task_args, _ = row["input"]
+    costs, error_no = row["result"][0], row["result"][1]
+    if error_no != 0:
+        return
+    cost = float(np.mean(costs))
+    tgt = _parse_target(str(tgt))
+    wkl = json.dumps([task_name, task_args])
+    keys = [("key", str(k), wkl) for k in tgt.keys]
+    if tgt.model != "unknown":
+        keys.append(("model", str(tgt.model), wkl))
+    for key in keys:
+        if key not in best or best[key][1] > cost:
+            best[key] = (offset, cost)
+
+
+def _tail_fingerprint(f, size):
+    """Hash the last bytes of the first `size` bytes of a file"""
+    start = max(0, size - 256)
+    f.seek(start)
+    return hashlib.sha1(f.read(size - start)).hexdigest()
+
+
+def load_index(filename, persist=True):
+    """Load the index of the best records of a log file.
+
+    The index maps each (target key, workload) and (target model, workload) pair
+    to the byte offset and the mean cost of its best record. It is stored in the
+    sidecar file `filename + ".idx"`. When records have been appended to the log
+    since the index was built, only the new rows are scanned; if the log has been
+    rewritten, the index is rebuilt from scratch.
+
+    Parameters
+    ----------
+    filename: str
+        The filename of the log file
+    persist: bool
+        Whether to write the updated index back to the sidecar file
+
+    Returns
+    -------
+    best: Dict[Tuple[str, str, str], Tuple[int, float]]
+        The offset and the cost of the best record for each
+        ("key" or "model", target key or model, workload) tuple.
+    """
+    index_file = filename + ".idx"
+    best, indexed_size = {}, 0
+    with open(filename, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+        try:
+            with open(index_file) as fin:
+                index = json.load(fin)
+            if (
+                index["version"] == RECORD_INDEX_VERSION
+                and index["size"] <= size
+                and index["fingerprint"] == _tail_fingerprint(f, index["size"])
+            ):
+                best = {tuple(x[:3]): (x[3], x[4]) for x in index["best"]}
+                indexed_size = index["size"]
+        except (OSError, ValueError, KeyError, TypeError, IndexError):
+            best, indexed_size = {}, 0
+        if indexed_size == size:
+            return best
+        # scan the rows appended since the index was built
+        f.seek(indexed_size)
+        offset = indexed_size
+        for row in f:
+            if not row.endswith(b"\n"):
+                # the last row is still being written
+                break
+            _index_row(best, row, offset)
+            offset += len(row)
+        fingerprint = _tail_fingerprint(f, offset)
+    if persist:
+        index = {
+            "version": RECORD_INDEX_VERSION,
+            "size": offset,
+            "fingerprint": fingerprint,
+            "best": [list(key) + list(value) for key, value in best.items()],
+        }
+        # the processes and threads indexing the same log each write their own temporary file
+        temp_file = "%s.%d.%d.tmp" % (index_file, os.getpid(), threading.get_ident())
+        try:
+            with open(temp_file, "w") as fout:
+                json.dump(index, fout)
+            os.replace(temp_file, index_file)
+        except OSError:
+            logger.debug("Cannot write the record index %s", index_file)
+            if os.path.exists(temp_file):
+                os.remove(temp_file)
+    return best
+
+
+def load_best_from_file(filename, persist_index=True):
+    """Generator: load the records that are the best of their workload from file.
+    Only the rows referred to by the index of the file are decoded.
+
+    Parameters
+    ----------
+    filename: str
+    persist_index: bool
+        Whether to write the updated index back to its sidecar file
+
+    Yields
+    ------
+    input: autotvm.measure.MeasureInput
+    result: autotvm.measure.MeasureResult
+    """
+    best = load_index(filename, persist=persist_index)
+    # keep the file order, so that the ties are broken as with load_from_file
+    offsets = sorted({offset for offset, _ in best.values()})
+    with open(filename, "rb") as f:
+        for offset in offsets:
+            f.seek(offset)
+            ret = decode(f.readline().decode())
+            if ret is None:
+                continue
+            yield ret
+
+
 def split_workload(in_file, clean=True):
     """Split a log file into separate files, each of which contains only a single workload
     This function can also delete duplicated records in log file
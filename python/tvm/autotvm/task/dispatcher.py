@@ -268,34 +268,34 @@ class ApplyHistoryBest(DispatchContext):
             Each row of this file is an encoded record pair. If it is a list
             it can either be a list of paths to logs that will be loaded jointly or
             an iterator of measurement results.
+
+        Note
+        ----
+        Log files are read through their index (see :any:`autotvm.record.load_index`),
+        so that only the rows that are the best of their workload are decoded.
         """
         # pylint: disable=import-outside-toplevel
         from pathlib import Path
-        from ..record import load_from_file
+        from ..record import load_best_from_file
 
-        joint_records = []
         if not isinstance(records, Iterable) or isinstance(records, str):
             records = [records]
 
-        for rec in records:
-            if isinstance(rec, Path):
-                rec = str(rec)
-
-            if isinstance(rec, str):
-                rec = load_from_file(rec)
-                joint_records += rec
-            else:
-                if rec is not None:
-                    joint_records.append(rec)
+        def _joint_records():
+            for rec in records:
+                if isinstance(rec, Path):
+                    rec = str(rec)
 
-        if not joint_records:
-            return
+                if isinstance(rec, str):
+                    yield from load_best_from_file(rec)
+                elif rec is not None:
+                    yield rec
 
         best_by_targetkey = self.best_by_targetkey
         best_by_model = self.best_by_model
 
         counter = 0
-        for inp, res in joint_records:
+        for inp, res in _joint_records():
             counter += 1
             if res.error_no != 0:
                 continue
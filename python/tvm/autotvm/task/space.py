@@ -666,6 +666,7 @@ class ConfigSpace(object):
         self._collect = True
         self._length = None
         self._entity_map = OrderedDict()  # name -> entity
+        self._feature_tables = None  # the flatten features of the entities of each knob
         self._constraints = []
         self.errors = []
         self.code_hash = None
@@ -861,6 +862,47 @@ class ConfigSpace(object):
         ret = ConfigEntity(index, self.code_hash, entities, self._constraints)
         return ret
 
+    def get_flatten_features(self, indexes):
+        """Get the flatten features of many configs at once, without creating their
+        config entities. The i-th row is the same as `get(indexes[i]).get_flatten_feature()`.
+
+        The indexes are decoded to knob positions as mixed-radix numbers with NumPy, and
+        the features of each knob are looked up in a table of the features of its entities.
+
+        Parameters
+        ----------
+        indexes: Array of int
+            indexes in the space
+
+        Returns
+        -------
+        feas: np.ndarray
+            two dimensional float32 array, one row per index
+        """
+        indexes = np.asarray(indexes, dtype=np.int64 if len(self) < 2**63 else object)
+        if indexes.size and (indexes.min() < 0 or indexes.max() >= len(self)):
+            raise IndexError("Index out of range: size {}".format(len(self)))
+        if indexes.dtype == object:
+            # The space is too large for int64 decoding
+            feas = [self.get(int(index)).get_flatten_feature() for index in indexes]
+            return np.array(feas, dtype=np.float32) if feas else np.empty((0, 0), np.float32)
+
+        tables = getattr(self, "_feature_tables", None)
+        if tables is None or len(tables) != len(self.space_map):
+            # The features of the entities of each knob, one row per entity
+            self._feature_tables = [
+                np.array([_flatten_entity(space[i]) for i in range(len(space))], dtype=np.float32)
+                for space in self.space_map.values()
+            ]
+        feas = []
+        t = indexes
+        for table in self._feature_tables:
+            feas.append(table[t % len(table)])
+            t = t // len(table)
+        if not feas:
+            return np.empty((len(indexes), 0), dtype=np.float32)
+        return np.concatenate(feas, axis=1)
+
     def __iter__(self):
         return self._entity_map.__iter__()
 
@@ -897,6 +939,26 @@ _ann_to_number = {
 }
 
 
+def _flatten_entity(entity):
+    """flatten a transform entity to a list of numbers"""
+    if isinstance(entity, SplitEntity):
+        return list(entity.size)
+    if isinstance(entity, ReorderEntity):
+        # use a naive way: directly copy the permutation
+        return list(entity.perm)
+    if isinstance(entity, AnnotateEntity):
+        # one-hot encoding
+        fea = []
+        for ann in entity.anns:
+            tmp = [0] * len(_ann_to_number)
+            tmp[_ann_to_number[ann]] = 1
+            fea.extend(tmp)
+        return fea
+    if isinstance(entity, OtherOptionEntity):
+        return [entity.val]
+    return []
+
+
 class ConfigEntity(ConfigSpace):
     """A configuration with detailed parameters
 
@@ -931,19 +993,7 @@ class ConfigEntity(ConfigSpace):
         """
         fea = []
         for _, v in self._entity_map.items():
-            if isinstance(v, SplitEntity):
-                fea.extend(v.size)
-            elif isinstance(v, ReorderEntity):
-                # use a naive way: directly copy the permutation
-                fea.extend(v.perm)
-            elif isinstance(v, AnnotateEntity):
-                # one-hot encoding
-                for ann in v.anns:
-                    tmp = [0] * len(_ann_to_number)
-                    tmp[_ann_to_number[ann]] = 1
-                    fea.extend(tmp)
-            elif isinstance(v, OtherOptionEntity):
-                fea.append(v.val)
+            fea.extend(_flatten_entity(v))
         return np.array(fea, dtype=np.float32)
 
     def get_other_option(self):
@@ -39,6 +39,9 @@ class GATuner(Tuner):
         probability of mutation of a knob in a gene
     """
 
+    # update credits the scores to the genes of the current generation by position
+    supports_pipeline = False
+
     def __init__(self, task, pop_size=100, elite_num=3, mutation_prob=0.1):
         super(GATuner, self).__init__(task)
 
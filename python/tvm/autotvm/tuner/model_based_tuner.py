@@ -27,14 +27,196 @@ from .tuner import Tuner
 from ..env import GLOBAL_SCOPE
 
 
+class ArrayFeatureCache(object):
+    """The features of the configs in a space, stored in the rows of one float32 matrix.
+
+    The matrix grows up to `max_bytes`. Then the rows are reused by the CLOCK approximation
+    of LRU: every hit sets the reference bit of a row, and the clock hand evicts the first
+    row whose bit is clear, clearing the bits of the rows it passes.
+    The configs whose feature extraction failed are kept as a set of indexes.
+
+    Parameters
+    ----------
+    max_bytes: int
+        The maximum size of the feature matrix in bytes.
+    """
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.feature_len = None
+        self.max_rows = None
+        self._matrix = None
+        self._row_index = None  # the config index of each row
+        self._ref = None  # the reference bit of each row
+        self._size = 0
+        self._hand = 0
+        self._rows = {}  # config index -> row
+        self._invalid = set()
+
+    def __len__(self):
+        return len(self._rows) + len(self._invalid)
+
+    def __contains__(self, index):
+        return index in self._rows or index in self._invalid
+
+    def __getitem__(self, index):
+        if index in self._invalid:
+            return None
+        row = self._rows[index]
+        self._ref[row] = 1
+        return self._matrix[row].copy()
+
+    def __setitem__(self, index, feature):
+        self.put([index], [feature])
+
+    def missing(self, indexes):
+        """Get the unique indexes whose features are not cached.
+
+        Parameters
+        ----------
+        indexes: Array of int
+            The indexes of configs
+
+        Returns
+        -------
+        missing: List of int
+        """
+        return [x for x in dict.fromkeys(indexes) if x not in self._rows and x not in self._invalid]
+
+    def put(self, indexes, features):
+        """Cache the features of configs.
+
+        Parameters
+        ----------
+        indexes: List of int
+            The indexes of configs. The configs that are already cached are skipped.
+        features: List of Optional[np.ndarray]
+            The features of the configs, or None if the feature extraction failed
+        """
+        new = {}  # the position of each uncached config
+        for i, index in enumerate(indexes):
+            if index not in self._rows and index not in self._invalid:
+                new[index] = i
+        valid = [i for i in new.values() if features[i] is not None]
+        self._invalid.update(indexes[i] for i in new.values() if features[i] is None)
+        if len(self._invalid) > (self.max_rows or self.max_bytes // 4):
+            # Failed configs are cheap to keep but not bounded by the matrix
+            self._invalid.clear()
+        if not valid:
+            return
+        if self.feature_len is None:
+            self._allocate(len(features[valid[0]]))
+        # The oldest features do not fit when more configs than rows are given
+        valid = valid[-self.max_rows :]
+
+        n_new = min(len(valid), self.max_rows - self._size)
+        victims = self._evict(len(valid) - n_new) if len(valid) > n_new else []
+        if self._size + n_new > len(self._matrix):
+            self._grow(self._size + n_new)
+        rows = np.concatenate([np.arange(self._size, self._size + n_new), victims])
+        rows = rows.astype(np.int64)
+        self._size += n_new
+
+        for row, i in zip(rows.tolist(), valid):
+            self._rows[indexes[i]] = row
+            self._matrix[row] = features[i]
+        self._row_index[rows] = [indexes[i] for i in valid]
+        self._ref[rows] = 1
+
+    def gather(self, indexes, new_features=None):
+        """Get the features of configs in one matrix, with zero rows for failed configs.
+
+        Parameters
+        ----------
+        indexes: List of int
+            The indexes of configs, which are cached or in `new_features`
+        new_features: Optional[Dict[int, Optional[np.ndarray]]]
+            The features of uncached configs, which are added to the cache after gathering,
+            so that a batch larger than the cache is still gathered completely
+
+        Returns
+        -------
+        features: np.ndarray
+            The float32 matrix of shape (len(indexes), feature_len)
+        """
+        new_features = new_features or {}
+        if self.feature_len is None:
+            feature = next((fea for fea in new_features.values() if fea is not None), None)
+            if feature is None:
+                return np.zeros((len(indexes), 0), dtype=np.float32)
+            self._allocate(len(feature))
+
+        rows = np.fromiter(
+            (self._rows.get(x, -1) for x in indexes), dtype=np.int64, count=len(indexes)
+        )
+        hit = rows >= 0
+        self._ref[rows[hit]] = 1
+        features = np.zeros((len(indexes), self.feature_len), dtype=np.float32)
+        features[hit] = self._matrix[rows[hit]]
+        if new_features:
+            for i in np.flatnonzero(~hit).tolist():
+                feature = new_features.get(indexes[i])
+                if feature is not None:
+                    features[i] = feature
+            self.put(list(new_features.keys()), list(new_features.values()))
+        return features
+
+    def _allocate(self, feature_len):
+        self.feature_len = feature_len
+        self.max_rows = max(1, self.max_bytes // (4 * feature_len))
+        capacity = min(self.max_rows, 1024)
+        self._matrix = np.empty((capacity, feature_len), dtype=np.float32)
+        self._row_index = np.empty(capacity, dtype=np.int64)
+        self._ref = np.zeros(capacity, dtype=np.uint8)
+
+    def _grow(self, min_capacity):
+        capacity = min(self.max_rows, max(min_capacity, 2 * len(self._matrix)))
+        matrix = np.empty((capacity, self.feature_len), dtype=np.float32)
+        matrix[: self._size] = self._matrix[: self._size]
+        self._matrix = matrix
+        self._row_index = np.resize(self._row_index, capacity)
+        self._ref = np.resize(self._ref, capacity)
+
+    def _evict(self, n):
+        """Evict `n` rows by the clock, and return them"""
+        order = (np.arange(self._size) + self._hand) % self._size
+        ref = self._ref[order]
+        cold = np.flatnonzero(ref == 0)
+        if len(cold) >= n:
+            last = cold[n - 1]
+            victims = order[cold[:n]]
+            self._ref[order[: last + 1]] = 0
+        else:
+            # The hand goes around once, clearing all bits, and evicts the hot rows after
+            hot = np.flatnonzero(ref != 0)
+            last = hot[n - len(cold) - 1]
+            victims = np.concatenate([order[cold], order[hot[: n - len(cold)]]])
+            self._ref[:] = 0
+        self._hand = int((self._hand + last + 1) % self._size)
+        for row, index in zip(victims.tolist(), self._row_index[victims].tolist()):
+            if self._rows.get(index) == row:
+                del self._rows[index]
+        return victims
+
+
 class FeatureCache(object):
-    """Feature cache manager for cache sharing between different cost models"""
+    """Feature cache manager for cache sharing between different cost models
 
-    def __init__(self):
+    The features of a feature type are kept in an ArrayFeatureCache.
+    A FeatureCache can be shared by the cost models of the tuners of the same task.
+
+    Parameters
+    ----------
+    max_bytes: int
+        The maximum size of the features of a feature type in bytes.
+    """
+
+    def __init__(self, max_bytes=512 * 1024 * 1024):
+        self.max_bytes = max_bytes
         self.feature_cache = {}
 
     def get(self, key):
-        """Get feature cache dictionary for a key
+        """Get feature cache for a key
 
         Parameters
         ----------
@@ -43,16 +225,16 @@ class FeatureCache(object):
 
         Returns
         -------
-        fea_cache: dict
-            cache dictionary
+        fea_cache: ArrayFeatureCache
+            The feature cache
         """
         if key not in self.feature_cache:
-            self.feature_cache[key] = {}
+            self.feature_cache[key] = ArrayFeatureCache(self.max_bytes)
 
         return self.feature_cache[key]
 
     def size(self, key):
-        """ " Get the size of a feature cache dictionary
+        """ " Get the size of a feature cache
 
         Parameters
         ----------
@@ -74,7 +256,7 @@ class FeatureCache(object):
             The key of a feature type
         """
         del self.feature_cache[key]
-        self.feature_cache[key] = {}
+        self.feature_cache[key] = ArrayFeatureCache(self.max_bytes)
         gc.collect()
 
 
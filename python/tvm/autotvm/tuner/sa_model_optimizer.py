@@ -47,6 +47,10 @@ class SimulatedAnnealingOptimizer(ModelOptimizer):
         Stop iteration if the optimal set do not change in `early_stop` rounds
     log_interval: int, optional
         Print log every `log_interval` iterations
+    vectorized: bool, optional
+        Whether to mutate all the points and maintain the top-k set with batched numpy
+        operations. Falls back to the per-point implementation if the config space
+        does not fit in int64.
     """
 
     def __init__(
@@ -58,11 +62,13 @@ class SimulatedAnnealingOptimizer(ModelOptimizer):
         parallel_size=128,
         early_stop=50,
         log_interval=50,
+        vectorized=True,
     ):
         super(SimulatedAnnealingOptimizer, self).__init__()
 
         self.task = task
         self.dims = [len(x) for x in self.task.config_space.space_map.values()]
+        self.vectorized = vectorized and len(self.task.config_space) <= np.iinfo(np.int64).max
 
         self.n_iter = n_iter
         self.temp = temp
@@ -73,6 +79,95 @@ class SimulatedAnnealingOptimizer(ModelOptimizer):
         self.points = None
 
     def find_maximums(self, model, num, exclusive):
+        if self.vectorized:
+            return self._find_maximums_vectorized(model, num, exclusive)
+        return self._find_maximums_scalar(model, num, exclusive)
+
+    def _find_maximums_vectorized(self, model, num, exclusive):
+        tic = time.time()
+        temp, n_iter, early_stop, log_interval = (
+            self.temp,
+            self.n_iter,
+            self.early_stop,
+            self.log_interval,
+        )
+
+        if self.persistent and self.points is not None:
+            points = self.points
+        else:
+            points = np.array(
+                sample_ints(0, len(self.task.config_space), self.parallel_size), dtype=np.int64
+            )
+
+        scores = model.predict(points)
+
+        # the top-k set, initialized with placeholder points that never collide with real ones
+        top_points = -1 - np.arange(num, dtype=np.int64)
+        top_scores = np.full(num, float("-inf"))
+        exclusive = np.unique(np.fromiter(exclusive, dtype=np.int64, count=len(exclusive)))
+        top_points, top_scores, _ = _merge_top_k(top_points, top_scores, points, scores, exclusive)
+
+        k = 0
+        k_last_modify = 0
+
+        if isinstance(temp, (tuple, list, np.ndarray)):
+            t = temp[0]
+            cool = 1.0 * (temp[0] - temp[1]) / (n_iter + 1)
+        else:
+            t = temp
+            cool = 0
+
+        dims = np.array(self.dims, dtype=np.int64)
+        strides = np.concatenate([[1], np.cumprod(dims[:-1])]).astype(np.int64)
+
+        while k < n_iter and k < k_last_modify + early_stop:
+            new_points = random_walk_batch(points, dims, strides)
+
+            new_scores = model.predict(new_points)
+
+            ac_prob = np.exp(np.minimum((new_scores - scores) / (t + 1e-5), 1))
+            ac_index = np.random.random(len(ac_prob)) < ac_prob
+
+            points[ac_index] = new_points[ac_index]
+            scores[ac_index] = new_scores[ac_index]
+
+            top_points, top_scores, modified = _merge_top_k(
+                top_points, top_scores, new_points, new_scores, exclusive
+            )
+            if modified:
+                k_last_modify = k
+
+            k += 1
+            t -= cool
+
+            if log_interval and k % log_interval == 0:
+                t_str = "%.2f" % t
+                logger.debug(
+                    "SA iter: %d\tlast_update: %d\tmax-0: %.2f\tmax-1: %.2f\ttemp: %s\t"
+                    "elapsed: %.2f",
+                    k,
+                    k_last_modify,
+                    np.min(top_scores),
+                    np.max(top_scores),
+                    t_str,
+                    time.time() - tic,
+                )
+
+        order = np.argsort(-top_scores, kind="stable")
+        top_points, top_scores = top_points[order], top_scores[order]
+        valid = top_scores >= 0
+        top_points, top_scores = top_points[valid], top_scores[valid]
+        logger.debug(
+            "SA iter: %d\tlast_update: %d\telapsed: %.2f", k, k_last_modify, time.time() - tic
+        )
+        logger.debug("SA Maximums: %s", list(zip(top_scores, top_points)))
+
+        if self.persistent:
+            self.points = points
+
+        return [int(x) for x in top_points]
+
+    def _find_maximums_scalar(self, model, num, exclusive):
         tic = time.time()
         temp, n_iter, early_stop, log_interval = (
             self.temp,
@@ -159,6 +254,81 @@ class SimulatedAnnealingOptimizer(ModelOptimizer):
         return [x[1] for x in heap_items]
 
 
+def _merge_top_k(top_points, top_scores, points, scores, exclusive):
+    """Merge a batch of scored points into the top-k set
+
+    Parameters
+    ----------
+    top_points: np.ndarray
+        The points in the current top-k set
+    top_scores: np.ndarray
+        The scores of the points in the current top-k set
+    points: np.ndarray
+        The batch of points to be merged
+    scores: np.ndarray
+        The scores of the batch of points
+    exclusive: np.ndarray
+        The sorted points that are never admitted into the top-k set
+
+    Returns
+    -------
+    top_points: np.ndarray
+        The points in the new top-k set
+    top_scores: np.ndarray
+        The scores of the points in the new top-k set
+    modified: bool
+        Whether any point of the batch entered the top-k set
+    """
+    # only the points better than the current minimum can enter the set
+    mask = scores > np.min(top_scores)
+    if not mask.any():
+        return top_points, top_scores, False
+    points, index = np.unique(points[mask], return_index=True)
+    scores = scores[mask][index]
+    keep = ~np.isin(points, top_points)
+    if len(exclusive) > 0:
+        keep &= ~np.isin(points, exclusive, assume_unique=True)
+    if not keep.any():
+        return top_points, top_scores, False
+    num = len(top_points)
+    # the incumbents come first, so that they win the ties as in a heap with strict comparison
+    all_points = np.concatenate([top_points, points[keep]])
+    all_scores = np.concatenate([top_scores, scores[keep]])
+    order = np.argsort(-all_scores, kind="stable")[:num]
+    return all_points[order], all_scores[order], bool((order >= num).any())
+
+
+def random_walk_batch(points, dims, strides):
+    """random walk as local transition of a batch of points
+
+    Each point moves to a different neighbor by changing the value of one of its knobs.
+
+    Parameters
+    ----------
+    points: np.ndarray
+        int64 indexes of the ConfigEntity
+    dims: np.ndarray
+        sizes of each dimension
+    strides: np.ndarray
+        the mixed-radix place value of each dimension, i.e. the product of the previous sizes
+
+    Returns
+    -------
+    new_points: np.ndarray
+        new neighborhood indexes
+    """
+    new_points = points.copy()
+    todo = np.arange(len(points))
+    while len(todo) > 0:
+        from_i = np.random.randint(len(dims), size=len(todo))
+        to_v = (np.random.random(len(todo)) * dims[from_i]).astype(np.int64)
+        old_v = (points[todo] // strides[from_i]) % dims[from_i]
+        new_points[todo] = points[todo] + (to_v - old_v) * strides[from_i]
+        # mutate again the points that stay unchanged
+        todo = todo[to_v == old_v]
+    return new_points
+
+
 def random_walk(p, dims):
     """random walk as local transition
 
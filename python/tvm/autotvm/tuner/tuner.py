@@ -16,6 +16,8 @@
 # under the License.
 # pylint: disable=unused-argument, no-self-use, invalid-name
 """Base class of tuner"""
+import collections
+import concurrent.futures
 import logging
 import tempfile
 
@@ -38,6 +40,10 @@ class Tuner(object):
         Tuning Task
     """
 
+    # Whether next_batch can be called again before update received the previous batch,
+    # which is required to tune with pipeline=True
+    supports_pipeline = True
+
     def __init__(self, task, **kwargs):
         self.param = kwargs
         self.recorder = None
@@ -56,6 +62,9 @@ class Tuner(object):
         self.n_trial = None
         self.early_stopping = None
 
+        # the utilization of the build slots and the devices in the last tuning
+        self.measure_utilization = None
+
     def has_next(self):
         """Whether has next untried config in the space
 
@@ -90,7 +99,15 @@ class Tuner(object):
             result for measurement
         """
 
-    def tune(self, n_trial, measure_option, early_stopping=None, callbacks=(), si_prefix="G"):
+    def tune(
+        self,
+        n_trial,
+        measure_option,
+        early_stopping=None,
+        callbacks=(),
+        si_prefix="G",
+        pipeline=False,
+    ):
         """Begin tuning
 
         Parameters
@@ -109,9 +126,20 @@ class Tuner(object):
             every measurement pair. See autotvm/tuner/callback.py for some examples.
         si_prefix: str
             One of tvm.autotvm.utils.SI_PREFIXES. The SI prefix to use when reporting FLOPS.
+        pipeline: bool
+            If True, the next batch of configs is proposed and starts building while the
+            previous batch is still being measured, and each program is measured as soon as
+            it is built, so that the builders and the devices are not idle waiting for each
+            other. The tuner is then updated with a batch while the next one is in flight.
+            Falls back to measuring batch by batch if the builder or the runner can not
+            start their work without waiting for it, or if the tuner does not support it.
         """
         measure_batch = create_measure_batch(self.task, measure_option)
         n_parallel = getattr(measure_batch, "n_parallel", 1)
+        pipeline = pipeline and self.supports_pipeline and hasattr(measure_batch, "submit")
+        # Deque[Tuple[List[MeasureInput], List[Future[MeasureResult]]]]
+        in_flight = collections.deque()
+        n_submitted = 0
         early_stopping = early_stopping or 1e9
         self.n_trial = n_trial
         self.early_stopping = early_stopping
@@ -125,13 +153,27 @@ class Tuner(object):
         i = error_ct = 0
         errors = []
         while i < n_trial:
-            if not self.has_next():
-                break
+            if pipeline:
+                # Keep the batch being processed and the next batch in flight
+                while len(in_flight) < 2 and n_submitted < n_trial and self.has_next():
+                    configs = self.next_batch(min(n_parallel, n_trial - n_submitted))
+                    if not configs:
+                        break
+                    inputs = [MeasureInput(self.task.target, self.task, c) for c in configs]
+                    in_flight.append((inputs, measure_batch.submit(inputs)))
+                    n_submitted += len(inputs)
+                if not in_flight:
+                    break
+                inputs, futures = in_flight.popleft()
+                results = [future.result() for future in futures]
+            else:
+                if not self.has_next():
+                    break
 
-            configs = self.next_batch(min(n_parallel, n_trial - i))
+                configs = self.next_batch(min(n_parallel, n_trial - i))
 
-            inputs = [MeasureInput(self.task.target, self.task, config) for config in configs]
-            results = measure_batch(inputs)
+                inputs = [MeasureInput(self.task.target, self.task, config) for config in configs]
+                results = measure_batch(inputs)
 
             # keep best config
             for k, (inp, res) in enumerate(zip(inputs, results)):
@@ -194,6 +236,18 @@ class Tuner(object):
                 self.task,
                 f,
             )
+        # Do not leave measurements running when the tuning stops early
+        for _, futures in in_flight:
+            concurrent.futures.wait(futures)
+
+        utilization = getattr(measure_batch, "utilization", None)
+        if utilization is not None:
+            logger.info(
+                "Build slot utilization: %.1f%%, device utilization: %.1f%%",
+                utilization.build_slot_utilization * 100,
+                utilization.device_utilization * 100,
+            )
+        self.measure_utilization = utilization
         GLOBAL_SCOPE.in_tuning = False
         del measure_batch
 
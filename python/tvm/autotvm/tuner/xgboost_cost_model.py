@@ -68,10 +68,20 @@ class XGBoostCostModel(CostModel):
         If is not none, the cost model will print training log every `log_interval` iterations.
     upper_model: XGBoostCostModel, optional
         The upper model used in transfer learning
+    feature_cache: FeatureCache, optional
+        The feature cache to use, which can be shared with the cost models of other tuners
+        of the same task. By default, a new one is created.
     """
 
     def __init__(
-        self, task, feature_type, loss_type, num_threads=None, log_interval=25, upper_model=None
+        self,
+        task,
+        feature_type,
+        loss_type,
+        num_threads=None,
+        log_interval=25,
+        upper_model=None,
+        feature_cache=None,
     ):
         global xgb
         super(XGBoostCostModel, self).__init__()
@@ -135,6 +145,8 @@ class XGBoostCostModel(CostModel):
 
         if upper_model:  # share a same feature cache with upper model
             self.feature_cache = upper_model.feature_cache
+        elif feature_cache is not None:
+            self.feature_cache = feature_cache
         else:
             self.feature_cache = FeatureCache()
         self.upper_model = upper_model
@@ -314,32 +326,22 @@ class XGBoostCostModel(CostModel):
 
     def _get_feature(self, indexes):
         """get features for indexes, run extraction if we do not have cache for them"""
-        # free feature cache
-        if self.feature_cache.size(self.fea_type) >= 100000:
-            self.feature_cache.clear(self.fea_type)
+        if self.fea_type == "knob":
+            # knob features only depend on the indexes, decode them in-process in one batch
+            return self.space.get_flatten_features(indexes)
 
         fea_cache = self.feature_cache.get(self.fea_type)
 
-        indexes = np.array(indexes)
-        need_extract = [x for x in indexes if x not in fea_cache]
+        indexes = np.array(indexes).tolist()
+        need_extract = fea_cache.missing(indexes)
 
         if need_extract:
             pool = self._get_pool()
             feas = pool.map_with_error_catching(self.feature_extract_func, need_extract)
-            for i, fea in zip(need_extract, feas):
-                fea_cache[i] = fea.value if fea.status == StatusKind.COMPLETE else None
+            feas = [fea.value if fea.status == StatusKind.COMPLETE else None for fea in feas]
+            return fea_cache.gather(indexes, dict(zip(need_extract, feas)))
 
-        feature_len = None
-        for idx in indexes:
-            if fea_cache[idx] is not None:
-                feature_len = fea_cache[idx].shape[-1]
-                break
-
-        ret = np.empty((len(indexes), feature_len), dtype=np.float32)
-        for i, ii in enumerate(indexes):
-            t = fea_cache[ii]
-            ret[i, :] = t if t is not None else 0
-        return ret
+        return fea_cache.gather(indexes)
 
     def __del__(self):
         self._close_pool()
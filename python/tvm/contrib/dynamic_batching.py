@@ -0,0 +1,289 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Dynamic batching of single inference requests for compiled relay models."""
+import bisect
+import collections
+import threading
+import time
+from concurrent.futures import Future
+
+import numpy as np
+
+from tvm import runtime
+from tvm.runtime import vm as _vm
+from tvm.contrib import graph_executor
+
+
+def _to_numpy_list(result):
+    """Flatten the result of a VM function to a list of numpy arrays"""
+    if isinstance(result, runtime.NDArray):
+        return [result.numpy()]
+    outputs = []
+    for field in result:
+        outputs.extend(_to_numpy_list(field))
+    return outputs
+
+
+class _GraphRunner(object):
+    """Run a batch with a graph executor"""
+
+    def __init__(self, lib, device):
+        self.module = graph_executor.GraphModule(lib["default"](device))
+        self.output_shapes = [
+            tuple(self.module.get_output(i).shape) for i in range(self.module.get_num_outputs())
+        ]
+
+    def __call__(self, inputs):
+        self.module.run(**inputs)
+        return [self.module.get_output(i).numpy() for i in range(self.module.get_num_outputs())]
+
+
+class _VMRunner(object):
+    """Run a batch with the main function of a virtual machine"""
+
+    def __init__(self, virtual_machine):
+        self.virtual_machine = virtual_machine
+
+    def __call__(self, inputs):
+        return _to_numpy_list(self.virtual_machine.invoke("main", **inputs))
+
+
+class _Request(object):
+    __slots__ = ["inputs", "batch_size", "future", "arrival"]
+
+    def __init__(self, inputs, batch_size):
+        self.inputs = inputs
+        self.batch_size = batch_size
+        self.future = Future()
+        self.arrival = time.perf_counter()
+
+
+class DynamicBatcher(object):
+    """Serve inference requests by running them together in batches of precompiled sizes.
+
+    Requests are queued and grouped until either the largest batch fits or the oldest
+    request waited `max_latency_ms`. Their inputs are concatenated along the batch axis,
+    padded with zeros to the smallest compiled batch size that fits, run once, and the
+    outputs are split back to the requests.
+
+    Parameters
+    ----------
+    models : Union[dict of int to GraphExecutorFactoryModule, VirtualMachine]
+        The models compiled for each batch size, e.g. ``{1: lib1, 4: lib4, 16: lib16}``.
+        The values can also be graph executor factory modules loaded from exported
+        libraries, or VirtualMachines. A single VirtualMachine with a dynamic batch
+        dimension runs any batch size up to `max_batch_size` without padding.
+
+    max_batch_size : int, optional
+        The largest batch to run. Defaults to the largest compiled batch size.
+
+    max_latency_ms : float
+        How long the oldest queued request may wait for more requests to batch with.
+
+    device : Device
+        The device of graph executors, CPU by default.
+
+    batch_axis : int
+        The batch axis of all the inputs and outputs.
+    """
+
+    def __init__(self, models, max_batch_size=None, max_latency_ms=5.0, device=None, batch_axis=0):
+        device = device if device is not None else runtime.cpu(0)
+        if isinstance(models, _vm.VirtualMachine):
+            if max_batch_size is None:
+                raise ValueError("max_batch_size is required for a dynamic batch VirtualMachine")
+            self._batch_sizes = None
+            self._runners = {None: _VMRunner(models)}
+        else:
+            self._batch_sizes = sorted(models)
+            self._runners = {
+                size: _VMRunner(model)
+                if isinstance(model, _vm.VirtualMachine)
+                else _GraphRunner(model, device)
+                for size, model in models.items()
+            }
+            for size, runner in self._runners.items():
+                for shape in getattr(runner, "output_shapes", []):
+                    if len(shape) <= batch_axis or shape[batch_axis] != size:
+                        raise ValueError(
+                            "Output of shape %s of the model of batch size %d does not have "
+                            "the batch on axis %d" % (shape, size, batch_axis)
+                        )
+            if max_batch_size is None:
+                max_batch_size = self._batch_sizes[-1]
+            max_batch_size = min(max_batch_size, self._batch_sizes[-1])
+        self.max_batch_size = max_batch_size
+        self.max_latency = max_latency_ms / 1000.0
+        self.batch_axis = batch_axis
+
+        self._queue = collections.deque()
+        self._cond = threading.Condition()
+        self._stopped = False
+        # counters
+        self.num_requests = 0
+        self.num_batches = 0
+        self.num_rows = 0
+        self.num_padded_rows = 0
+        self.latencies = collections.deque(maxlen=10000)
+        self._start_time = time.perf_counter()
+        self._worker = threading.Thread(target=self._serve, daemon=True)
+        self._worker.start()
+
+    def submit(self, inputs):
+        """Submit an inference request. Thread-safe.
+
+        Parameters
+        ----------
+        inputs : dict of str to numpy.ndarray
+            The inputs of the request, with the request's batch along the batch axis.
+
+        Returns
+        -------
+        future : concurrent.futures.Future
+            A future of the list of outputs of the request, as numpy arrays.
+        """
+        inputs = {name: np.asarray(value) for name, value in inputs.items()}
+        batch_sizes = {value.shape[self.batch_axis] for value in inputs.values()}
+        if len(batch_sizes) != 1:
+            raise ValueError("All the inputs of a request must have the same batch size")
+        batch_size = batch_sizes.pop()
+        if batch_size > self.max_batch_size:
+            raise ValueError(
+                "Request batch size %d exceeds the maximum batch size %d"
+                % (batch_size, self.max_batch_size)
+            )
+        request = _Request(inputs, batch_size)
+        with self._cond:
+            if self._stopped:
+                raise RuntimeError("Cannot submit to a stopped batcher")
+            self._queue.append(request)
+            self._cond.notify()
+        return request.future
+
+    def _next_batch(self):
+        """Wait for and pop the requests of the next batch, or None when stopped"""
+        with self._cond:
+            while not self._queue:
+                if self._stopped:
+                    return None
+                self._cond.wait()
+            deadline = self._queue[0].arrival + self.max_latency
+            while not self._stopped:
+                rows = sum(request.batch_size for request in self._queue)
+                remaining = deadline - time.perf_counter()
+                if rows >= self.max_batch_size or remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+            batch, rows = [], 0
+            while self._queue and rows + self._queue[0].batch_size <= self.max_batch_size:
+                request = self._queue.popleft()
+                rows += request.batch_size
+                batch.append(request)
+            return batch
+
+    def _serve(self):
+        while True:
+            batch = self._next_batch()
+            if batch is None:
+                return
+            batch = [request for request in batch if request.future.set_running_or_notify_cancel()]
+            if batch:
+                self._run_batch(batch)
+
+    def _run_batch(self, batch):
+        rows = sum(request.batch_size for request in batch)
+        if self._batch_sizes is None:
+            size = None
+            padded = rows
+        else:
+            size = self._batch_sizes[bisect.bisect_left(self._batch_sizes, rows)]
+            padded = size
+        try:
+            inputs = {}
+            for name in batch[0].inputs:
+                parts = [request.inputs[name] for request in batch]
+                if padded > rows:
+                    pad_shape = list(parts[0].shape)
+                    pad_shape[self.batch_axis] = padded - rows
+                    parts.append(np.zeros(pad_shape, parts[0].dtype))
+                inputs[name] = np.concatenate(parts, axis=self.batch_axis)
+            outputs = self._runners[size](inputs)
+            for output in outputs:
+                if output.ndim <= self.batch_axis or output.shape[self.batch_axis] != padded:
+                    raise ValueError(
+                        "Output of shape %s does not have the batch size %d on axis %d"
+                        % (output.shape, padded, self.batch_axis)
+                    )
+            # the last split is the padding
+            offsets = np.cumsum([request.batch_size for request in batch])
+            splits = [np.split(output, offsets, axis=self.batch_axis) for output in outputs]
+        except Exception as err:  # pylint: disable=broad-except
+            for request in batch:
+                request.future.set_exception(err)
+            return
+
+        # update the counters first, the callers may read them once their futures are done
+        now = time.perf_counter()
+        self.latencies.extend(now - request.arrival for request in batch)
+        self.num_requests += len(batch)
+        self.num_batches += 1
+        self.num_rows += rows
+        self.num_padded_rows += padded - rows
+        for i, request in enumerate(batch):
+            request.future.set_result([split[i] for split in splits])
+
+    def stats(self):
+        """Get the latency and throughput counters.
+
+        Returns
+        -------
+        stats : dict
+            The number of requests and batches, the mean batch size, the ratio of
+            padding rows, the p50/p99 latency in milliseconds over the last requests,
+            and the served requests per second.
+        """
+        latencies = np.array(self.latencies) * 1000.0
+        elapsed = time.perf_counter() - self._start_time
+        return {
+            "num_requests": self.num_requests,
+            "num_batches": self.num_batches,
+            "mean_batch_size": self.num_rows / max(self.num_batches, 1),
+            "padding_ratio": self.num_padded_rows / max(self.num_rows + self.num_padded_rows, 1),
+            "p50_latency_ms": float(np.percentile(latencies, 50)) if latencies.size else 0.0,
+            "p99_latency_ms": float(np.percentile(latencies, 99)) if latencies.size else 0.0,
+            "requests_per_second": self.num_requests / elapsed,
+        }
+
+    def shutdown(self, wait=True):
+        """Stop the batcher once the queued requests are served.
+
+        Parameters
+        ----------
+        wait : bool
+            Whether to wait for the queued requests to be served.
+        """
+        with self._cond:
+            self._stopped = True
+            self._cond.notify()
+        if wait:
+            self._worker.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.shutdown()
@@ -22,6 +22,7 @@ from tvm.rpc import _ffi_api as _rpc_ffi_api
 from tvm.rpc import base as rpc_base
 from tvm._ffi.base import string_types
 from tvm._ffi.runtime_ctypes import Device
+from tvm.runtime import ndarray as _nd
 
 
 def create(graph_json_str, libmod, device):
@@ -111,6 +112,54 @@ def get_device(libmod, device):
     return device, num_rpc_dev, device_type_id
 
 
+# The data alignment the graph executor requires of external buffers.
+_ZERO_COPY_ALIGNMENT = 64
+
+
+def _as_zero_copy_array(value, internal):
+    """Get an NDArray sharing the memory of value that the graph executor can bind
+    in place of internal, or None when it is not compatible."""
+    if isinstance(value, np.ndarray):
+        if internal.device.device_type != Device.STR2MASK["cpu"] or not value.flags.writeable:
+            return None
+        try:
+            if value.dtype != np.dtype(internal.dtype):
+                return None
+        except TypeError:
+            return None
+        if (
+            value.shape != internal.shape
+            or not value.flags["C_CONTIGUOUS"]
+            or value.ctypes.data % _ZERO_COPY_ALIGNMENT != 0
+            or not hasattr(value, "__dlpack__")
+        ):
+            return None
+        return _nd.from_dlpack(value)
+    if isinstance(value, _nd.NDArray):
+        contents = value.handle.contents
+        if (
+            value.device != internal.device
+            or value.dtype != internal.dtype
+            or value.shape != internal.shape
+            or ((contents.data or 0) + contents.byte_offset) % _ZERO_COPY_ALIGNMENT != 0
+        ):
+            return None
+        return value
+    return None
+
+
+def _copy_into(src, out):
+    """Copy an NDArray into an NDArray or a numpy array"""
+    if isinstance(out, np.ndarray):
+        try:
+            out[...] = src.numpy(zero_copy=True)
+        except ValueError:
+            out[...] = src.numpy()
+    else:
+        src.copyto(out)
+    return out
+
+
 class GraphModule(object):
     """Wrapper runtime module.
 
@@ -162,6 +211,9 @@ class GraphModule(object):
         self._get_num_inputs = module["get_num_inputs"]
         self._load_params = module["load_params"]
         self._share_params = module["share_params"]
+        # input/output index -> caller-owned array bound without copy
+        self._zero_copy_inputs = {}
+        self._zero_copy_outputs = {}
 
     def set_input(self, key=None, value=None, **params):
         """Set inputs to the module via kwargs
@@ -181,6 +233,8 @@ class GraphModule(object):
             v = self._get_input(key)
             if v is None:
                 raise RuntimeError("Could not find '%s' in graph's inputs" % key)
+            if self._zero_copy_inputs:
+                self._unbind_input(self._input_index(key), v)
             v.copyfrom(value)
 
         if params:
@@ -193,7 +247,55 @@ class GraphModule(object):
                 # params from set_input
                 val = self._get_input(k)
                 if val:
-                    self._get_input(k).copyfrom(params[k])
+                    if self._zero_copy_inputs:
+                        self._unbind_input(self._input_index(k), val)
+                    val.copyfrom(params[k])
+
+    def set_input_zero_copy(self, key=None, value=None, **params):
+        """Set inputs to the module, binding them to the graph without copy when possible.
+
+        NumPy arrays and NDArrays that have the device, shape and dtype of the input,
+        are contiguous and 64-byte aligned are read in place by the graph. They must not
+        be modified while the graph runs and stay bound until the input is set again.
+        Other values are copied as in `set_input`.
+
+        Parameters
+        ----------
+        key : int or str
+           The input key
+
+        value : the input value.
+           The input key
+
+        params : dict of str to NDArray or numpy.ndarray
+           Additional arguments
+        """
+        if key is not None:
+            v = self._get_input(key)
+            if v is None:
+                raise RuntimeError("Could not find '%s' in graph's inputs" % key)
+            self._bind_input(self._input_index(key), v, value)
+        for k, v in params.items():
+            val = self._get_input(k)
+            if val:
+                self._bind_input(self._input_index(k), val, v)
+
+    def _input_index(self, key):
+        return key if isinstance(key, int) else self._get_input_index(key)
+
+    def _bind_input(self, index, internal, value):
+        arr = _as_zero_copy_array(value, internal)
+        if arr is None:
+            self._unbind_input(index, internal)
+            internal.copyfrom(value)
+            return
+        self.module["set_input_zero_copy"](index, arr)
+        self._zero_copy_inputs[index] = arr
+
+    def _unbind_input(self, index, internal):
+        """Point the graph back to its own storage of a zero-copy input"""
+        if self._zero_copy_inputs.pop(index, None) is not None:
+            self.module["set_input_zero_copy"](index, internal)
 
     def run(self, **input_dict):
         """Run forward execution of the graph
@@ -293,15 +395,51 @@ class GraphModule(object):
         index : int
             The output index
 
-        out : NDArray
+        out : NDArray or numpy.ndarray
             The output array container
+
+        Returns
+        -------
+        out : NDArray or numpy.ndarray
+            The output. The buffer bound by `set_output_zero_copy` if there is one.
         """
+        bound = self._zero_copy_outputs.get(index)
+        if bound is not None:
+            if out is None or out is bound[0]:
+                return bound[0]
+            return _copy_into(bound[1], out)
+        if isinstance(out, np.ndarray):
+            return _copy_into(self._get_output(index), out)
         if out:
             self._get_output(index, out)
             return out
 
         return self._get_output(index)
 
+    def set_output_zero_copy(self, index, out):
+        """Make the graph write its index-th output directly into a caller-owned buffer.
+
+        The buffer must have the device, shape and dtype of the output, and be contiguous
+        and 64-byte aligned, e.g. ``tvm.nd.empty(shape, dtype).numpy(zero_copy=True)``.
+        It stays bound for the lifetime of the module, and is returned by `get_output`.
+
+        Parameters
+        ----------
+        index : int
+            The output index
+
+        out : NDArray or numpy.ndarray
+            The output buffer
+        """
+        arr = _as_zero_copy_array(out, self._get_output(index))
+        if arr is None:
+            raise ValueError(
+                "Output buffer of output %d must match its device, shape and dtype, "
+                "and be contiguous and 64-byte aligned" % index
+            )
+        self.module["set_output_zero_copy"](index, arr)
+        self._zero_copy_outputs[index] = (out, arr)
+
     def debug_get_output(self, node, out):
         """Run graph up to node and get the output to out
 
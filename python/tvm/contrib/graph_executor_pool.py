@@ -0,0 +1,167 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""A pool of graph executors over one compiled module for concurrent CPU inference."""
+import os
+import queue
+import threading
+from concurrent.futures import Future
+
+import numpy as np
+
+from tvm import runtime
+from tvm._ffi import get_global_func
+from tvm.contrib import graph_executor
+
+# ThreadGroup::AffinityMode::kSpecifyOneCorePerThread
+_AFFINITY_ONE_CORE_PER_THREAD = -2
+
+
+def _available_cpus():
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count()))
+
+
+class GraphExecutorPool(object):
+    """A pool of graph executor instances that share the parameters of one module.
+
+    Each instance is driven by its own thread, whose TVM thread pool is pinned to a
+    disjoint subset of the cores, so that instances run in parallel without
+    oversubscribing the machine. Requests are served by the first idle instance.
+
+    Parameters
+    ----------
+    lib : Union[GraphExecutorFactoryModule, Module]
+        The module built by `relay.build`, or loaded back from an exported library.
+
+    device : Device
+        The device to run on, CPU by default.
+
+    num_instances : int
+        The number of executor instances, 1 by default.
+
+    cores_per_instance : int, optional
+        The number of cores each instance is pinned to. By default the available
+        cores are divided evenly between the instances. No pinning when 0.
+
+    module_name : str
+        The name of the module in the factory.
+    """
+
+    def __init__(
+        self, lib, device=None, num_instances=1, cores_per_instance=None, module_name="default"
+    ):
+        if hasattr(lib, "libmod_name"):
+            module_name = lib.libmod_name
+            lib = lib.module
+        device = device if device is not None else runtime.cpu(0)
+
+        # The first instance loads the parameters, the others share its storage.
+        self.instances = [graph_executor.GraphModule(lib[module_name](device))]
+        param_names = list(lib["get_graph_params"]().keys())
+        if num_instances > 1:
+            no_params = lib["remove_params"]()
+            names_bytes = runtime.save_param_dict(
+                {name: np.zeros((1,), "float32") for name in param_names}
+            )
+            for _ in range(num_instances - 1):
+                instance = graph_executor.GraphModule(no_params[module_name](device))
+                instance.share_params(self.instances[0], names_bytes)
+                self.instances.append(instance)
+
+        cpus = _available_cpus()
+        if cores_per_instance is None:
+            cores_per_instance = max(1, len(cpus) // num_instances)
+        self.cores = [
+            [cpus[(i * cores_per_instance + j) % len(cpus)] for j in range(cores_per_instance)]
+            for i in range(num_instances)
+        ]
+
+        self._requests = queue.Queue()
+        self._workers = [
+            threading.Thread(target=self._serve, args=(i,), daemon=True)
+            for i in range(num_instances)
+        ]
+        for worker in self._workers:
+            worker.start()
+
+    def _serve(self, index):
+        if self.cores[index]:
+            get_global_func("runtime.config_threadpool")(
+                _AFFINITY_ONE_CORE_PER_THREAD,
+                len(self.cores[index]),
+                [str(core) for core in self.cores[index]],
+            )
+        instance = self.instances[index]
+        while True:
+            request = self._requests.get()
+            if request is None:
+                return
+            inputs, future = request
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                instance.run(**inputs)
+                outputs = [
+                    instance.get_output(i).numpy() for i in range(instance.get_num_outputs())
+                ]
+            except Exception as err:  # pylint: disable=broad-except
+                future.set_exception(err)
+            else:
+                future.set_result(outputs)
+
+    def submit(self, inputs):
+        """Submit an inference request. Thread-safe.
+
+        Parameters
+        ----------
+        inputs : dict of str to numpy.ndarray or NDArray
+            The inputs of the graph.
+
+        Returns
+        -------
+        future : concurrent.futures.Future
+            A future of the list of outputs of the graph, as numpy arrays.
+        """
+        if self._workers is None:
+            raise RuntimeError("Cannot submit to a pool that was shut down")
+        future = Future()
+        self._requests.put((inputs, future))
+        return future
+
+    def shutdown(self, wait=True):
+        """Stop the instances once the submitted requests are served.
+
+        Parameters
+        ----------
+        wait : bool
+            Whether to wait for the requests to be served.
+        """
+        if self._workers is None:
+            return
+        for _ in self._workers:
+            self._requests.put(None)
+        if wait:
+            for worker in self._workers:
+                worker.join()
+        self._workers = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.shutdown()
@@ -22,14 +22,22 @@ with additional timeout support.
 """
 import os
 import sys
+import time
+import signal
 import struct
+import atexit
+import hashlib
 import threading
 import subprocess
 import concurrent.futures
 from enum import IntEnum
-from collections import namedtuple
+from collections import OrderedDict, namedtuple
 import pickle
 
+# The maximum total size of the payloads kept in shared memory by the main process,
+# and of the payloads cached by each worker.
+SHARED_MEMORY_CAPACITY = 1 << 30
+
 
 def kill_child_processes(pid):
     """Kill all child processes recursively for a given pid.
@@ -79,6 +87,385 @@ class MapResult(namedtuple("MapResult", ["status", "value"])):
     __slots__ = []
 
 
+class IPCStats(
+    namedtuple(
+        "IPCStats",
+        [
+            "pipe_bytes_sent",
+            "pipe_bytes_received",
+            "shared_memory_bytes_sent",
+            "shared_memory_bytes_cached",
+            "shared_memory_bytes_received",
+        ],
+    )
+):
+    """The bytes exchanged with a worker process for a task.
+
+    Parameters
+    ----------
+    pipe_bytes_sent : int
+        The bytes written to the pipe of the worker.
+
+    pipe_bytes_received : int
+        The bytes read from the pipe of the worker.
+
+    shared_memory_bytes_sent : int
+        The bytes of the payloads sent through shared memory.
+
+    shared_memory_bytes_cached : int
+        The bytes of the payloads already sent to the worker before, which the
+        worker reads from its cache instead of the shared memory.
+
+    shared_memory_bytes_received : int
+        The bytes of the results received through shared memory.
+    """
+
+    __slots__ = []
+
+
+_SharedMemoryMessage = namedtuple("_SharedMemoryMessage", ["data", "handles", "threshold"])
+
+
+class _OutOfBandBytes:
+    """Wrap bytes or a bytearray to be pickled out-of-band, as pickle writes them in-band"""
+
+    __slots__ = ["value"]
+
+    def __init__(self, value):
+        self.value = value
+
+    def __reduce_ex__(self, protocol):
+        return type(self.value), (pickle.PickleBuffer(self.value),)
+
+
+def _wrap_large_bytes(obj, threshold):
+    """Wrap the bytes and bytearrays of at least threshold bytes in obj and its lists,
+    tuples and dicts"""
+    if type(obj) in (bytes, bytearray):  # pylint: disable=unidiomatic-typecheck
+        return _OutOfBandBytes(obj) if len(obj) >= threshold else obj
+    if type(obj) in (list, tuple):  # pylint: disable=unidiomatic-typecheck
+        return type(obj)(_wrap_large_bytes(item, threshold) for item in obj)
+    if type(obj) is dict:  # pylint: disable=unidiomatic-typecheck
+        return {key: _wrap_large_bytes(value, threshold) for key, value in obj.items()}
+    return obj
+
+
+def _dumps_out_of_band(obj, threshold):
+    """Pickle obj, leaving out the contiguous buffers of at least threshold bytes.
+
+    Covers bytes, bytearrays, NumPy arrays and any object supporting pickle protocol 5.
+
+    Returns
+    -------
+    data : bytes
+        The pickled object.
+
+    buffers : List[memoryview]
+        The buffers to pass to pickle.loads along with data.
+    """
+    # pylint: disable=import-outside-toplevel
+    import cloudpickle
+
+    buffers = []
+
+    def _buffer_callback(buffer):
+        try:
+            raw = buffer.raw()
+        except BufferError:
+            # non-contiguous buffer
+            return True
+        if raw.nbytes < threshold:
+            return True
+        buffers.append(raw)
+        return False
+
+    data = cloudpickle.dumps(
+        _wrap_large_bytes(obj, threshold), protocol=5, buffer_callback=_buffer_callback
+    )
+    return data, buffers
+
+
+def _untracked_shared_memory(name=None, create=False, size=0):
+    """Open a shared memory segment which is not unlinked when the current process exits"""
+    # pylint: disable=import-outside-toplevel
+    from multiprocessing import resource_tracker, shared_memory
+
+    try:
+        return shared_memory.SharedMemory(  # pylint: disable=unexpected-keyword-arg
+            name=name, create=create, size=size, track=False
+        )
+    except TypeError:
+        # Before python 3.13, every segment is registered to the resource tracker
+        shm = shared_memory.SharedMemory(name=name, create=create, size=size)
+        resource_tracker.unregister(shm._name, "shared_memory")  # pylint: disable=protected-access
+        return shm
+
+
+def _read_shared_memory(shm, size):
+    """Copy the first size bytes of a shared memory segment and close it"""
+    with shm.buf[:size] as view:
+        data = bytearray(view)
+    shm.close()
+    return data
+
+
+class _SharedMemoryPool:
+    """The shared memory segments holding the payloads sent to the workers.
+
+    Segments are addressed by the digest of their content, so that a payload sent
+    with many tasks is only written once. A segment is kept while a task using it
+    is running, and the segments no task uses are unlinked in LRU order once their
+    total size exceeds SHARED_MEMORY_CAPACITY.
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self):
+        self._segments = OrderedDict()
+        self._nbytes = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def get(cls):
+        """Get the pool of the current process, creating it if needed"""
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+                atexit.register(cls._instance.clear)
+            return cls._instance
+
+    def acquire(self, buffer):
+        """Get the handle of a segment holding buffer, and keep it until released.
+
+        Parameters
+        ----------
+        buffer : memoryview
+            The content of the segment.
+
+        Returns
+        -------
+        handle : Tuple[str, str, int]
+            The digest of the content, the name of the segment and the size of the content.
+        """
+        # pylint: disable=import-outside-toplevel
+        from multiprocessing import shared_memory
+
+        digest = hashlib.blake2b(buffer, digest_size=16).hexdigest()
+        size = buffer.nbytes
+        with self._lock:
+            entry = self._segments.get(digest)
+            if entry is None:
+                shm = shared_memory.SharedMemory(create=True, size=max(size, 1))
+                shm.buf[:size] = buffer
+                entry = [shm, size, 0]
+                self._segments[digest] = entry
+                self._nbytes += size
+            else:
+                self._segments.move_to_end(digest)
+            entry[2] += 1
+            return digest, entry[0].name, size
+
+    def release(self, digests):
+        """Release the segments of a finished task"""
+        with self._lock:
+            for digest in digests:
+                self._segments[digest][2] -= 1
+            for digest in list(self._segments):
+                if self._nbytes <= SHARED_MEMORY_CAPACITY:
+                    break
+                shm, size, refs = self._segments[digest]
+                if refs == 0:
+                    del self._segments[digest]
+                    self._nbytes -= size
+                    shm.close()
+                    shm.unlink()
+
+    def clear(self):
+        """Unlink all the segments"""
+        with self._lock:
+            for shm, _, _ in self._segments.values():
+                shm.close()
+                shm.unlink()
+            self._segments.clear()
+            self._nbytes = 0
+
+
+# The requests to the zygote are a command and a pid, answered by a flag and a value:
+# fork (followed by the two file descriptors of the worker) -> (forked, pid)
+# poll -> (exited, exit code)
+# kill -> (True, 0)
+_ZYGOTE_REQUEST = struct.Struct("<ci")
+_ZYGOTE_REPLY = struct.Struct("<?i")
+_ZYGOTE_FORK = b"F"
+_ZYGOTE_POLL = b"P"
+_ZYGOTE_KILL = b"K"
+
+
+def _exit_code(status):
+    """Convert a wait status to an exit code, negative for a signal like subprocess"""
+    if os.WIFSIGNALED(status):
+        return -os.WTERMSIG(status)
+    return os.WEXITSTATUS(status)
+
+
+class _ZygoteProcess:
+    """A worker forked by the zygote.
+
+    Implements the subset of the subprocess.Popen interface used by PopenWorker.
+    The process is a child of the zygote, which only reaps it when its exit status
+    is polled, so that the pid cannot be reused while it is still signaled.
+
+    Parameters
+    ----------
+    zygote : _Zygote
+        The zygote which forked the worker.
+
+    pid : int
+        The pid of the worker.
+    """
+
+    def __init__(self, zygote, pid):
+        self._zygote = zygote
+        self.pid = pid
+        self.returncode = None
+
+    def poll(self):
+        """Return the exit code if the process exited, None otherwise"""
+        if self.returncode is None:
+            try:
+                exited, returncode = self._zygote.request(_ZYGOTE_POLL, self.pid)
+            except ChildProcessError:
+                # the worker was reparented, and its exit status is lost with the zygote
+                exited, returncode = True, -signal.SIGKILL
+            if exited:
+                self.returncode = returncode
+        return self.returncode
+
+    def wait(self, timeout=None):
+        """Wait for the process to exit"""
+        deadline = None if timeout is None else time.time() + timeout
+        while self.poll() is None:
+            if deadline is not None and time.time() > deadline:
+                raise subprocess.TimeoutExpired("zygote worker %d" % self.pid, timeout)
+            time.sleep(0.001)
+        return self.returncode
+
+    def kill(self):
+        """Kill the process"""
+        if self.poll() is None:
+            try:
+                self._zygote.request(_ZYGOTE_KILL, self.pid)
+            except ChildProcessError:
+                pass
+
+
+class _Zygote:
+    """A process which imported tvm once and forks new PopenWorker processes on demand.
+
+    The zygote is shared by all the workers of the current process, and started
+    at the first request. Forking from it skips the interpreter startup and the
+    loading of libtvm, which dominate the startup time of a worker.
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self):
+        # pylint: disable=import-outside-toplevel
+        import socket
+
+        self._sock, child_sock = socket.socketpair()
+        cmd = [sys.executable, "-m", "tvm.exec.popen_worker", "--zygote", str(child_sock.fileno())]
+        self._proc = subprocess.Popen(cmd, pass_fds=(child_sock.fileno(),))
+        child_sock.close()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def get(cls):
+        """Get the zygote of the current process, starting it if needed"""
+        with cls._instance_lock:
+            if cls._instance is None or cls._instance._proc.poll() is not None:
+                if sys.platform == "win32":
+                    raise RuntimeError("The zygote start method is not supported on Windows")
+                if cls._instance is None:
+                    atexit.register(cls._shutdown)
+                cls._instance = cls()
+            return cls._instance
+
+    @classmethod
+    def _shutdown(cls):
+        with cls._instance_lock:
+            if cls._instance is not None:
+                cls._instance.close()
+                cls._instance = None
+
+    def request(self, command, pid, fds=()):
+        """Send a request to the zygote and wait for its reply.
+
+        Parameters
+        ----------
+        command : bytes
+            The command of the request.
+
+        pid : int
+            The pid of the worker the request is about.
+
+        fds : List[int]
+            The file descriptors sent with the request.
+
+        Returns
+        -------
+        reply : Tuple[bool, int]
+            The flag and the value of the reply.
+        """
+        # pylint: disable=import-outside-toplevel
+        import socket
+        from multiprocessing.reduction import sendfds
+
+        with self._lock:
+            try:
+                self._sock.sendall(_ZYGOTE_REQUEST.pack(command, pid))
+                if fds:
+                    sendfds(self._sock, fds)
+                data = self._sock.recv(_ZYGOTE_REPLY.size, socket.MSG_WAITALL)
+            except OSError:
+                data = b""
+        if len(data) != _ZYGOTE_REPLY.size:
+            raise ChildProcessError("Zygote terminated")
+        return _ZYGOTE_REPLY.unpack(data)
+
+    def fork(self, read_fd, write_fd):
+        """Fork a new worker reading its tasks from read_fd and writing the results to write_fd.
+
+        Parameters
+        ----------
+        read_fd : int
+            The worker side of the task pipe.
+
+        write_fd : int
+            The worker side of the result pipe.
+
+        Returns
+        -------
+        proc : _ZygoteProcess
+            The forked worker.
+        """
+        forked, pid = self.request(_ZYGOTE_FORK, 0, [read_fd, write_fd])
+        if not forked:
+            raise ChildProcessError("Zygote failed to fork a worker")
+        return _ZygoteProcess(self, pid)
+
+    def close(self):
+        """Stop the zygote, the running workers are not affected"""
+        with self._lock:
+            self._sock.close()
+        try:
+            self._proc.wait(timeout=1.0)
+        except subprocess.TimeoutExpired:
+            self._proc.kill()
+
+
 class PopenWorker:
     """A subprocess worker via Popen.
 
@@ -97,17 +484,66 @@ class PopenWorker:
         The maximum number of times a process can be used before being recycled,
         i.e. killed and restarted. If `None`, the process will be reused until
         an operation times out.
+
+    maximum_rss: Optional[int]
+        The maximum resident set size in bytes a process can reach before being
+        recycled. If `None`, the memory usage of the process is not checked.
+
+    stay_warm: bool
+        Whether to restart a process as soon as it is recycled or killed, instead of
+        lazily in the next send. The new process imports tvm and runs the initializer
+        in the background, so that the next send does not wait for the startup.
+
+    start_method: str
+        How to start a new process, either "popen" to run a fresh interpreter, or
+        "zygote" to fork it from a process which already imported tvm. Forking takes
+        milliseconds instead of seconds, but the process inherits the modules imported
+        by the zygote rather than starting from a clean interpreter. Not supported
+        on Windows.
+
+    shared_memory_threshold: Optional[int]
+        If not `None`, the buffers of at least this many bytes in the tasks and their
+        results, such as bytes, bytearrays and NumPy arrays, are sent through POSIX shared
+        memory instead of the pipe. The payloads are addressed by content and cached by
+        the worker, so that a payload sent with many tasks is only copied once per worker.
+        The shared memory, usually /dev/shm, must be large enough to hold
+        SHARED_MEMORY_CAPACITY bytes. Not supported on Windows.
     """
 
-    def __init__(self, initializer=None, initargs=(), maximum_uses=None):
+    def __init__(
+        self,
+        initializer=None,
+        initargs=(),
+        maximum_uses=None,
+        maximum_rss=None,
+        stay_warm=False,
+        start_method="popen",
+        shared_memory_threshold=None,
+    ):
         self._proc = None
         self._initializer = initializer
         self._initargs = initargs
         self._maximum_uses = maximum_uses
+        self._maximum_rss = maximum_rss
+        self._stay_warm = stay_warm
+        self._start_method = start_method
+        self._shared_memory_threshold = shared_memory_threshold
         self._remaining_uses = None
+        self._init_pending = False
+        # the digests of the shared memory payloads used by the pending tasks,
+        # and of the payloads already sent to the current process
+        self._pinned_digests = []
+        self._sent_digests = set()
+        self._ipc_bytes = [0] * len(IPCStats._fields)
 
         if self._initializer is not None and not callable(self._initializer):
             raise TypeError("initializer must be callable for PopenWorker")
+        if start_method not in ("popen", "zygote"):
+            raise ValueError("Unknown start_method %s for PopenWorker" % start_method)
+        if shared_memory_threshold is not None and (
+            sys.platform == "win32" or not hasattr(pickle, "PickleBuffer")
+        ):
+            raise RuntimeError("shared_memory_threshold requires python 3.8 or later on POSIX")
 
     def __del__(self):
         try:
@@ -132,9 +568,11 @@ class PopenWorker:
                 self._reader.close()
             except IOError:
                 pass
-            # kill all child processes recursively
+            # kill all child processes recursively, the pid is only valid
+            # until the exit status of the process is collected
             try:
-                kill_child_processes(self._proc.pid)
+                if self._proc.poll() is None:
+                    kill_child_processes(self._proc.pid)
             except TypeError:
                 pass
             try:
@@ -146,6 +584,27 @@ class PopenWorker:
             self.join(timeout=1.0)
             self._proc = None
             self._remaining_uses = None
+            self._init_pending = False
+            self._release_shared_memory()
+            self._sent_digests.clear()
+
+    @property
+    def ipc_stats(self):
+        """The bytes exchanged with the process since the start of the last send, including
+        the initializer of a process started meanwhile.
+
+        Returns
+        -------
+        stats : IPCStats
+            The bytes exchanged for the last task.
+        """
+        return IPCStats(*self._ipc_bytes)
+
+    def _release_shared_memory(self):
+        """Release the shared memory payloads of the pending tasks"""
+        if self._pinned_digests:
+            _SharedMemoryPool.get().release(self._pinned_digests)
+            self._pinned_digests = []
 
     def _start(self):
         """Start a new subprocess if nothing is available"""
@@ -157,7 +616,14 @@ class PopenWorker:
         worker_read, main_write = os.pipe()
 
         cmd = [sys.executable, "-m", "tvm.exec.popen_worker"]
-        if sys.platform == "win32":
+        if self._start_method == "zygote":
+            try:
+                self._proc = _Zygote.get().fork(worker_read, worker_write)
+            except BaseException:
+                for fd in (main_read, worker_write, worker_read, main_write):
+                    os.close(fd)
+                raise
+        elif sys.platform == "win32":
             # pylint: disable=import-outside-toplevel
             import msvcrt
 
@@ -177,6 +643,39 @@ class PopenWorker:
         self._reader = os.fdopen(main_read, "rb")
         self._writer = os.fdopen(main_write, "wb")
 
+    def start(self):
+        """Start a new subprocess if nothing is available, and send it the initializer.
+
+        Note
+        ----
+        This method does not wait for the subprocess to start or for the initializer
+        to finish; the result of the initializer is received in the next send.
+        """
+        if self._proc is not None:
+            return
+        self._start()
+        if self._initializer is not None:
+            self._send_task(self._initializer, self._initargs, {}, None)
+            self._init_pending = True
+        # N.B. The initializer doesn't count as a "use"
+        self._remaining_uses = self._maximum_uses
+
+    def _should_recycle(self):
+        """Check if the current process has to be recycled before the next send"""
+        if self._proc is None:
+            return False
+        if self._maximum_uses and self._remaining_uses == 0:
+            return True
+        if self._maximum_rss is not None:
+            # pylint: disable=import-outside-toplevel
+            import psutil
+
+            try:
+                return psutil.Process(self._proc.pid).memory_info().rss > self._maximum_rss
+            except psutil.NoSuchProcess:
+                return False
+        return False
+
     def join(self, timeout=None):
         """Join the current process worker before it terminates.
 
@@ -221,25 +720,36 @@ class PopenWorker:
         order to make sure the timeout and child process exit
         won't affect the later requests.
         """
-        # use cloud pickle
-        # pylint: disable=import-outside-toplevel
-        import cloudpickle
-
-        if self._proc is not None and self._maximum_uses and self._remaining_uses == 0:
+        self._ipc_bytes = [0] * len(IPCStats._fields)
+        if self._should_recycle():
             # Time to recycle the process.
             self.kill()
 
         if self._proc is None:
-            self._start()
-            # init
-            if self._initializer is not None:
-                self.send(self._initializer, self._initargs)
-                self.recv()
-
-            # N.B. The initializer doesn't count as a "use"
-            self._remaining_uses = self._maximum_uses
+            self.start()
+
+        if self._init_pending:
+            # wait for the initializer
+            self._init_pending = False
+            self._recv()
+
         kwargs = {} if not kwargs else kwargs
-        data = cloudpickle.dumps((fn, args, kwargs, timeout), protocol=pickle.HIGHEST_PROTOCOL)
+        self._send_task(fn, args, kwargs, timeout)
+
+        if self._remaining_uses:
+            self._remaining_uses -= 1
+
+    def _send_task(self, fn, args, kwargs, timeout):
+        """Write a function task to the subprocess"""
+        # use cloud pickle
+        # pylint: disable=import-outside-toplevel
+        import cloudpickle
+
+        task = (fn, args, kwargs, timeout)
+        if self._shared_memory_threshold is not None:
+            task = self._share_payloads(task)
+        data = cloudpickle.dumps(task, protocol=pickle.HIGHEST_PROTOCOL)
+        self._ipc_bytes[0] += 4 + len(data)
         try:
             self._writer.write(struct.pack("<i", len(data)))
             self._writer.write(data)
@@ -247,8 +757,35 @@ class PopenWorker:
         except IOError:
             pass
 
-        if self._remaining_uses:
-            self._remaining_uses -= 1
+    def _share_payloads(self, task):
+        """Move the large buffers of a task to shared memory"""
+        data, buffers = _dumps_out_of_band(task, self._shared_memory_threshold)
+        pool = _SharedMemoryPool.get()
+        handles = []
+        for buffer in buffers:
+            digest, name, size = pool.acquire(buffer)
+            self._pinned_digests.append(digest)
+            if digest in self._sent_digests:
+                self._ipc_bytes[3] += size
+            else:
+                self._sent_digests.add(digest)
+                self._ipc_bytes[2] += size
+            handles.append((digest, name, size))
+        return _SharedMemoryMessage(data, handles, self._shared_memory_threshold)
+
+    def _load_payloads(self, message):
+        """Load a result whose large buffers were sent in shared memory by the process"""
+        # pylint: disable=import-outside-toplevel
+        from multiprocessing import shared_memory
+
+        buffers = []
+        for _, name, size in message.handles:
+            shm = shared_memory.SharedMemory(name=name)
+            buffers.append(_read_shared_memory(shm, size))
+            # the segments of the results are owned by the receiver
+            shm.unlink()
+            self._ipc_bytes[4] += size
+        return pickle.loads(message.data, buffers=buffers)
 
     def _child_process_error(self):
         """Raise a child process error."""
@@ -270,6 +807,16 @@ class PopenWorker:
         TimeoutError: if timeout happens
         Exception: if other exception happens during the execution.
         """
+        try:
+            return self._recv()
+        finally:
+            if self._stay_warm:
+                if self._should_recycle():
+                    self.kill()
+                self.start()
+
+    def _recv(self):
+        """Receive the result of the last task written to the subprocess"""
         # pylint: disable=import-outside-toplevel
         import cloudpickle
 
@@ -283,9 +830,14 @@ class PopenWorker:
 
         try:
             recv_bytes = struct.unpack("<i", len_data)[0]
-            status, value = cloudpickle.loads(self._reader.read(recv_bytes))
+            result = cloudpickle.loads(self._reader.read(recv_bytes))
         except IOError:
             raise self._child_process_error()
+        self._ipc_bytes[1] += 4 + recv_bytes
+        self._release_shared_memory()
+        if isinstance(result, _SharedMemoryMessage):
+            result = self._load_payloads(result)
+        status, value = result
 
         if status == StatusKind.COMPLETE:
             return value
@@ -319,6 +871,21 @@ class PopenPoolExecutor:
         i.e. killed and restarted. If `None`, processes will be reused until an
         operation times out.
 
+    maximum_process_rss: Optional[int]
+        The maximum resident set size in bytes each process can reach before being
+        recycled. If `None`, the memory usage of the processes is not checked.
+
+    stay_warm: bool
+        Whether to restart the processes in the background as soon as they are recycled,
+        so that the next submitted job does not pay for the process startup.
+
+    start_method: str
+        How to start the processes, either "popen" or "zygote". See PopenWorker.
+
+    shared_memory_threshold: Optional[int]
+        If not `None`, the size in bytes from which the buffers of the jobs and of their
+        results are sent through shared memory. See PopenWorker.
+
     Note
     ----
     If max_workers is NONE then the number returned by
@@ -333,6 +900,10 @@ class PopenPoolExecutor:
         initializer=None,
         initargs=(),
         maximum_process_uses=None,
+        maximum_process_rss=None,
+        stay_warm=False,
+        start_method="popen",
+        shared_memory_threshold=None,
     ):
         if max_workers is None:
             max_workers = os.cpu_count()
@@ -344,9 +915,16 @@ class PopenPoolExecutor:
         self._initializer = initializer
         self._initargs = initargs
         self._maximum_process_uses = maximum_process_uses
+        self._maximum_process_rss = maximum_process_rss
+        self._stay_warm = stay_warm
+        self._start_method = start_method
+        self._shared_memory_threshold = shared_memory_threshold
+        self._ipc_bytes = [0] * len(IPCStats._fields)
 
         if self._initializer is not None and not callable(self._initializer):
             raise TypeError("initializer must be callable for PopenPoolExecutor")
+        if start_method not in ("popen", "zygote"):
+            raise ValueError("Unknown start_method %s for PopenPoolExecutor" % start_method)
 
     def __del__(self):
         self._lock.acquire()
@@ -363,14 +941,40 @@ class PopenPoolExecutor:
         self._lock.acquire()
         tid = threading.get_ident()
         if tid not in self._worker_map:
-            proc = PopenWorker(self._initializer, self._initargs, self._maximum_process_uses)
+            proc = PopenWorker(
+                self._initializer,
+                self._initargs,
+                self._maximum_process_uses,
+                self._maximum_process_rss,
+                self._stay_warm,
+                self._start_method,
+                self._shared_memory_threshold,
+            )
             self._worker_map[tid] = proc
         else:
             proc = self._worker_map[tid]
         self._lock.release()
 
-        proc.send(fn, args, kwargs, self._timeout)
-        return proc.recv()
+        try:
+            proc.send(fn, args, kwargs, self._timeout)
+            return proc.recv()
+        finally:
+            with self._lock:
+                for i, nbytes in enumerate(proc.ipc_stats):
+                    self._ipc_bytes[i] += nbytes
+
+    def ipc_stats(self):
+        """The bytes exchanged with the worker processes for all the jobs so far.
+
+        The bytes exchanged for each job are given by PopenWorker.ipc_stats.
+
+        Returns
+        -------
+        stats : IPCStats
+            The total bytes exchanged.
+        """
+        with self._lock:
+            return IPCStats(*self._ipc_bytes)
 
     def _worker_run_with_error_catching(self, fn, args, kwargs) -> MapResult:
         # pylint: disable=broad-except
@@ -98,7 +98,7 @@ class TVMCModel(object):
             self.mod = mod
             self.params = params if params else {}
 
-    def save(self, model_path: str):
+    def save(self, model_path: str, mmap_params: bool = False):
         """Save the TVMCModel to disk.
 
         Note that this saves the graph representation,
@@ -110,6 +110,9 @@ class TVMCModel(object):
         model_path : str
             A full path to save this TVMCModel to including the output file name.
             The file will be saved as a tar file so using a ".tar" extension is advised.
+        mmap_params : bool, optional
+            Whether to save the parameters with `tvm.runtime.save_param_file`, so that
+            `load` memory-maps them instead of reading them into memory.
         """
         temp = self._tmp_dir
 
@@ -122,8 +125,11 @@ class TVMCModel(object):
         # Save params
         params_name = "model.params"
         params_path = temp.relpath(params_name)
-        with open(params_path, "wb") as params_file:
-            params_file.write(relay.save_param_dict(self.params))
+        if mmap_params:
+            tvm.runtime.save_param_file(self.params, params_path)
+        else:
+            with open(params_path, "wb") as params_file:
+                params_file.write(relay.save_param_dict(self.params))
 
         # Create a tar file.
         with tarfile.open(model_path, "w") as tar:
@@ -155,8 +161,16 @@ class TVMCModel(object):
 
         # Load parameter dictionary.
         params_path = temp.relpath("model.params")
-        with open(params_path, "rb") as params_file:
-            self.params = relay.load_param_dict(params_file.read())
+        params_offset = t.getmember("model.params").offset_data
+        if tvm.runtime.params.is_param_file(model_path, params_offset):
+            # The parameters are stored as is in an uncompressed tar file, map them from
+            # the model file itself so that the processes loading it share their pages.
+            self.params = tvm.runtime.load_param_file(model_path, params_offset)
+        elif tvm.runtime.params.is_param_file(params_path):
+            self.params = tvm.runtime.load_param_file(params_path)
+        else:
+            with open(params_path, "rb") as params_file:
+                self.params = relay.load_param_dict(params_file.read())
 
     def default_tuning_records_path(self):
         """Get a full path for storing tuning records in this model's temporary direcotry
@@ -23,9 +23,22 @@ import threading
 import traceback
 import pickle
 import logging
+from collections import OrderedDict
 import cloudpickle
 
-from tvm.contrib.popen_pool import StatusKind
+from tvm.contrib.popen_pool import (
+    SHARED_MEMORY_CAPACITY,
+    StatusKind,
+    _dumps_out_of_band,
+    _read_shared_memory,
+    _SharedMemoryMessage,
+    _ZYGOTE_POLL,
+    _ZYGOTE_KILL,
+    _ZYGOTE_REPLY,
+    _ZYGOTE_REQUEST,
+    _exit_code,
+    _untracked_shared_memory,
+)
 
 
 class TimeoutStatus:
@@ -35,10 +48,42 @@ class TimeoutStatus:
         self.status = StatusKind.RUNNING
 
 
+class PayloadCache:
+    """The payloads received through shared memory, by digest of their content.
+
+    The least recently used payloads are dropped once their total size exceeds
+    SHARED_MEMORY_CAPACITY.
+    """
+
+    def __init__(self):
+        self._payloads = OrderedDict()
+        self._nbytes = 0
+
+    def load(self, handle):
+        """Get a writable copy of the payload of a handle sent by the parent"""
+        digest, name, size = handle
+        data = self._payloads.get(digest)
+        if data is None:
+            data = _read_shared_memory(_untracked_shared_memory(name=name), size)
+            self._payloads[digest] = data
+            self._nbytes += size
+            while self._nbytes > SHARED_MEMORY_CAPACITY and len(self._payloads) > 1:
+                _, evicted = self._payloads.popitem(last=False)
+                self._nbytes -= len(evicted)
+        else:
+            self._payloads.move_to_end(digest)
+        # the payload may be mutated by the task, e.g. as a NumPy array
+        return bytearray(data)
+
+
 def main():
     """Main worker function"""
+    if len(sys.argv) == 3 and sys.argv[1] == "--zygote":
+        zygote(int(sys.argv[2]))
+        return
     if len(sys.argv) != 3:
         print("Usage: <read_fd> <write_fd>")
+        print("       --zygote <socket_fd>")
         return
     if sys.platform == "win32":
         # pylint: disable=import-outside-toplevel
@@ -51,11 +96,27 @@ def main():
         writer = os.fdopen(int(sys.argv[2]), "wb")
 
     logging.basicConfig(level=logging.INFO)
+    serve(reader, writer)
+
 
+def serve(reader, writer):
+    """Run the tasks read from reader until the parent exits, writing the results to writer.
+
+    Parameters
+    ----------
+    reader : io.BufferedReader
+        The pipe to read the tasks from.
+
+    writer : io.BufferedWriter
+        The pipe to write the results to.
+    """
     lock = threading.Lock()
+    payloads = PayloadCache()
 
-    def _respond(ret_value):
+    def _respond(ret_value, shared_memory_threshold=None):
         """Send data back to the client."""
+        if shared_memory_threshold is not None:
+            ret_value = _share_payloads(ret_value, shared_memory_threshold)
         data = cloudpickle.dumps(ret_value, protocol=pickle.HIGHEST_PROTOCOL)
         writer.write(struct.pack("<i", len(data)))
         writer.write(data)
@@ -74,7 +135,12 @@ def main():
             # the parent exited
             return
         bytes_size = struct.unpack("<i", raw_bytes_size)[0]
-        fn, args, kwargs, timeout = cloudpickle.loads(reader.read(bytes_size))
+        task = cloudpickle.loads(reader.read(bytes_size))
+        shared_memory_threshold = None
+        if isinstance(task, _SharedMemoryMessage):
+            shared_memory_threshold = task.threshold
+            task = pickle.loads(task.data, buffers=[payloads.load(h) for h in task.handles])
+        fn, args, kwargs, timeout = task
         status = TimeoutStatus()
 
         if timeout is not None:
@@ -95,11 +161,125 @@ def main():
 
         lock.acquire()
         if status.status == StatusKind.RUNNING:
-            _respond(ret_value)
+            _respond(ret_value, shared_memory_threshold)
             status.status = StatusKind.COMPLETE
         lock.release()
 
 
+def _share_payloads(ret_value, threshold):
+    """Move the large buffers of a result to shared memory, to be unlinked by the parent"""
+    data, buffers = _dumps_out_of_band(ret_value, threshold)
+    handles = []
+    for buffer in buffers:
+        shm = _untracked_shared_memory(create=True, size=max(buffer.nbytes, 1))
+        shm.buf[: buffer.nbytes] = buffer
+        handles.append((None, shm.name, buffer.nbytes))
+        shm.close()
+    return _SharedMemoryMessage(data, handles, threshold)
+
+
+def zygote(sock_fd):
+    """Fork a new worker for every pair of pipes received on a unix socket.
+
+    The zygote imports tvm once, so that the forked workers skip the interpreter
+    startup and the loading of libtvm. The pid of each worker is sent back on the
+    socket, then the parent polls and kills the worker through the zygote. A worker
+    is only reaped when the parent polls its exit status, so that its pid is not
+    reused while the parent may still kill it. The zygote exits when the socket is
+    closed by the parent.
+
+    Parameters
+    ----------
+    sock_fd : int
+        The file descriptor of the unix socket connected to the parent.
+    """
+    # pylint: disable=import-outside-toplevel
+    import signal
+    import socket
+    from multiprocessing.reduction import recvfds
+
+    # import libtvm before forking, this is what the workers save
+    import tvm  # pylint: disable=unused-import
+
+    logging.basicConfig(level=logging.INFO)
+    sock = socket.socket(fileno=sock_fd)
+    while True:
+        try:
+            request = sock.recv(_ZYGOTE_REQUEST.size, socket.MSG_WAITALL)
+            if len(request) != _ZYGOTE_REQUEST.size:
+                # the parent exited
+                return
+            command, pid = _ZYGOTE_REQUEST.unpack(request)
+            if command == _ZYGOTE_POLL:
+                reply = _poll_worker(pid)
+            elif command == _ZYGOTE_KILL:
+                try:
+                    os.kill(pid, signal.SIGKILL)
+                except ProcessLookupError:
+                    pass
+                reply = (True, 0)
+            else:
+                fds = recvfds(sock, 2)
+                pid = _fork_worker(sock, fds)
+                reply = (pid > 0, pid)
+            sock.sendall(_ZYGOTE_REPLY.pack(*reply))
+        except (EOFError, OSError):
+            # the parent exited
+            return
+
+
+def _poll_worker(pid):
+    """Reap a worker of the zygote if it exited, return (exited, exit code)"""
+    try:
+        reaped, status = os.waitpid(pid, os.WNOHANG)
+    except ChildProcessError:
+        # not a child of the zygote
+        return True, -1
+    if reaped == 0:
+        return False, 0
+    return True, _exit_code(status)
+
+
+def _fork_worker(sock, fds):
+    """Fork a worker serving the pipes fds from the zygote, return its pid or -1"""
+    # pylint: disable=import-outside-toplevel
+    import random
+
+    try:
+        pid = os.fork()
+    except OSError:
+        pid = -1
+    if pid == 0:
+        sock.close()
+        # do not share the random state of the zygote between workers
+        random.seed()
+        if "numpy" in sys.modules:
+            sys.modules["numpy"].random.seed()
+        # exit with the same code as a worker started by popen
+        code = 0
+        try:
+            serve(os.fdopen(fds[0], "rb"), os.fdopen(fds[1], "wb"))
+        except (KeyboardInterrupt, IOError):
+            pass
+        except SystemExit as err:
+            if err.code is None or isinstance(err.code, int):
+                code = err.code or 0
+            else:
+                sys.stderr.write("%s\n" % err.code)
+                code = 1
+        except BaseException:  # pylint: disable=broad-except
+            traceback.print_exc()
+            code = 1
+        finally:
+            sys.stdout.flush()
+            sys.stderr.flush()
+            # skip the atexit handlers inherited from the zygote
+            os._exit(code & 0xFF)
+    for fd in fds:
+        os.close(fd)
+    return pid
+
+
 if __name__ == "__main__":
     try:
         main()
@@ -49,6 +49,9 @@ def main(args):
         custom_addr=args.custom_addr,
         silent=args.silent,
         no_fork=not args.fork,
+        prefork=args.prefork,
+        upload_cache_dir=args.upload_cache_dir,
+        upload_cache_max_bytes=int(args.upload_cache_size_mb * 1024 * 1024),
     )
     server.proc.join()
 
@@ -90,6 +93,24 @@ if __name__ == "__main__":
     parser.add_argument(
         "--custom-addr", type=str, help="Custom IP Address to Report to RPC Tracker"
     )
+    parser.add_argument(
+        "--prefork",
+        type=int,
+        default=0,
+        help="The number of session processes started ahead of the connections.",
+    )
+    parser.add_argument(
+        "--upload-cache-dir",
+        type=str,
+        help="The directory of a cache of the uploaded files, which lets clients skip "
+        "the upload of files the server already has.",
+    )
+    parser.add_argument(
+        "--upload-cache-size-mb",
+        type=float,
+        default=1024,
+        help="The maximum size of the upload cache in MB.",
+    )
 
     parser.set_defaults(fork=True)
     args = parser.parse_args()
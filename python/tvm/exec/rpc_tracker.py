@@ -21,9 +21,27 @@ import argparse
 from ..rpc.tracker import Tracker
 
 
+def _parse_user_weights(text):
+    """Parse user weights in user=weight,user=weight format"""
+    weights = {}
+    for item in text.split(","):
+        user, weight = item.rsplit("=", 1)
+        weights[user] = float(weight)
+    return weights
+
+
 def main(args):
     """Main function"""
-    tracker = Tracker(args.host, port=args.port, port_end=args.port_end, silent=args.silent)
+    tracker = Tracker(
+        args.host,
+        port=args.port,
+        port_end=args.port_end,
+        silent=args.silent,
+        scheduler=args.scheduler,
+        user_weights=_parse_user_weights(args.user_weights) if args.user_weights else None,
+        lease_timeout=args.lease_timeout,
+        metrics_port=args.metrics_port,
+    )
     tracker.proc.join()
 
 
@@ -35,6 +53,26 @@ if __name__ == "__main__":
     parser.add_argument("--port", type=int, default=9190, help="The port of the RPC")
     parser.add_argument("--port-end", type=int, default=9199, help="The end search port of the RPC")
     parser.add_argument("--silent", action="store_true", help="Whether run in silent mode.")
+    parser.add_argument(
+        "--scheduler",
+        type=str,
+        default="priority",
+        choices=["priority", "fair_share"],
+        help="The scheduler of the requests of each device key.",
+    )
+    parser.add_argument(
+        "--user-weights",
+        type=str,
+        help="The weights of the users for the fair share scheduler, e.g. alice=2,bob=1.",
+    )
+    parser.add_argument(
+        "--lease-timeout", type=float, help="The maximum duration of a session in seconds."
+    )
+    parser.add_argument(
+        "--metrics-port",
+        type=int,
+        help="The port to serve the metrics in the Prometheus text format at /metrics.",
+    )
     args = parser.parse_args()
     logging.basicConfig(level=logging.INFO)
     main(args)
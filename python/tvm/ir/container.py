@@ -15,11 +15,21 @@
 # specific language governing permissions and limitations
 # under the License.
 """Additional container data structures used across IR variants."""
+import numpy as np
+
 import tvm._ffi
 
 from tvm.runtime import Object
 from tvm.runtime.container import getitem_helper
 from tvm.runtime import _ffi_api
+from . import _ffi_api as _ir_ffi_api
+
+
+def _export(export_func, container):
+    """Get all the elements of a container with a single FFI call."""
+    elems = []
+    export_func(container, lambda *args: elems.extend(args))
+    return elems
 
 
 @tvm._ffi.register_object("Array")
@@ -33,11 +43,39 @@ class Array(Object):
     """
 
     def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return self.to_list()[idx]
         return getitem_helper(self, _ffi_api.ArrayGetItem, len(self), idx)
 
+    def __iter__(self):
+        return iter(self.to_list())
+
     def __len__(self):
         return _ffi_api.ArraySize(self)
 
+    def to_list(self):
+        """Convert the array to a python list in a single FFI call.
+
+        Returns
+        -------
+        result : list
+            The elements of the array.
+        """
+        return _export(_ffi_api.ArrayExport, self)
+
+    def numpy(self):
+        """Convert an array of IntImm, e.g. a shape, to a numpy array.
+
+        Returns
+        -------
+        result : numpy.ndarray
+            The int64 values of the elements.
+        """
+        data = _ir_ffi_api.IntImmArrayToBytes(self)
+        if data is None:
+            raise ValueError("Only arrays of IntImm can be converted to numpy arrays")
+        return np.frombuffer(data, dtype="int64")
+
     def __dir__(self):
         return sorted(dir(self.__class__) + ["type_key"])
 
@@ -65,9 +103,7 @@ class Map(Object):
         return _ffi_api.MapCount(self, k) != 0
 
     def __iter__(self):
-        akvs = _ffi_api.MapItems(self)
-        for i in range(len(self)):
-            yield akvs[i * 2]
+        return iter(_export(_ffi_api.MapExport, self)[::2])
 
     def __dir__(self):
         return sorted(dir(self.__class__) + ["type_key"])
@@ -83,14 +119,22 @@ class Map(Object):
         return iter(self)
 
     def values(self):
-        akvs = _ffi_api.MapItems(self)
-        for i in range(len(self)):
-            yield akvs[i * 2 + 1]
+        return iter(_export(_ffi_api.MapExport, self)[1::2])
 
     def items(self):
         """Get the items from the map"""
-        akvs = _ffi_api.MapItems(self)
-        return [(akvs[i], akvs[i + 1]) for i in range(0, len(akvs), 2)]
+        akvs = _export(_ffi_api.MapExport, self)
+        return list(zip(akvs[::2], akvs[1::2]))
+
+    def to_dict(self):
+        """Convert the map to a python dict in a single FFI call.
+
+        Returns
+        -------
+        result : dict
+            The items of the map.
+        """
+        return dict(self.items())
 
     def __len__(self):
         return _ffi_api.MapSize(self)
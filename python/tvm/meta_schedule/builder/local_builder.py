@@ -74,6 +74,14 @@ class LocalBuilder(PyBuilder):
     f_export : Union[None, str, T_EXPORT]
         Name of the export function to be used.
         Defaults to `meta_schedule.builder.default_export`.
+    persistent_pool : bool
+        Whether to keep the process pool alive across `build` calls.
+    maximum_process_uses : Optional[int]
+        The maximum number of builds a worker process runs before being recycled.
+        Only used when `persistent_pool` is enabled.
+    maximum_process_rss_mb : Optional[float]
+        The maximum resident memory in MB of a worker process before being recycled.
+        Only used when `persistent_pool` is enabled.
 
     Attributes
     ----------
@@ -103,6 +111,13 @@ class LocalBuilder(PyBuilder):
     The worker process is only aware of functions registered in TVM package,
     if there are extra functions to be registered,
     please send the registration logic via initializer.
+
+    By default, a fresh process pool is created for every `build` call, because of a known
+    memory leak issue with the workers after a couple times of usage. With `persistent_pool`,
+    one pool is kept alive instead, and each worker is recycled after `maximum_process_uses`
+    builds or once it exceeds `maximum_process_rss_mb`. Recycled workers are restarted right
+    away in the background, importing tvm and parsing the targets seen so far, so that the
+    next batch does not pay for the worker startup.
     """
 
     max_workers: int
@@ -110,6 +125,10 @@ class LocalBuilder(PyBuilder):
     initializer: Optional[Callable[[], None]]
     f_build: Union[None, str, T_BUILD]
     f_export: Union[None, str, T_EXPORT]
+    persistent_pool: bool
+    maximum_process_uses: Optional[int]
+    maximum_process_rss_mb: Optional[float]
+    shared_memory_threshold: Optional[int]
 
     def __init__(
         self,
@@ -119,6 +138,10 @@ class LocalBuilder(PyBuilder):
         f_build: Union[None, str, T_BUILD] = None,
         f_export: Union[None, str, T_EXPORT] = None,
         initializer: Optional[Callable[[], None]] = None,
+        persistent_pool: bool = False,
+        maximum_process_uses: Optional[int] = 16,
+        maximum_process_rss_mb: Optional[float] = 4096.0,
+        shared_memory_threshold: Optional[int] = None,
     ) -> None:
         """Constructor.
 
@@ -137,6 +160,15 @@ class LocalBuilder(PyBuilder):
             Defaults to `meta_schedule.builder.default_export`.
         initializer : Optional[Callable[[], None]]
             The initializer to be used for the worker processes.
+        persistent_pool : bool
+            Whether to keep the process pool alive across `build` calls.
+        maximum_process_uses : Optional[int]
+            The maximum number of builds a worker process runs before being recycled.
+        maximum_process_rss_mb : Optional[float]
+            The maximum resident memory in MB of a worker process before being recycled.
+        shared_memory_threshold : Optional[int]
+            If not None, the serialized params of at least this many bytes are sent to the
+            worker processes through shared memory, and cached by each worker.
         """
         super().__init__()
 
@@ -149,20 +181,24 @@ class LocalBuilder(PyBuilder):
         self.initializer = initializer
         self.f_build = f_build
         self.f_export = f_export
+        self.persistent_pool = persistent_pool
+        self.maximum_process_uses = maximum_process_uses
+        self.maximum_process_rss_mb = maximum_process_rss_mb
+        self.shared_memory_threshold = shared_memory_threshold
+        self._pool = None
+        self._warm_targets = []
         self._sanity_check()
 
     def build(self, build_inputs: List[BuilderInput]) -> List[BuilderResult]:
         results: List[BuilderResult] = []
         map_result: MapResult
 
-        # Here we restart the PopenPool everytime because of a known memory leak issue with the
-        # PopenPool workers after a couple times of usage. We don't apply the same to runners to
-        # avoid potential problem caused by async behaviour.
-        pool = PopenPoolExecutor(
-            max_workers=self.max_workers,
-            timeout=self.timeout_sec,
-            initializer=self.initializer,
-        )
+        # Record the targets so that recycled workers parse them ahead of time
+        for build_input in build_inputs:
+            target = str(build_input.target)
+            if target not in self._warm_targets:
+                self._warm_targets.append(target)
+        pool = self._get_pool()
 
         # Dispatch the build inputs to the worker processes.
         for map_result in pool.map_with_error_catching(
@@ -199,22 +235,62 @@ class LocalBuilder(PyBuilder):
         del pool
         return results
 
+    def _get_pool(self) -> PopenPoolExecutor:
+        # Unless the pool is persistent, we restart the PopenPool everytime because of a known
+        # memory leak issue with the PopenPool workers after a couple times of usage. We don't
+        # apply the same to runners to avoid potential problem caused by async behaviour.
+        if not self.persistent_pool:
+            return PopenPoolExecutor(
+                max_workers=self.max_workers,
+                timeout=self.timeout_sec,
+                initializer=self.initializer,
+                shared_memory_threshold=self.shared_memory_threshold,
+            )
+        if self._pool is None:
+            # N.B. `_warm_targets` is pickled every time a worker (re)starts,
+            # so recycled workers see the targets recorded so far.
+            self._pool = PopenPoolExecutor(
+                max_workers=self.max_workers,
+                timeout=self.timeout_sec,
+                initializer=_worker_initializer,
+                initargs=(self.initializer, self._warm_targets),
+                maximum_process_uses=self.maximum_process_uses,
+                maximum_process_rss=(
+                    None
+                    if self.maximum_process_rss_mb is None
+                    else int(self.maximum_process_rss_mb * 1024 * 1024)
+                ),
+                stay_warm=True,
+                shared_memory_threshold=self.shared_memory_threshold,
+            )
+        return self._pool
+
     def _sanity_check(self) -> None:
         def _check(f_build, f_export) -> None:
             get_global_func_with_default_on_worker(name=f_build, default=None)
             get_global_func_with_default_on_worker(name=f_export, default=None)
 
         # Same reason for the single use PopenPool as mentioned above
-        pool = PopenPoolExecutor(
-            max_workers=self.max_workers,
-            timeout=self.timeout_sec,
-            initializer=self.initializer,
-        )
+        pool = self._get_pool()
         value = pool.submit(_check, self.f_build, self.f_export)
         value.result()
         del pool
 
 
+def _worker_initializer(
+    initializer: Optional[Callable[[], None]],
+    targets: List[str],
+) -> None:
+    # pylint: disable=import-outside-toplevel,unused-import
+    from tvm.driver import build_module
+
+    # pylint: enable=import-outside-toplevel,unused-import
+    for target in targets:
+        Target(target)
+    if initializer is not None:
+        initializer()
+
+
 def _worker_func(
     _f_build: Union[None, str, T_BUILD],
     _f_export: Union[None, str, T_EXPORT],
@@ -90,15 +90,48 @@ class PackSum:
         ys : Optional[List[float]]
             A batch of labels. None means no labels available.
         """
+        repeats = np.array([x.shape[0] for x in xs], dtype="int64")
+        self._init(np.concatenate(xs, axis=0), repeats, ys)
+
+    @staticmethod
+    def from_matrix(
+        xs: np.ndarray,  # pylint: disable=invalid-name
+        repeats: np.ndarray,
+        ys: Optional[np.ndarray],  # pylint: disable=invalid-name
+    ) -> "PackSum":
+        """Create PackSum format from samples that are already packed into one matrix
+
+        Parameters
+        ----------
+        xs : np.ndarray
+            The blocks of all the samples, stacked into a matrix of shape [n, m]
+        repeats : np.ndarray
+            The number of blocks of each sample
+        ys : Optional[List[float]]
+            A batch of labels. None means no labels available.
+
+        Returns
+        -------
+        pack_sum : PackSum
+            The PackSum format of the samples.
+        """
+        result = PackSum.__new__(PackSum)
+        result._init(xs, repeats, ys)  # pylint: disable=protected-access
+        return result
+
+    def _init(
+        self,
+        xs: np.ndarray,  # pylint: disable=invalid-name
+        repeats: np.ndarray,
+        ys: Optional[np.ndarray],  # pylint: disable=invalid-name
+    ) -> None:
         import xgboost as xgb  # type: ignore # pylint: disable=import-outside-toplevel
 
-        repeats = [x.shape[0] for x in xs]
-        xs = np.concatenate(xs, axis=0)
-        self.ids = np.concatenate([[i] * repeat for i, repeat in enumerate(repeats)], axis=0)
+        self.ids = np.repeat(np.arange(len(repeats), dtype="int64"), repeats)
         if ys is None:
             self.dmatrix = xgb.DMatrix(data=xs, label=None)
         else:
-            ys = np.concatenate([[y] * repeat for y, repeat in zip(ys, repeats)], axis=0)
+            ys = np.repeat(ys, repeats)
             self.dmatrix = xgb.DMatrix(data=xs, label=ys)
             self.dmatrix.set_weight(ys)
 
@@ -241,6 +274,10 @@ class XGBConfig(NamedTuple):
 class FeatureGroup:
     """Feature group
 
+    The features of all the candidates in a group are stored back to back in a single
+    preallocated float32 matrix, which grows geometrically when it runs out of capacity.
+    Candidate `i` owns rows `offsets[i]` to `offsets[i + 1]` of that matrix.
+
     Parameters
     ----------
     group_hash : str
@@ -254,9 +291,12 @@ class FeatureGroup:
     """
 
     group_hash: str
-    features: List[np.ndarray]
     costs: np.ndarray
     min_cost: float
+    # the growable feature matrix of shape [capacity, feature_size]
+    _buffer: Optional[np.ndarray]
+    # the row offsets of each candidate, of shape [num_candidates + 1]
+    _offsets: np.ndarray
 
     def __init__(
         self,
@@ -265,18 +305,79 @@ class FeatureGroup:
         costs: np.ndarray,
     ) -> None:
         self.group_hash = group_hash
-        self.features = features
-        self.costs = costs
-        self.min_cost = np.min(costs)
+        self.costs = np.zeros((0,), dtype="float32")
+        self.min_cost = float("inf")
+        self._buffer = None
+        self._offsets = np.zeros((1,), dtype="int64")
+        self.append(features, costs)
+
+    @property
+    def features(self) -> List[np.ndarray]:
+        """The per-candidate features, as views into the feature matrix."""
+        if self._buffer is None:
+            return []
+        return np.split(self.matrix, self._offsets[1:-1], axis=0)
+
+    @property
+    def matrix(self) -> np.ndarray:
+        """The features of all the candidates in this group, of shape [num_rows, feature_size]."""
+        assert self._buffer is not None
+        return self._buffer[: self.num_rows]
+
+    @property
+    def num_rows(self) -> int:
+        """The total number of feature rows in this group."""
+        return int(self._offsets[-1])
+
+    @property
+    def num_candidates(self) -> int:
+        """The number of candidates in this group."""
+        return len(self._offsets) - 1
+
+    def rows_per_candidate(self, start: int = 0) -> np.ndarray:
+        """The number of feature rows of each candidate starting from the `start`-th one."""
+        return np.diff(self._offsets[start:])
 
     def append(
         self,
         features: List[np.ndarray],
         costs: np.ndarray,
     ) -> None:
-        self.features.extend(features)
-        self.costs = np.append(self.costs, costs)
-        self.min_cost = np.min(self.costs)
+        """Append a batch of candidates to the group.
+
+        Parameters
+        ----------
+        features : List[np.ndarray]
+            The features of each candidate, each of shape [num_blocks, feature_size]
+        costs : np.ndarray
+            The cost of each candidate
+        """
+        assert len(features) == len(costs)
+        if len(features) == 0:
+            return
+        rows = np.array([x.shape[0] for x in features], dtype="int64")
+        num_rows = self.num_rows
+        new_num_rows = num_rows + int(rows.sum())
+        self._reserve(new_num_rows, features[0].shape[1])
+        assert self._buffer is not None
+        np.concatenate(features, axis=0, out=self._buffer[num_rows:new_num_rows])
+        self._offsets = np.append(self._offsets, num_rows + np.cumsum(rows))
+        self.costs = np.append(self.costs, np.asarray(costs, dtype="float32"))
+        self.min_cost = float(np.min(self.costs))
+
+    def _reserve(self, num_rows: int, feature_size: int) -> None:
+        if self._buffer is None:
+            self._buffer = np.empty((max(num_rows, 64), feature_size), dtype="float32")
+            return
+        assert self._buffer.shape[1] == feature_size, "Feature size mismatch"
+        capacity = self._buffer.shape[0]
+        if num_rows <= capacity:
+            return
+        while capacity < num_rows:
+            capacity *= 2
+        buffer = np.empty((capacity, feature_size), dtype="float32")
+        buffer[: self.num_rows] = self._buffer[: self.num_rows]
+        self._buffer = buffer
 
 
 @derived_object
@@ -298,6 +399,15 @@ class XGBModel(PyCostModel):
         The verbose level when doing evaluation.
     average_peak_n : int
         The number to calculate average peak score.
+    incremental : bool
+        Whether to continue boosting from the existing booster on the newly measured candidates,
+        instead of re-training from scratch on the whole history every update.
+    num_incremental_rounds : int
+        The maximum number of boosting rounds added by an incremental update.
+    full_rebuild_interval : int
+        In incremental mode, the number of updates after which the booster is re-trained from
+        scratch on the whole history, so that the labels normalized by an outdated minimum cost
+        and the accumulated trees do not drift too far.
     """
 
     # feature extractor
@@ -310,10 +420,15 @@ class XGBModel(PyCostModel):
     early_stopping_rounds: int
     verbose_eval: int
     average_peak_n: int
+    # incremental training
+    incremental: bool
+    num_incremental_rounds: int
+    full_rebuild_interval: int
     # states
     data: Dict[str, FeatureGroup]
     data_size: int
     booster: Optional["xgb.Booster"]
+    num_updates_since_rebuild: int
 
     def __init__(
         self,
@@ -328,6 +443,10 @@ class XGBModel(PyCostModel):
         early_stopping_rounds: int = 50,
         verbose_eval: int = 25,
         average_peak_n: int = 32,
+        # incremental training
+        incremental: bool = False,
+        num_incremental_rounds: int = 100,
+        full_rebuild_interval: int = 8,
     ):
         super().__init__()
         # feature extractor
@@ -343,10 +462,16 @@ class XGBModel(PyCostModel):
         self.early_stopping_rounds = early_stopping_rounds
         self.verbose_eval = verbose_eval
         self.average_peak_n = average_peak_n
+        # incremental training
+        assert full_rebuild_interval >= 1, "Full rebuild interval must be at least one!"
+        self.incremental = incremental
+        self.num_incremental_rounds = num_incremental_rounds
+        self.full_rebuild_interval = full_rebuild_interval
         # states
         self.data = OrderedDict()
         self.data_size = 0
         self.booster = None
+        self.num_updates_since_rebuild = 0
 
     def load(self, path: str) -> None:
         """Load the cost model from given file location.
@@ -384,10 +509,11 @@ class XGBModel(PyCostModel):
                 booster = xgb.Booster()
                 booster.load_model(model_path)
             else:
-                self.booster = None
+                booster = None
         self.data = data
         self.data_size = data_size
         self.booster = booster
+        self.num_updates_since_rebuild = 0
 
     def save(self, path: str) -> None:
         """Save the cost model to given file location.
@@ -492,13 +618,33 @@ class XGBModel(PyCostModel):
         self.data_size += len(new_features)
 
         # Step 5. Re-train the model
-        self._train(
-            xs=list(itertools_chain.from_iterable([g.features for g in self.data.values()])),
-            ys=np.concatenate(
-                [g.min_cost / g.costs for g in self.data.values()],
-                axis=0,
-            ),
-        )
+        if (
+            self.incremental
+            and self.booster is not None
+            and self.num_updates_since_rebuild + 1 < self.full_rebuild_interval
+        ):
+            # Continue boosting on the newly measured candidates only
+            repeats = group.rows_per_candidate(group.num_candidates - len(new_features))
+            self._train(
+                d_train=PackSum.from_matrix(
+                    xs=group.matrix[group.num_rows - int(repeats.sum()) :],
+                    repeats=repeats,
+                    ys=group.min_cost / new_mean_costs,
+                ),
+                num_boost_round=self.num_incremental_rounds,
+                xgb_model=self.booster,
+            )
+            self.num_updates_since_rebuild += 1
+        else:
+            groups = list(self.data.values())
+            self._train(
+                d_train=PackSum.from_matrix(
+                    xs=np.concatenate([g.matrix for g in groups], axis=0),
+                    repeats=np.concatenate([g.rows_per_candidate() for g in groups], axis=0),
+                    ys=np.concatenate([g.min_cost / g.costs for g in groups], axis=0),
+                ),
+            )
+            self.num_updates_since_rebuild = 0
 
     def predict(
         self,
@@ -539,12 +685,16 @@ class XGBModel(PyCostModel):
 
     def _train(  # type: ignore # pylint: disable=invalid-name
         self,
-        xs: List[np.ndarray],
-        ys: np.ndarray,
+        d_train: PackSum,
+        num_boost_round: int = 10000,
+        xgb_model: Optional["xgb.Booster"] = None,
     ) -> None:
         import xgboost as xgb  # type: ignore # pylint: disable=import-outside-toplevel
 
-        self.d_train = PackSum(xs=xs, ys=ys)
+        self.d_train = d_train
+        if xgb_model is not None:
+            # Reset the early stopping state left by the previous training
+            xgb_model.set_attr(best_score=None, best_iteration=None, best_msg=None)
 
         def obj(ys_pred: np.ndarray, d_train: "xgb.DMatrix"):  # type: ignore # pylint: disable = unused-argument
             return self.d_train.obj_square_error(ys_pred)
@@ -558,8 +708,9 @@ class XGBModel(PyCostModel):
         self.booster = xgb.train(
             self.config.to_dict(),
             self.d_train.dmatrix,
-            num_boost_round=10000,
+            num_boost_round=num_boost_round,
             obj=obj,
+            xgb_model=xgb_model,
             callbacks=[
                 custom_callback(
                     early_stopping_rounds=self.early_stopping_rounds,
@@ -0,0 +1,235 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""An in-memory database with hashed workload lookup and bounded per-workload records"""
+import heapq
+import itertools
+import json
+import os
+import tempfile
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+from tvm.ir import IRModule, structural_equal, structural_hash
+
+from ..utils import derived_object
+from .database import PyDatabase, TuningRecord, Workload
+
+# The mean run time of records without measurements, as in the JSON database
+MAX_MEAN_TIME = 1e10
+
+
+def _mean_run_sec(record: TuningRecord) -> float:
+    run_secs = [float(run_sec.value) for run_sec in record.run_secs]
+    if not run_secs:
+        return MAX_MEAN_TIME
+    return sum(run_secs) / len(run_secs)
+
+
+class _WorkloadEntry:
+    """The best records of a workload, in memory or spilled to disk"""
+
+    __slots__ = ["workload", "heap", "sorted", "spilled"]
+
+    def __init__(self, workload: Workload) -> None:
+        self.workload = workload
+        # The best records as (-mean run time, -sequence number, record),
+        # so that the worst record is at the top of the heap
+        self.heap: List[Tuple[float, int, TuningRecord]] = []
+        # The records sorted from best to worst, or None when outdated
+        self.sorted: Optional[List[TuningRecord]] = []
+        # The offsets of the records spilled to disk
+        self.spilled: List[int] = []
+
+
+@derived_object
+class MemoryDatabase(PyDatabase):
+    """An in-memory database for tuning processes with many workloads.
+
+    Workloads are bucketed by structural hash, so that committing or looking up a
+    workload only compares it with the workloads of the same hash. Each workload keeps
+    a bounded heap of its best records, and when the records of all workloads exceed
+    the memory cap, those of the least recently used workloads are spilled to disk,
+    and loaded back when the workload is used again. The space of the records loaded
+    back is reclaimed by compacting the spill file once it is mostly unused.
+
+    Parameters
+    ----------
+    max_records_per_workload : int
+        The number of best records kept per workload, which bounds `get_top_k`.
+    max_records_in_memory : int
+        The number of records kept in memory across workloads.
+    spill_path : Optional[str]
+        The file records are spilled to, which must not exist yet and is removed by
+        `close`. A temporary file by default.
+    """
+
+    def __init__(
+        self,
+        max_records_per_workload: int = 256,
+        max_records_in_memory: int = 1000000,
+        spill_path: Optional[str] = None,
+    ) -> None:
+        super().__init__()
+        self.max_records_per_workload = max_records_per_workload
+        self.max_records_in_memory = max_records_in_memory
+        self.spill_path = spill_path
+        self._spill_file = None
+        # The bytes written to the spill file, and those of the records loaded back
+        self._spill_size = 0
+        self._spill_unused = 0
+        # structural hash -> entries
+        self._buckets: Dict[int, List[_WorkloadEntry]] = {}
+        # workload -> entry, in least recently used order
+        self._entries: "OrderedDict[Workload, _WorkloadEntry]" = OrderedDict()
+        self._num_records = 0
+        self._num_in_memory = 0
+        self._seq = itertools.count()
+
+    def _find(self, mod: IRModule) -> Optional[_WorkloadEntry]:
+        for entry in self._buckets.get(structural_hash(mod), []):
+            if structural_equal(entry.workload.mod, mod):
+                return entry
+        return None
+
+    def _entry(self, workload: Workload) -> Optional[_WorkloadEntry]:
+        entry = self._entries.get(workload)
+        if entry is None:
+            entry = self._find(workload.mod)
+        if entry is not None:
+            self._entries.move_to_end(entry.workload)
+            self._load(entry)
+        return entry
+
+    def has_workload(self, mod: IRModule) -> bool:
+        return self._find(mod) is not None
+
+    def commit_workload(self, mod: IRModule) -> Workload:
+        entry = self._find(mod)
+        if entry is None:
+            entry = _WorkloadEntry(Workload(mod))
+            self._buckets.setdefault(structural_hash(mod), []).append(entry)
+            self._entries[entry.workload] = entry
+        return entry.workload
+
+    def commit_tuning_record(self, record: TuningRecord) -> None:
+        entry = self._entry(record.workload)
+        if entry is None:
+            raise ValueError("The workload of the tuning record is not in the database")
+        self._num_records += 1
+        item = (-_mean_run_sec(record), -next(self._seq), record)
+        if len(entry.heap) < self.max_records_per_workload:
+            heapq.heappush(entry.heap, item)
+            self._num_in_memory += 1
+        elif item[:2] > entry.heap[0][:2]:
+            heapq.heapreplace(entry.heap, item)
+        else:
+            return
+        entry.sorted = None
+        self._spill()
+
+    def get_top_k(self, workload: Workload, top_k: int) -> List[TuningRecord]:
+        if top_k < 0:
+            raise ValueError("top_k must be non-negative")
+        entry = self._entry(workload)
+        if entry is None:
+            return []
+        if entry.sorted is None:
+            entry.sorted = [
+                item[2] for item in sorted(entry.heap, key=lambda x: x[:2], reverse=True)
+            ]
+        return entry.sorted[: int(top_k)]
+
+    def __len__(self) -> int:
+        return self._num_records
+
+    def close(self) -> None:
+        """Close and remove the spill file, dropping the records spilled to it"""
+        if self._spill_file is None:
+            return
+        self._spill_file.close()
+        self._spill_file = None
+        if self.spill_path is not None:
+            os.remove(self.spill_path)
+        for entry in self._entries.values():
+            entry.spilled = []
+        self._spill_size = self._spill_unused = 0
+
+    def _open_spill_file(self, path: Optional[str]):
+        if path is None:
+            return tempfile.TemporaryFile("w+")
+        return open(path, "x+")
+
+    def _compact(self) -> None:
+        """Rewrite the spill file with only the records that are still spilled"""
+        tmp_path = None if self.spill_path is None else self.spill_path + ".compact"
+        spill_file = self._open_spill_file(tmp_path)
+        for entry in self._entries.values():
+            offsets = []
+            for offset in entry.spilled:
+                self._spill_file.seek(offset)
+                offsets.append(spill_file.tell())
+                spill_file.write(self._spill_file.readline())
+            entry.spilled = offsets
+        self._spill_file.close()
+        if tmp_path is not None:
+            os.replace(tmp_path, self.spill_path)
+        self._spill_file = spill_file
+        self._spill_size = spill_file.tell()
+        self._spill_unused = 0
+
+    def _spill(self) -> None:
+        """Spill the records of the least recently used workloads to disk"""
+        if self._num_in_memory <= self.max_records_in_memory:
+            return
+        # The most recently used workload stays in memory
+        for entry in list(self._entries.values())[:-1]:
+            if self._num_in_memory <= self.max_records_in_memory:
+                break
+            if not entry.heap:
+                continue
+            if self._spill_file is None:
+                self._spill_file = self._open_spill_file(self.spill_path)
+            elif self._spill_unused * 2 > self._spill_size:
+                self._compact()
+            self._spill_file.seek(0, 2)
+            for neg_mean, neg_seq, record in entry.heap:
+                entry.spilled.append(self._spill_file.tell())
+                self._spill_file.write(json.dumps([neg_mean, neg_seq, record.as_json()]) + "\n")
+            self._spill_size = self._spill_file.tell()
+            self._num_in_memory -= len(entry.heap)
+            entry.heap = []
+            entry.sorted = None
+        if self._spill_file is not None:
+            self._spill_file.flush()
+
+    def _load(self, entry: _WorkloadEntry) -> None:
+        """Load the spilled records of a workload back to memory"""
+        if not entry.spilled:
+            return
+        for offset in entry.spilled:
+            self._spill_file.seek(offset)
+            line = self._spill_file.readline()
+            self._spill_unused += len(line)
+            neg_mean, neg_seq, record_json = json.loads(line)
+            entry.heap.append(
+                (neg_mean, neg_seq, TuningRecord.from_json(record_json, entry.workload))
+            )
+        heapq.heapify(entry.heap)
+        self._num_in_memory += len(entry.spilled)
+        entry.spilled = []
+        entry.sorted = None
+        self._spill()
@@ -0,0 +1,263 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""A database that stores tuning records in SQLite, safe for concurrent tuning processes"""
+import argparse
+import json
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Tuple
+
+from tvm.ir import IRModule, structural_equal, structural_hash
+
+from ..utils import derived_object
+from .database import PyDatabase, TuningRecord, Workload
+
+# The mean run time of records without measurements, as in the JSON database
+MAX_MEAN_TIME = 1e10
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS workloads (
+    id INTEGER PRIMARY KEY,
+    shash INTEGER NOT NULL,
+    json TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS workloads_by_shash ON workloads (shash);
+CREATE TABLE IF NOT EXISTS tuning_records (
+    id INTEGER PRIMARY KEY,
+    workload_id INTEGER NOT NULL REFERENCES workloads (id),
+    mean_run_sec REAL NOT NULL,
+    json TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS tuning_records_by_run_sec
+    ON tuning_records (workload_id, mean_run_sec);
+"""
+
+
+def _mean_run_sec(record: TuningRecord) -> float:
+    run_secs = [float(run_sec.value) for run_sec in record.run_secs]
+    if not run_secs:
+        return MAX_MEAN_TIME
+    return sum(run_secs) / len(run_secs)
+
+
+@derived_object
+class SQLiteDatabase(PyDatabase):
+    """A database that stores workloads and tuning records in a SQLite file.
+
+    Workloads are indexed by structural hash, and tuning records by workload and mean
+    run time, so `get_top_k` reads only the records it returns. The file uses
+    write-ahead logging, so that several tuning processes can share one database.
+
+    Parameters
+    ----------
+    path : str
+        The path to the SQLite file, created if missing.
+    timeout : float
+        How many seconds to wait for the write lock held by another process.
+    """
+
+    path: str
+
+    def __init__(self, path: str, timeout: float = 60.0) -> None:
+        super().__init__()
+        self.path = path
+        # Autocommit mode, transactions are explicit
+        self._conn = sqlite3.connect(
+            path, timeout=timeout, check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+        # Workloads loaded by this process: structural hash -> [(id, workload)]
+        self._workloads: Dict[int, List[Tuple[int, Workload]]] = {}
+
+    @contextmanager
+    def _transaction(self):
+        """A transaction that holds the write lock of the file from its start"""
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
+
+    def _find_workload(self, mod: IRModule, shash: int) -> Optional[Tuple[int, Workload]]:
+        """Find the id and the workload of a module, loading new workloads of its hash"""
+        known = self._workloads.setdefault(shash, [])
+        for workload_id, workload in known:
+            if structural_equal(workload.mod, mod):
+                return workload_id, workload
+        known_ids = [workload_id for workload_id, _ in known]
+        rows = self._conn.execute(
+            "SELECT id, json FROM workloads WHERE shash = ? AND id NOT IN (%s)"
+            % ",".join("?" * len(known_ids)),
+            [shash] + known_ids,
+        ).fetchall()
+        result = None
+        for workload_id, workload_json in rows:
+            workload = Workload.from_json(json.loads(workload_json))
+            known.append((workload_id, workload))
+            if result is None and structural_equal(workload.mod, mod):
+                result = workload_id, workload
+        return result
+
+    def _workload_id(self, workload: Workload) -> int:
+        for workload_id, known in self._workloads.get(structural_hash(workload.mod), []):
+            if known.same_as(workload):
+                return workload_id
+        found = self._find_workload(workload.mod, structural_hash(workload.mod))
+        if found is None:
+            raise ValueError("The workload is not in the database")
+        return found[0]
+
+    def has_workload(self, mod: IRModule) -> bool:
+        with self._lock:
+            return self._find_workload(mod, structural_hash(mod)) is not None
+
+    def commit_workload(self, mod: IRModule) -> Workload:
+        shash = structural_hash(mod)
+        with self._lock:
+            found = self._find_workload(mod, shash)
+            if found is not None:
+                return found[1]
+            # Check again under the write lock, so that concurrent processes
+            # do not insert the same workload twice
+            with self._transaction():
+                found = self._find_workload(mod, shash)
+                if found is None:
+                    workload = Workload(mod)
+                    cursor = self._conn.execute(
+                        "INSERT INTO workloads (shash, json) VALUES (?, ?)",
+                        (shash, json.dumps(workload.as_json())),
+                    )
+                    self._workloads[shash].append((cursor.lastrowid, workload))
+                    found = cursor.lastrowid, workload
+            return found[1]
+
+    def commit_tuning_record(self, record: TuningRecord) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO tuning_records (workload_id, mean_run_sec, json) VALUES (?, ?, ?)",
+                (
+                    self._workload_id(record.workload),
+                    _mean_run_sec(record),
+                    json.dumps(record.as_json()),
+                ),
+            )
+
+    def get_top_k(self, workload: Workload, top_k: int) -> List[TuningRecord]:
+        if top_k < 0:
+            raise ValueError("top_k must be non-negative")
+        with self._lock:
+            try:
+                workload_id = self._workload_id(workload)
+            except ValueError:
+                return []
+            cursor = self._conn.execute(
+                "SELECT json FROM tuning_records WHERE workload_id = ? "
+                "ORDER BY mean_run_sec, id LIMIT ?",
+                (workload_id, int(top_k)),
+            )
+            return [
+                TuningRecord.from_json(json.loads(record_json), workload)
+                for (record_json,) in cursor
+            ]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM tuning_records").fetchone()[0]
+
+    def import_json(self, path_workload: str, path_tuning_record: str) -> None:
+        """Import the workloads and tuning records of a JSONDatabase.
+
+        Parameters
+        ----------
+        path_workload : str
+            The path to the workload table.
+        path_tuning_record : str
+            The path to the tuning record table.
+        """
+        workloads = []
+        with open(path_workload, "r") as infile:
+            for line in infile:
+                if line.strip():
+                    workloads.append(self.commit_workload(Workload.from_json(json.loads(line)).mod))
+        with self._lock, self._transaction(), open(path_tuning_record, "r") as infile:
+            for line in infile:
+                if not line.strip():
+                    continue
+                workload_index, record_json = json.loads(line)
+                workload = workloads[workload_index]
+                record = TuningRecord.from_json(record_json, workload)
+                self._conn.execute(
+                    "INSERT INTO tuning_records (workload_id, mean_run_sec, json) VALUES (?, ?, ?)",
+                    (self._workload_id(workload), _mean_run_sec(record), json.dumps(record_json)),
+                )
+
+    def export_json(self, path_workload: str, path_tuning_record: str) -> None:
+        """Export the workloads and tuning records to the files of a JSONDatabase.
+
+        Parameters
+        ----------
+        path_workload : str
+            The path to the workload table.
+        path_tuning_record : str
+            The path to the tuning record table.
+        """
+        with self._lock:
+            index = {}
+            with open(path_workload, "w") as outfile:
+                for workload_id, workload_json in self._conn.execute(
+                    "SELECT id, json FROM workloads ORDER BY id"
+                ):
+                    index[workload_id] = len(index)
+                    outfile.write(workload_json + "\n")
+            with open(path_tuning_record, "w") as outfile:
+                for workload_id, record_json in self._conn.execute(
+                    "SELECT workload_id, json FROM tuning_records ORDER BY id"
+                ):
+                    outfile.write("[%d, %s]\n" % (index[workload_id], record_json))
+
+    def close(self) -> None:
+        """Close the connection to the database file."""
+        with self._lock:
+            self._conn.close()
+
+
+def main():
+    """Convert between the files of a JSONDatabase and a SQLiteDatabase."""
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument("command", choices=["import", "export"])
+    parser.add_argument("--sqlite", type=str, required=True, help="the SQLite database file")
+    parser.add_argument("--workload", type=str, required=True, help="the JSON workload table")
+    parser.add_argument(
+        "--tuning-record", type=str, required=True, help="the JSON tuning record table"
+    )
+    args = parser.parse_args()
+    database = SQLiteDatabase(args.sqlite)
+    if args.command == "import":
+        database.import_json(args.workload, args.tuning_record)
+    else:
+        database.export_json(args.workload, args.tuning_record)
+    database.close()
+
+
+if __name__ == "__main__":
+    main()
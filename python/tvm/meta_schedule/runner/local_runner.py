@@ -16,13 +16,14 @@
 # under the License.
 """Local Runner"""
 import logging
+from collections import OrderedDict
 from contextlib import contextmanager
-from typing import Callable, List, Optional, Union
+from typing import Any, Callable, List, Optional, Tuple, Union
 
 import tvm
 
 from ...contrib.popen_pool import PopenPoolExecutor
-from ...runtime import Device, Module
+from ...runtime import DataType, Device, Module, NDArray
 from ..utils import derived_object, get_global_func_with_default_on_worker
 from .config import EvaluatorConfig
 from .runner import PyRunner, RunnerFuture, RunnerInput, RunnerResult, PyRunnerFuture
@@ -113,6 +114,59 @@ class LocalRunnerFuture(PyRunnerFuture):
         return RunnerResult(self.res, self.error_message)
 
 
+class _ArgumentCache:
+    """An LRU cache of allocated arguments, resident in a worker process
+
+    Parameters
+    ----------
+    max_bytes: int
+        The memory budget of the cache in bytes.
+    """
+
+    max_bytes: int
+    num_bytes: int
+    entries: "OrderedDict[Tuple[str, str, int], Tuple[List[T_ARGUMENT_LIST], int]]"
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self.num_bytes = 0
+        self.entries = OrderedDict()
+
+    def get(
+        self,
+        key: Tuple[str, str, int],
+        f_alloc: Callable[[], List[T_ARGUMENT_LIST]],
+    ) -> List[T_ARGUMENT_LIST]:
+        """Get the arguments of the given key, allocating them on a miss"""
+        entry = self.entries.get(key, None)
+        if entry is not None:
+            self.entries.move_to_end(key)
+            return entry[0]
+        repeated_args = f_alloc()
+        num_bytes = sum(_nbytes(arg) for args in repeated_args for arg in args)
+        if num_bytes <= self.max_bytes:
+            while self.num_bytes + num_bytes > self.max_bytes:
+                _, (_, evicted_bytes) = self.entries.popitem(last=False)
+                self.num_bytes -= evicted_bytes
+            self.entries[key] = (repeated_args, num_bytes)
+            self.num_bytes += num_bytes
+        return repeated_args
+
+
+def _nbytes(arg: Any) -> int:
+    if not isinstance(arg, NDArray):
+        return 0
+    dtype = DataType(arg.dtype)
+    num_elements = 1
+    for dim in arg.shape:
+        num_elements *= int(dim)
+    return num_elements * ((dtype.bits * dtype.lanes + 7) // 8)
+
+
+# The cache of allocated arguments of this worker process, if enabled
+_ARGUMENT_CACHE: Optional[_ArgumentCache] = None
+
+
 def _worker_func(
     _f_alloc_argument: Optional[str],
     _f_run_evaluator: Optional[str],
@@ -122,7 +176,10 @@ def _worker_func(
     artifact_path: str,
     device_type: str,
     args_info: T_ARG_INFO_JSON_OBJ_LIST,
+    arg_cache_bytes: int = 0,
 ) -> List[float]:
+    global _ARGUMENT_CACHE  # pylint: disable=global-statement,invalid-name
+
     f_alloc_argument: T_ALLOC_ARGUMENT = get_global_func_with_default_on_worker(
         _f_alloc_argument, default_alloc_argument
     )
@@ -144,12 +201,20 @@ def _worker_func(
         rt_mod = tvm.runtime.load_module(artifact_path)
         # Step 2: create the local device
         device = tvm.runtime.device(dev_type=device_type, dev_id=0)
-        # Step 3: Allocate input arguments
-        repeated_args: List[T_ARGUMENT_LIST] = f_alloc_argument(
-            device,
-            args_info,
-            alloc_repeat,
-        )
+        # Step 3: Allocate input arguments, or reuse the cached ones
+        if arg_cache_bytes > 0:
+            if _ARGUMENT_CACHE is None or _ARGUMENT_CACHE.max_bytes != arg_cache_bytes:
+                _ARGUMENT_CACHE = _ArgumentCache(arg_cache_bytes)
+            repeated_args: List[T_ARGUMENT_LIST] = _ARGUMENT_CACHE.get(
+                (str(args_info), str(device), alloc_repeat),
+                lambda: f_alloc_argument(device, args_info, alloc_repeat),
+            )
+        else:
+            repeated_args = f_alloc_argument(
+                device,
+                args_info,
+                alloc_repeat,
+            )
         # Step 4: Run time_evaluator
         costs: List[float] = f_run_evaluator(
             rt_mod,
@@ -178,6 +243,8 @@ class LocalRunner(PyRunner):
         The function name to run the evaluator or the function itself.
     f_cleanup: Optional[str, Callable]
         The function name to cleanup the session or the function itself.
+    arg_cache_mb: float
+        The memory budget in MB of the allocated arguments cached in the worker.
     pool: PopenPoolExecutor
         The popen pool executor.
 
@@ -215,6 +282,14 @@ class LocalRunner(PyRunner):
 
         def default_cleanup() -> None:
             ...
+
+    Note
+    ----
+    The worker process is kept alive across `run` calls, until a candidate times out. With a
+    positive `arg_cache_mb`, the arguments allocated by `f_alloc_argument` are cached in the
+    worker, keyed by the `args_info`, the device and `alloc_repeat`, and are reused by the
+    following candidates of the same workload. The least recently used entries are evicted to
+    keep the cache within the budget.
     """
 
     timeout_sec: float
@@ -225,6 +300,7 @@ class LocalRunner(PyRunner):
     f_alloc_argument: Union[T_ALLOC_ARGUMENT, str, None]
     f_run_evaluator: Union[T_RUN_EVALUATOR, str, None]
     f_cleanup: Union[T_CLEANUP, str, None]
+    arg_cache_mb: float
 
     pool: PopenPoolExecutor
 
@@ -238,6 +314,7 @@ class LocalRunner(PyRunner):
         f_run_evaluator: Union[T_RUN_EVALUATOR, str, None] = None,
         f_cleanup: Union[T_CLEANUP, str, None] = None,
         initializer: Optional[Callable[[], None]] = None,
+        arg_cache_mb: float = 0.0,
     ) -> None:
         """Constructor
 
@@ -259,6 +336,9 @@ class LocalRunner(PyRunner):
             The function name to cleanup the session or the function itself.
         initializer: Optional[Callable[[], None]]
             The initializer function.
+        arg_cache_mb: float
+            The memory budget in MB of the allocated arguments cached in the worker.
+            Defaults to 0, which disables the cache.
         """
         super().__init__()
         self.timeout_sec = timeout_sec
@@ -268,6 +348,7 @@ class LocalRunner(PyRunner):
         self.f_alloc_argument = f_alloc_argument
         self.f_run_evaluator = f_run_evaluator
         self.f_cleanup = f_cleanup
+        self.arg_cache_mb = arg_cache_mb
 
         logger.info("LocalRunner: max_workers = 1")
         self.pool = PopenPoolExecutor(
@@ -290,6 +371,7 @@ class LocalRunner(PyRunner):
                 str(runner_input.artifact_path),
                 str(runner_input.device_type),
                 tuple(arg_info.as_json() for arg_info in runner_input.args_info),
+                int(self.arg_cache_mb * 1024 * 1024),
             )
             try:
                 result: List[float] = future.result()
@@ -18,8 +18,10 @@
 import logging
 import concurrent.futures
 import os.path as osp
+import time
+import uuid
 from contextlib import contextmanager
-from typing import Callable, List, Optional, Union
+from typing import Callable, Dict, List, Optional, Tuple, Union
 
 from tvm.contrib.popen_pool import PopenPoolExecutor
 from tvm.rpc import RPCSession
@@ -154,6 +156,10 @@ class RPCRunner(PyRunner):
         The function name to run the evaluator or the function itself.
     f_cleanup: Optional[str, Callable]
         The function name to cleanup the session or the function itself.
+    max_session_uses: int
+        The maximum number of candidates measured by a single RPC session.
+    session_lifetime_sec: Optional[float]
+        The lifetime in seconds requested for an RPC session that is reused.
     pool: PopenPoolExecutor
         The popen pool executor.
 
@@ -216,6 +222,17 @@ class RPCRunner(PyRunner):
             remote_path: Optional[str],
         ) -> None:
             ...
+
+    Note
+    ----
+    By default, every candidate is measured in a fresh RPC session. With `max_session_uses`
+    greater than one, each worker keeps its session to the tracker key alive and measures up to
+    `max_session_uses` candidates in it, and the arguments allocated for a candidate are reused
+    by the next one if their `args_info` matches. The session is requested with a lifetime of
+    `session_lifetime_sec` and is retired before it expires; it is also dropped as soon as a
+    candidate fails in it, so that the failure of a candidate never affects the next ones.
+    `f_cleanup` is called when a session retires, while the artifacts of the other candidates
+    are removed from the remote as soon as they have been measured.
     """
 
     rpc_config: RPCConfig
@@ -229,6 +246,9 @@ class RPCRunner(PyRunner):
     f_run_evaluator: Union[T_RUN_EVALUATOR, str, None]
     f_cleanup: Union[T_CLEANUP, str, None]
 
+    max_session_uses: int
+    session_lifetime_sec: Optional[float]
+
     pool: PopenPoolExecutor
 
     def __init__(
@@ -244,6 +264,8 @@ class RPCRunner(PyRunner):
         f_cleanup: Union[T_CLEANUP, str, None] = None,
         max_workers: int = 1,
         initializer: Optional[Callable[[], None]] = None,
+        max_session_uses: int = 1,
+        session_lifetime_sec: Optional[float] = None,
     ) -> None:
         """Constructor
 
@@ -271,6 +293,12 @@ class RPCRunner(PyRunner):
             The maximum number of connections. Defaults to 1.
         initializer: Optional[Callable[[], None]]
             The initializer function.
+        max_session_uses: int = 1
+            The maximum number of candidates measured by a single RPC session.
+            Defaults to 1, i.e. a new session for every candidate.
+        session_lifetime_sec: Optional[float] = None
+            The lifetime in seconds requested for an RPC session that is reused.
+            Defaults to `max_session_uses` times the session timeout.
         """
         super().__init__()
         self.rpc_config = RPCConfig._normalized(rpc_config)
@@ -282,6 +310,12 @@ class RPCRunner(PyRunner):
         self.f_alloc_argument = f_alloc_argument
         self.f_run_evaluator = f_run_evaluator
         self.f_cleanup = f_cleanup
+        if max_session_uses < 1:
+            raise ValueError(f"max_session_uses must be positive, but got {max_session_uses}")
+        self.max_session_uses = max_session_uses
+        if session_lifetime_sec is None:
+            session_lifetime_sec = self.rpc_config.session_timeout_sec * max_session_uses
+        self.session_lifetime_sec = session_lifetime_sec
         logger.info("RPCRunner: max_workers = %d", max_workers)
         self.pool = PopenPoolExecutor(
             max_workers=max_workers,
@@ -307,6 +341,8 @@ class RPCRunner(PyRunner):
                     str(runner_input.artifact_path),
                     str(runner_input.device_type),
                     tuple(arg_info.as_json() for arg_info in runner_input.args_info),
+                    self.max_session_uses,
+                    self.session_lifetime_sec,
                 ),
                 timeout_sec=self.rpc_config.session_timeout_sec,
             )
@@ -350,6 +386,8 @@ def _worker_func(
     artifact_path: str,
     device_type: str,
     args_info: T_ARG_INFO_JSON_OBJ_LIST,
+    max_session_uses: int = 1,
+    session_lifetime_sec: Optional[float] = None,
 ) -> List[float]:
     # Step 0. Get the registered functions
     f_create_session: T_CREATE_SESSION = get_global_func_with_default_on_worker(
@@ -365,6 +403,22 @@ def _worker_func(
         _f_run_evaluator, default_run_evaluator
     )
     f_cleanup: T_CLEANUP = get_global_func_with_default_on_worker(_f_cleanup, default_cleanup)
+    if max_session_uses > 1:
+        return _pooled_worker_func(
+            f_create_session,
+            f_upload_module,
+            f_alloc_argument,
+            f_run_evaluator,
+            f_cleanup,
+            rpc_config,
+            evaluator_config,
+            alloc_repeat,
+            artifact_path,
+            device_type,
+            args_info,
+            max_session_uses,
+            session_lifetime_sec,
+        )
     # Managed resources
     session: Optional[RPCSession] = None
     remote_path: Optional[str] = None
@@ -403,6 +457,110 @@ def _worker_func(
     return costs
 
 
+class _PooledSession:
+    """An RPC session kept alive in a worker process across candidates"""
+
+    session: RPCSession
+    remaining_uses: int
+    expire_time: float
+    remote_path: Optional[str]
+    args_key: Optional[Tuple[str, str, int]]
+    repeated_args: Optional[List[T_ARGUMENT_LIST]]
+
+    def __init__(self, session: RPCSession, max_uses: int, lifetime_sec: float) -> None:
+        self.session = session
+        self.remaining_uses = max_uses
+        self.expire_time = time.time() + lifetime_sec
+        self.remote_path = None
+        self.args_key = None
+        self.repeated_args = None
+
+    def close(self, f_cleanup: T_CLEANUP) -> None:
+        self.repeated_args = None
+        try:
+            f_cleanup(self.session, self.remote_path)
+        except Exception:  # pylint: disable=broad-except
+            logger.warning("RPCRunner: Failed to clean up a retired session", exc_info=True)
+
+
+# The RPC sessions alive in this worker process, keyed by tracker host, port and key
+_SESSION_POOL: Dict[Tuple[Optional[str], Union[None, int, str], Optional[str]], _PooledSession] = {}
+
+
+def _pooled_worker_func(
+    f_create_session: T_CREATE_SESSION,
+    f_upload_module: T_UPLOAD_MODULE,
+    f_alloc_argument: T_ALLOC_ARGUMENT,
+    f_run_evaluator: T_RUN_EVALUATOR,
+    f_cleanup: T_CLEANUP,
+    rpc_config: RPCConfig,
+    evaluator_config: EvaluatorConfig,
+    alloc_repeat: int,
+    artifact_path: str,
+    device_type: str,
+    args_info: T_ARG_INFO_JSON_OBJ_LIST,
+    max_session_uses: int,
+    session_lifetime_sec: Optional[float],
+) -> List[float]:
+    if session_lifetime_sec is None:
+        session_lifetime_sec = rpc_config.session_timeout_sec * max_session_uses
+    # Step 1. Take a session out of the pool, or create one
+    key = (rpc_config.tracker_host, rpc_config.tracker_port, rpc_config.tracker_key)
+    pooled = _SESSION_POOL.pop(key, None)
+    if pooled is not None and (
+        pooled.remaining_uses <= 0
+        or time.time() + rpc_config.session_timeout_sec > pooled.expire_time
+    ):
+        # Retire the session before it runs out of uses or time
+        pooled.close(f_cleanup)
+        pooled = None
+    if pooled is None:
+        session = f_create_session(
+            rpc_config._replace(session_timeout_sec=int(session_lifetime_sec))
+        )
+        pooled = _PooledSession(session, max_session_uses, session_lifetime_sec)
+    pooled.remaining_uses -= 1
+    session = pooled.session
+    succeeded = False
+    try:
+        device = session.device(dev_type=device_type, dev_id=0)
+        # Step 2. Upload the module under a unique name, so that it never aliases a module
+        # previously loaded in the same session
+        remote_path = uuid.uuid4().hex + "_" + osp.basename(artifact_path)
+        pooled.remote_path = remote_path
+        rt_mod: Module = f_upload_module(session, artifact_path, remote_path)
+        # Step 3: Allocate input arguments, or reuse the ones of the previous candidate
+        args_key = (device_type, str(args_info), alloc_repeat)
+        if pooled.args_key != args_key or pooled.repeated_args is None:
+            pooled.args_key = None
+            pooled.repeated_args = f_alloc_argument(
+                session,
+                device,
+                args_info,
+                alloc_repeat,
+            )
+            pooled.args_key = args_key
+        # Step 4: Run time_evaluator
+        costs: List[float] = f_run_evaluator(
+            session,
+            rt_mod,
+            device,
+            evaluator_config,
+            pooled.repeated_args,
+        )
+        # Step 5: Remove the artifact, while keeping the session alive
+        del rt_mod
+        session.remove(remote_path)
+        session.remove(remote_path + ".so")
+        succeeded = True
+    finally:
+        if succeeded and pooled.remaining_uses > 0:
+            _SESSION_POOL[key] = pooled
+        else:
+            pooled.close(f_cleanup)
+    return costs
+
+
 def default_create_session(rpc_config: RPCConfig) -> RPCSession:
     """Default function to create the session
 
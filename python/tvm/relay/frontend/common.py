@@ -18,6 +18,8 @@
 """Common utilities"""
 from __future__ import absolute_import as _abs
 import logging
+from collections import OrderedDict
+
 import numpy as np
 
 import tvm
@@ -486,8 +488,76 @@ def get_name(node):
     return name
 
 
+class IncrementalTypeInference(object):
+    """A scope in which :code:`infer_type` and :code:`infer_shape` check only the parts
+    of an expression that have not been checked yet.
+
+    Without it, every call wraps the whole expression built so far into a new module and
+    reruns InferType, which makes converting a graph node by node quadratic in its size.
+    Within the scope, the checked type is kept on each queried node, and later queries
+    stop at the sub-expressions whose types are known (see :code:`InferTypeLocal`).
+    Queries with a module, and expressions that cannot be checked without one, use full
+    type inference as before.
+
+    Parameters
+    ----------
+    enabled : bool
+        Whether to use incremental type inference in the scope.
+
+    Attributes
+    ----------
+    num_incremental : int
+        The number of queries answered incrementally.
+
+    num_fallback : int
+        The number of queries that fell back to full type inference.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        with IncrementalTypeInference():
+            out = converter(inputs)
+            shape = infer_shape(out)
+    """
+
+    current = None
+
+    def __init__(self, enabled=True):
+        self.enabled = enabled
+        self.num_incremental = 0
+        self.num_fallback = 0
+
+    def __enter__(self):
+        self._old_scope = IncrementalTypeInference.current
+        IncrementalTypeInference.current = self if self.enabled else None
+        return self
+
+    def __exit__(self, ptype, value, trace):
+        IncrementalTypeInference.current = self._old_scope
+
+    def infer_type(self, node):
+        """Infer the type of the node in place, or return None if it needs a module."""
+        if isinstance(node, _function.Function):
+            self.num_fallback += 1
+            return None
+        try:
+            _transform.InferTypeLocal(node)
+        except tvm.error.TVMError:
+            self.num_fallback += 1
+            return None
+        self.num_incremental += 1
+        return node
+
+
 def infer_type(node, mod=None):
     """A method to infer the type of an intermediate node in the relay graph."""
+    scope = IncrementalTypeInference.current
+    if scope is not None and mod is None:
+        ret = scope.infer_type(node)
+        if ret is not None:
+            return ret
+
     if isinstance(mod, IRModule):
         mod["main"] = _function.Function(tvm.relay.analysis.free_vars(node), node)
         mod = _transform.InferType()(mod)
@@ -532,28 +602,183 @@ def infer_shape(inputs, mod=None):
     return checked_type
 
 
+class InferValueCache(object):
+    """A scope in which :code:`infer_value` reuses the executors it has compiled.
+
+    Frontends evaluate many small shape computations with :code:`infer_value`, and
+    the same subgraph often reappears with different inputs. Within the scope, the
+    compiled executors are cached by the structural hash of the evaluated function,
+    and their inputs are set at run time instead of being bound as constants.
+
+    Parameters
+    ----------
+    max_size : int
+        The maximum number of cached executors.
+
+    Attributes
+    ----------
+    num_numpy : int
+        The number of values computed with NumPy, without building.
+
+    num_folded : int
+        The number of values computed by constant folding, without building.
+
+    num_cache_hits : int
+        The number of values computed by a cached executor.
+
+    num_builds : int
+        The number of executors built.
+    """
+
+    current = None
+
+    def __init__(self, max_size=256):
+        self.max_size = max_size
+        # OrderedDict[structural hash, List[Tuple[Function, GraphModule]]]
+        self._executors = OrderedDict()
+        self.num_numpy = 0
+        self.num_folded = 0
+        self.num_cache_hits = 0
+        self.num_builds = 0
+
+    @property
+    def num_builds_avoided(self):
+        """The number of values computed without building an executor."""
+        return self.num_numpy + self.num_folded + self.num_cache_hits
+
+    def __enter__(self):
+        self._old_scope = InferValueCache.current
+        InferValueCache.current = self
+        return self
+
+    def __exit__(self, ptype, value, trace):
+        InferValueCache.current = self._old_scope
+        logger.debug(
+            "infer_value: %d builds, %d builds avoided (%d numpy, %d folded, %d cache hits)",
+            self.num_builds,
+            self.num_builds_avoided,
+            self.num_numpy,
+            self.num_folded,
+            self.num_cache_hits,
+        )
+
+    def get(self, func):
+        """Get the cached executor of a structurally equal function, or None."""
+        key = tvm.ir.structural_hash(func)
+        for other, executor in self._executors.get(key, []):
+            if tvm.ir.structural_equal(func, other):
+                self._executors.move_to_end(key)
+                self.num_cache_hits += 1
+                return executor
+        return None
+
+    def add(self, func, executor):
+        """Cache the executor of a function."""
+        key = tvm.ir.structural_hash(func)
+        self._executors.setdefault(key, []).append((func, executor))
+        self._executors.move_to_end(key)
+        while len(self._executors) > self.max_size:
+            self._executors.popitem(last=False)
+
+
+def _evaluate_with_numpy(expr, params):
+    """Evaluate simple shape computations, e.g. shape_of -> take -> concatenate,
+    with NumPy. Return None if the expression is not supported."""
+    if isinstance(expr, _expr.Constant):
+        return expr.data.numpy()
+    if isinstance(expr, _expr.Var):
+        value = params[expr.name_hint]
+        return value.numpy() if isinstance(value, tvm.nd.NDArray) else np.asarray(value)
+    if not isinstance(expr, _expr.Call) or not isinstance(expr.op, tvm.ir.Op):
+        return None
+
+    op_name = expr.op.name
+    if op_name == "shape_of":
+        ttype = infer_type(expr.args[0]).checked_type
+        if not isinstance(ttype, _ty.TensorType) or _ty.is_dynamic(ttype):
+            return None
+        return np.array(get_const_tuple(ttype.shape), dtype=str(expr.attrs.dtype))
+
+    if op_name == "concatenate":
+        if not isinstance(expr.args[0], _expr.Tuple):
+            return None
+        fields = [_evaluate_with_numpy(field, params) for field in expr.args[0].fields]
+        if any(field is None for field in fields):
+            return None
+        return np.concatenate(fields, axis=int(expr.attrs.axis))
+
+    args = [_evaluate_with_numpy(arg, params) for arg in expr.args]
+    if any(arg is None for arg in args):
+        return None
+    if op_name == "cast":
+        return args[0].astype(str(expr.attrs.dtype))
+    if op_name == "take" and expr.attrs.mode == "clip" and int(expr.attrs.batch_dims) == 0:
+        axis = None if expr.attrs.axis is None else int(expr.attrs.axis)
+        return np.take(args[0], args[1], axis=axis, mode="clip")
+    return None
+
+
 def infer_value(input_val, params, mod=None):
     """A hack for getting the value of an expression by evaluating a
     portion of the relay graph. This is often needed for functions that
     whose output shape depends on the value of a tensor.
+
+    Simple shape computations and constant expressions are evaluated without
+    building. Within an :code:`InferValueCache` scope, compiled executors are reused.
     """
+    cache = InferValueCache.current
+    # The shapes of statically shaped graph inputs are known without their values,
+    # so try NumPy before requiring all free variables to be in params.
+    try:
+        value = _evaluate_with_numpy(input_val, params)
+    except Exception:
+        value = None
+    if value is not None:
+        if cache is not None:
+            cache.num_numpy += 1
+        return tvm.nd.array(value)
+
     # Check that all free variables have associated parameters.
+    free_vars = analysis.free_vars(input_val)
     assert all(
-        var.name_hint in params.keys() for var in analysis.free_vars(input_val)
+        var.name_hint in params.keys() for var in free_vars
     ), "All inputs to infer must be available in params."
     assert tvm.runtime.enabled("llvm"), "LLVM must be enabled to infer value."
+
+    if not free_vars:
+        folded = fold_constant(input_val)
+        if isinstance(folded, _expr.Constant):
+            if cache is not None:
+                cache.num_folded += 1
+            return folded.data
+
     try:
         # TODO(kevinthesun): Use VM for all cases.
         # pylint: disable=import-outside-toplevel
         from tvm.contrib import graph_executor
 
-        func = _function.Function(analysis.free_vars(input_val), input_val)
-        with tvm.transform.PassContext(opt_level=0):
-            lib = tvm.relay.build(func, target="llvm", params=params)
+        func = _function.Function(free_vars, input_val)
         dev = tvm.cpu(0)
-        m = graph_executor.GraphModule(lib["default"](dev))
+        if cache is None:
+            with tvm.transform.PassContext(opt_level=0):
+                lib = tvm.relay.build(func, target="llvm", params=params)
+            m = graph_executor.GraphModule(lib["default"](dev))
+            m.run()
+            return m.get_output(0)
+
+        # The inputs are not bound, so that the executor can be reused for other values.
+        m = cache.get(func)
+        if m is None:
+            with tvm.transform.PassContext(opt_level=0):
+                lib = tvm.relay.build(func, target="llvm")
+            m = graph_executor.GraphModule(lib["default"](dev))
+            cache.num_builds += 1
+            cache.add(func, m)
+        for i, var in enumerate(free_vars):
+            m.set_input(i, params[var.name_hint])
         m.run()
-        return m.get_output(0)
+        # The output buffer is reused by the next run of a cached executor.
+        return m.get_output(0).copyto(dev)
     except Exception:
         if isinstance(mod, IRModule):
             mod["main"] = _function.Function(analysis.free_vars(input_val), input_val)
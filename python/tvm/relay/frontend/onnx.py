@@ -40,6 +40,8 @@ from .. import ty as _ty
 from .. import vision as _vision
 from .common import (
     AttrCvt,
+    IncrementalTypeInference,
+    InferValueCache,
     Renamer,
     autopad,
     ensure_scalar_shape,
@@ -67,6 +69,10 @@ ONNX_DEFAULT_CONFIGS = {
     # Note that `nn.batch_matmul` with format other than NT is in experimental, it may have some
     # performance issues.
     "use_nt_batch_matmul": True,
+    # By default, the types of converted nodes are inferred incrementally, only checking the
+    # nodes whose types are not known yet. Change this flag to False to rerun full type
+    # inference on the whole expression for every query.
+    "incremental_type_inference": True,
 }
 
 
@@ -5652,6 +5658,10 @@ def from_onnx(
             use_nt_batch_matmul : bool = True
                 True to convert qualified onnx `matmul` to `nn.batch_matmul` strict to NT format
                 (transpose_a=False, transpose_b=True).
+            incremental_type_inference : bool = True
+                True to only check the types of the nodes that have not been checked yet
+                when converters query types and shapes, instead of rerunning type inference
+                on the whole converted graph.
 
     Returns
     -------
@@ -5695,7 +5705,8 @@ def from_onnx(
         )
 
     # Use the graph proto as a scope so that ops can access other nodes if needed.
-    with g:
+    type_inference = IncrementalTypeInference(ONNX_DEFAULT_CONFIGS["incremental_type_inference"])
+    with g, type_inference, InferValueCache():
         mod, params = g.from_onnx(graph, opset)
 
     if freeze_params:
@@ -34,6 +34,7 @@ from .. import function as _function
 from ..ty import Any
 from ..expr_functor import ExprMutator, ExprVisitor
 from .common import get_relay_op
+from .common import InferValueCache
 from .common import infer_type as _infer_type
 from .common import infer_shape as _infer_shape
 from .common import infer_value as _infer_value
@@ -1260,5 +1261,6 @@ def from_tensorflow(graph, layout="NHWC", shape=None, outputs=None, convert_conf
         TF_DEFAULT_CONFIGS.update(convert_config)
 
     g = GraphProto()
-    mod, params = g.from_tensorflow(graph, layout, shape, outputs)
+    with InferValueCache():
+        mod, params = g.from_tensorflow(graph, layout, shape, outputs)
     return mod, params
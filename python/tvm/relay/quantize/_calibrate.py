@@ -30,7 +30,7 @@ from .. import expr as _expr
 from .. import analysis as _analysis
 from .. import build_module as _build_module
 from ...contrib import graph_executor
-from .kl_divergence import _find_scale_by_kl
+from .kl_divergence import _find_scale_by_kl, _find_scale_by_kl_histogram
 
 
 def _get_profile_runtime(mod):
@@ -90,8 +90,87 @@ def collect_stats(mod, dataset, chunk_by=-1):
         yield [np.concatenate(output).reshape(-1) for output in outputs]
 
 
+class _StreamingHistogram(object):
+    """The running minimum, maximum and histogram of the output of one layer.
+    The histogram is symmetric around zero and has a fixed number of bins,
+    and is widened whenever a batch exceeds its range.
+
+    Parameters
+    ----------
+    num_bins: int
+        The number of bins of the histogram.
+    """
+
+    def __init__(self, num_bins=8001):
+        self.num_bins = num_bins
+        self.min_val = np.inf
+        self.max_val = -np.inf
+        self.thres = 0.0
+        self.hist = np.zeros(num_bins, dtype=np.int64)
+        self.hist_edges = None
+
+    def update(self, arr):
+        """Add the values of a batch to the histogram."""
+        if arr.size == 0:
+            return
+        self.min_val = min(self.min_val, np.min(arr))
+        self.max_val = max(self.max_val, np.max(arr))
+        thres = max(abs(self.min_val), abs(self.max_val))
+        if self.hist_edges is not None and thres > self.thres:
+            # Move the counts at the centers of the old bins to the wider bins
+            centers = (self.hist_edges[:-1] + self.hist_edges[1:]) / 2
+            hist, self.hist_edges = np.histogram(
+                centers, bins=self.num_bins, range=(-thres, thres), weights=self.hist
+            )
+            self.hist = hist.astype(np.int64)
+        self.thres = max(self.thres, thres)
+        hist, self.hist_edges = np.histogram(
+            arr, bins=self.num_bins, range=(-self.thres, self.thres)
+        )
+        self.hist += hist
+
+
+def collect_histograms(mod, dataset, num_bins=8001):
+    """Given an annotated graph, create a profile graph and accumulate the histogram
+    of the output of each layer on the calibration dataset in a single pass. Unlike
+    :code:`collect_stats`, the outputs are never buffered, so the memory usage is
+    proportional to the number of layers times the number of bins only.
+
+    Parameters
+    ----------
+    mod: Module
+        The simulation graph after annotation.
+
+    dataset: Iterable[NDArray]
+        The calibration dataset.
+
+    num_bins: int
+        The number of bins of each histogram.
+
+    Returns
+    -------
+    ret: list of _StreamingHistogram
+        The histogram of each layer.
+    """
+    logging.info("collecting histograms for calibration...")
+    runtime = _get_profile_runtime(mod)
+    hists = [_StreamingHistogram(num_bins) for _ in range(runtime.get_num_outputs())]
+    for batch in dataset:
+        runtime.set_input(**batch)
+        runtime.run()
+        for i, hist in enumerate(hists):
+            hist.update(runtime.get_output(i).numpy())
+    return hists
+
+
 def _kl_scale(mod, dataset):
     cfg = quantize.current_qconfig()
+    if cfg.calibrate_streaming:
+        hists = collect_histograms(mod, dataset)
+        logging.info("finding threshold with kl for calibration...")
+        scales = [_find_scale_by_kl_histogram(h.hist, h.hist_edges, h.min_val) for h in hists]
+        return _scale_func(scales)
+
     chunk_by = cfg.calibrate_chunk_by
     scales = []
     for samples in collect_stats(mod, dataset, chunk_by):
@@ -99,6 +178,12 @@ def _kl_scale(mod, dataset):
         with mp.Pool() as pool:
             scales += list(pool.map(_find_scale_by_kl, samples))
 
+    return _scale_func(scales)
+
+
+def _scale_func(scales):
+    """Return the input scale function that returns `scales` in order."""
+
     def func(_):
         scale = scales[func.scale_idx]
         func.scale_idx += 1
@@ -116,8 +201,29 @@ def _find_scale_by_percentile(arr, percentile=0.99999):
     return np.partition(x, max_k)[max_k]
 
 
+def _find_scale_by_percentile_histogram(hist, hist_edges, percentile=0.99999):
+    """Find the percentile of the absolute values from a histogram that is symmetric
+    around zero. The result is rounded up to the upper edge of the bin it falls in."""
+    num_bins = len(hist)
+    half = num_bins // 2
+    # Fold the histogram at zero into the histogram of the absolute values
+    abs_hist = hist[half:].astype(np.int64)
+    abs_hist[num_bins % 2 :] += hist[:half][::-1]
+    abs_edges = hist_edges[half + 1 :]
+    cumsum = np.cumsum(abs_hist)
+    max_k = int(cumsum[-1] * percentile)
+    idx = min(np.searchsorted(cumsum, max_k, side="right"), len(abs_edges) - 1)
+    return abs_edges[idx]
+
+
 def _percentile_scale(mod, dataset):
     cfg = quantize.current_qconfig()
+    if cfg.calibrate_streaming:
+        hists = collect_histograms(mod, dataset)
+        logging.info("finding threshold with percentile for calibration...")
+        scales = [_find_scale_by_percentile_histogram(h.hist, h.hist_edges) for h in hists]
+        return _scale_func(scales)
+
     chunk_by = cfg.calibrate_chunk_by
     scales = []
     for samples in collect_stats(mod, dataset, chunk_by):
@@ -125,14 +231,7 @@ def _percentile_scale(mod, dataset):
         with mp.Pool() as pool:
             scales += list(pool.map(_find_scale_by_percentile, samples))
 
-    def func(_):
-        scale = scales[func.scale_idx]
-        func.scale_idx += 1
-        return scale
-
-    func.scale_idx = 0
-
-    return func
+    return _scale_func(scales)
 
 
 def _set_params(mod, input_scale_func, weight_scale_func):
@@ -35,6 +35,20 @@ def _find_scale_by_kl(arr, quantized_dtype="int8", num_bins=8001, num_quantized_
     max_val = np.max(arr)
     thres = max(abs(min_val), abs(max_val))
 
+    hist, hist_edges = np.histogram(arr, bins=num_bins, range=(-thres, thres))
+    return _find_scale_by_kl_histogram(
+        hist, hist_edges, min_val, quantized_dtype, num_quantized_bins
+    )
+
+
+def _find_scale_by_kl_histogram(
+    hist, hist_edges, min_val, quantized_dtype="int8", num_quantized_bins=255
+):
+    """Find the optimal threshold from a histogram that is symmetric around zero,
+    e.g. one accumulated over the calibration dataset batch by batch.
+    `min_val` is the minimum of the histogrammed values.
+    """
+    num_bins = len(hist)
     if min_val >= 0 and quantized_dtype in ["uint8"]:
         # We need to move negative bins to positive bins to fit uint8 range.
         num_quantized_bins = num_quantized_bins * 2 + 1
@@ -43,7 +57,6 @@ def _find_scale_by_kl(arr, quantized_dtype="int8", num_bins=8001, num_quantized_
         ptr = arr.ctypes.data_as(ctypes.POINTER(ctypes_type))
         return ctypes.cast(ptr, ctypes.c_void_p)
 
-    hist, hist_edges = np.histogram(arr, bins=num_bins, range=(-thres, thres))
     hist_ptr = get_pointer(hist.astype(np.int32), ctypes.c_int)
     hist_edges_ptr = get_pointer(hist_edges, ctypes.c_float)
 
@@ -86,6 +86,7 @@ class QConfig(Object):
         "debug_enabled_ops": None,
         "rounding": "UPWARD",
         "calibrate_chunk_by": -1,
+        "calibrate_streaming": False,
         "partition_conversions": "disabled",
     }
 
@@ -180,6 +181,17 @@ def qconfig(**kwargs):
     rounding: "UPWARD" or "TONEAREST"
         Rounding direction for fixed point multiplications.
 
+    calibrate_chunk_by: int
+        The number of layers whose outputs are collected at a time by
+        'kl_divergence' and 'percentile' calibration, which runs the dataset
+        once per chunk. -1 collects all layers at once.
+
+    calibrate_streaming: boolean
+        Whether 'kl_divergence' and 'percentile' calibration accumulate a
+        fixed-bin histogram of each layer in a single pass over the dataset,
+        instead of buffering all layer outputs. The scales are then found from
+        the histograms, so the memory usage no longer grows with the dataset.
+
     partition_conversions: 'disabled', 'enabled', or 'fully_integral'
         If set to 'enabled' or 'fully_integral', partitions a quantized
         result into a module containing
@@ -15,6 +15,8 @@
 # specific language governing permissions and limitations
 # under the License.
 """RPC client tools"""
+import getpass
+import hashlib
 import os
 import socket
 import stat
@@ -90,7 +92,7 @@ class RPCSession(object):
         dev._rpc_sess = self
         return dev
 
-    def upload(self, data, target=None):
+    def upload(self, data, target=None, use_cache=True):
         """Upload file to remote runtime temp folder
 
         Parameters
@@ -100,6 +102,10 @@ class RPCSession(object):
 
         target : str, optional
             The path in remote
+
+        use_cache : bool, optional
+            Whether to skip the upload if the server has the same content in its
+            upload cache. Ignored if the server has no upload cache.
         """
         if isinstance(data, bytearray):
             if not target:
@@ -110,10 +116,26 @@ class RPCSession(object):
             if not target:
                 target = os.path.basename(data)
 
+        if use_cache and self._has_upload_cache():
+            digest = hashlib.sha256(blob).hexdigest()
+            if not self._remote_funcs["upload_cache.lookup"](target, digest):
+                self._remote_funcs["upload_cache.put"](target, blob, digest)
+            return
+
         if "upload" not in self._remote_funcs:
             self._remote_funcs["upload"] = self.get_function("tvm.rpc.server.upload")
         self._remote_funcs["upload"](target, blob)
 
+    def _has_upload_cache(self):
+        """Whether the server has an upload cache"""
+        if "upload_cache.lookup" not in self._remote_funcs:
+            try:
+                for name in ["upload_cache.lookup", "upload_cache.put"]:
+                    self._remote_funcs[name] = self.get_function("tvm.rpc.server." + name)
+            except AttributeError:
+                self._remote_funcs["upload_cache.lookup"] = None
+        return self._remote_funcs["upload_cache.lookup"] is not None
+
     def download(self, path):
         """Download file from remote temp folder.
 
@@ -278,6 +300,14 @@ class PopenSession(RPCSession):
         RPCSession.__init__(self, _popen_session(binary))
 
 
+def _default_user():
+    """The login name, or an empty string if it is unknown"""
+    try:
+        return getpass.getuser()
+    except Exception:  # pylint: disable=broad-except
+        return ""
+
+
 class TrackerSession(object):
     """Tracker client session.
 
@@ -366,7 +396,13 @@ class TrackerSession(object):
         return res
 
     def request(
-        self, key, priority=1, session_timeout=0, max_retry=5, session_constructor_args=None
+        self,
+        key,
+        priority=1,
+        session_timeout=0,
+        max_retry=5,
+        session_constructor_args=None,
+        user=None,
     ):
         """Request a new connection from the tracker.
 
@@ -390,17 +426,29 @@ class TrackerSession(object):
             List of additional arguments to passed as the remote session constructor.
             The first element of the list is always a string specifying the name of
             the session constructor, the following args are the positional args to that function.
+
+        user : str, optional
+            The user the servers are shared between by the fair share scheduler of the
+            tracker. Defaults to the login name.
         """
+        if user is None:
+            user = _default_user()
         last_err = None
         for _ in range(max_retry):
             try:
                 if self._sock is None:
                     self._connect()
-                base.sendjson(self._sock, [base.TrackerCode.REQUEST, key, "", priority])
+                base.sendjson(self._sock, [base.TrackerCode.REQUEST, key, user, priority, {}])
                 value = base.recvjson(self._sock)
                 if value[0] != base.TrackerCode.SUCCESS:
                     raise RuntimeError("Invalid return value %s" % str(value))
-                url, port, matchkey = value[1]
+                url, port, matchkey = value[1][:3]
+                # the session must end before the lease of the server expires
+                lease_timeout = value[1][3] if len(value[1]) > 3 else None
+                if lease_timeout:
+                    session_timeout = (
+                        min(session_timeout, lease_timeout) if session_timeout else lease_timeout
+                    )
                 return connect(
                     url,
                     port,
@@ -417,7 +465,7 @@ class TrackerSession(object):
             "Cannot request %s after %d retry, last_error:%s" % (key, max_retry, str(last_err))
         )
 
-    def request_and_run(self, key, func, priority=1, session_timeout=0, max_retry=2):
+    def request_and_run(self, key, func, priority=1, session_timeout=0, max_retry=2, user=None):
         """Request a resource from tracker and run the func.
 
         This function safe-guard rare server node dropout during execution.
@@ -441,11 +489,17 @@ class TrackerSession(object):
 
         max_retry : int, optional
             Maximum number of times to retry the function before give up.
+
+        user : str, optional
+            The user the servers are shared between by the fair share scheduler of the
+            tracker. Defaults to the login name.
         """
         last_err = None
         for _ in range(max_retry):
             try:
-                sess = self.request(key, priority=priority, session_timeout=session_timeout)
+                sess = self.request(
+                    key, priority=priority, session_timeout=session_timeout, user=user
+                )
                 tstart = time.time()
                 return func(sess)
             except TVMError as err:
@@ -25,13 +25,18 @@ Server is TCP based with the following protocol:
    - {server|client}:device-type[:random-key] [-timeout=timeout]
 """
 # pylint: disable=invalid-name
+import os
 import ctypes
 import socket
 import select
 import struct
+import shutil
+import hashlib
 import logging
 import threading
 import multiprocessing
+import multiprocessing.reduction
+import collections
 import time
 import errno
 import tvm._ffi
@@ -51,7 +56,155 @@ from .base import TrackerCode
 logger = logging.getLogger("RPCServer")
 
 
-def _server_env(load_library, work_path=None):
+class UploadCache(object):
+    """A size-bounded cache of the files uploaded to the server, by SHA-256 of their content.
+
+    Clients upload a file by first asking the server whether it has the content, so
+    that identical libraries are only sent once across sessions. The cache is a
+    directory shared by the session processes, the least recently used files are
+    removed once the total size exceeds max_bytes.
+
+    Parameters
+    ----------
+    path : str
+        The directory of the cache, created if needed.
+
+    max_bytes : int, optional
+        The maximum total size of the cached files.
+    """
+
+    def __init__(self, path, max_bytes=1 << 30):
+        os.makedirs(path, exist_ok=True)
+        self.path = path
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.bytes_saved = 0
+
+    def _entry(self, digest):
+        if len(digest) != 64 or any(c not in "0123456789abcdef" for c in digest):
+            raise ValueError("Invalid SHA-256 digest %s" % digest)
+        return os.path.join(self.path, digest)
+
+    def lookup(self, digest, dst):
+        """Copy the file of a digest to dst if it is in the cache.
+
+        Parameters
+        ----------
+        digest : str
+            The hex SHA-256 of the content.
+
+        dst : str
+            The path to copy the file to.
+
+        Returns
+        -------
+        found : bool
+            Whether the file is in the cache.
+        """
+        entry = self._entry(digest)
+        try:
+            # mark as recently used
+            os.utime(entry)
+            shutil.copyfile(entry, dst)
+        except FileNotFoundError:
+            self.misses += 1
+            return False
+        self.hits += 1
+        self.bytes_saved += os.path.getsize(dst)
+        return True
+
+    def put(self, digest, data):
+        """Add a content to the cache.
+
+        Parameters
+        ----------
+        digest : str
+            The hex SHA-256 of the content.
+
+        data : bytearray
+            The content.
+        """
+        entry = self._entry(digest)
+        if hashlib.sha256(data).hexdigest() != digest:
+            raise ValueError("The content does not match the SHA-256 digest %s" % digest)
+        temp_entry = "%s.%d.tmp" % (entry, os.getpid())
+        with open(temp_entry, "wb") as out_file:
+            out_file.write(data)
+        os.replace(temp_entry, entry)
+        self._evict()
+
+    def _evict(self):
+        entries = []
+        for name in os.listdir(self.path):
+            if name.endswith(".tmp"):
+                continue
+            try:
+                stat = os.stat(os.path.join(self.path, name))
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, name))
+        total = sum(size for _, size, _ in entries)
+        for _, size, name in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(os.path.join(self.path, name))
+            except FileNotFoundError:
+                pass
+            total -= size
+
+    def stats(self):
+        """The hits, misses and bytes saved of the cache in the current process"""
+        return {"hits": self.hits, "misses": self.misses, "bytes_saved": self.bytes_saved}
+
+
+class ServerMetrics(object):
+    """The session metrics of a server.
+
+    The setup latency of a session is the time between the handshake with the client
+    and the start of the serving loop, which includes the startup of the session
+    process unless it was pre-forked.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.num_sessions = 0
+        self.setup_latencies = collections.deque(maxlen=1024)
+        self.upload_cache = {"hits": 0, "misses": 0, "bytes_saved": 0}
+
+    def add_session(self, setup_latency, upload_cache_stats=None):
+        """Record a finished session"""
+        with self._lock:
+            self.num_sessions += 1
+            if setup_latency is not None:
+                self.setup_latencies.append(setup_latency)
+            for name, value in (upload_cache_stats or {}).items():
+                self.upload_cache[name] += value
+
+    def summary(self):
+        """Get the summary of the metrics.
+
+        Returns
+        -------
+        summary : dict
+            The number of sessions, the statistics in milliseconds of the setup latency
+            of the recent sessions, and the statistics of the upload cache.
+        """
+        with self._lock:
+            latencies = [latency * 1000 for latency in self.setup_latencies]
+            return {
+                "sessions": self.num_sessions,
+                "setup_latency_ms": {
+                    "last": latencies[-1] if latencies else None,
+                    "mean": sum(latencies) / len(latencies) if latencies else None,
+                    "max": max(latencies) if latencies else None,
+                },
+                "upload_cache": dict(self.upload_cache),
+            }
+
+
+def _server_env(load_library, work_path=None, upload_cache=None):
     """Server environment function return temp dir"""
     if work_path:
         temp = work_path
@@ -99,6 +252,20 @@ def _server_env(load_library, work_path=None):
         logger.info("Send linked module %s to client", path)
         return bytearray(open(path, "rb").read())
 
+    if upload_cache is not None:
+
+        @tvm._ffi.register_func("tvm.rpc.server.upload_cache.lookup", override=True)
+        def upload_cache_lookup(file_name, digest):
+            """Copy a file from the upload cache, return whether it was found."""
+            return upload_cache.lookup(digest, temp.relpath(file_name))
+
+        @tvm._ffi.register_func("tvm.rpc.server.upload_cache.put", override=True)
+        def upload_cache_put(file_name, blob, digest):
+            """Upload a file and add it to the upload cache."""
+            with open(temp.relpath(file_name), "wb") as out_file:
+                out_file.write(blob)
+            upload_cache.put(digest, blob)
+
     libs = []
     load_library = load_library.split(":") if load_library else []
     for file_name in load_library:
@@ -119,6 +286,87 @@ def _serve_loop(sock, addr, load_library, work_path=None):
     logger.info("Finish serving %s", addr)
 
 
+def _session_loop(pipe, load_library, work_path, upload_cache):
+    """Session process which sets up the server environment before the connection arrives.
+
+    The connection is received from the listening loop over pipe. The start of the
+    serving loop is acknowledged on pipe, followed by the upload cache stats at the end
+    of the session.
+    """
+    _server_env(load_library, work_path, upload_cache)
+    try:
+        addr = pipe.recv()
+        sock = socket.socket(fileno=multiprocessing.reduction.recv_handle(pipe))
+    except (EOFError, OSError):
+        # the server is shutting down
+        return
+    pipe.send(True)
+    _ffi_api.ServerLoop(sock.fileno())
+    logger.info("Finish serving %s", addr)
+    pipe.send(upload_cache.stats() if upload_cache is not None else None)
+
+
+class _SessionProcess(object):
+    """A process serving one RPC session, started ahead of the connection."""
+
+    def __init__(self, load_library, upload_cache):
+        self.work_path = utils.tempdir()
+        self._pipe, child_pipe = multiprocessing.Pipe()
+        self.proc = multiprocessing.Process(
+            target=_session_loop, args=(child_pipe, load_library, self.work_path, upload_cache)
+        )
+        self.proc.start()
+        child_pipe.close()
+
+    def serve(self, conn, addr):
+        """Hand a connection over to the process, return when the serving loop started.
+
+        Returns
+        -------
+        started : bool
+            Whether the serving loop started, False if the process failed to set up.
+        """
+        try:
+            self._pipe.send(addr)
+            multiprocessing.reduction.send_handle(self._pipe, conn.fileno(), self.proc.pid)
+            return self._pipe.recv()
+        except (EOFError, OSError):
+            return False
+        finally:
+            # close from our side.
+            conn.close()
+
+    def finish(self, timeout=None):
+        """Wait until the session finishes or times out, and clean up.
+
+        Returns
+        -------
+        upload_cache_stats : Optional[dict]
+            The stats of the upload cache during the session.
+        """
+        self.proc.join(timeout)
+        stats = None
+        if self.proc.is_alive():
+            logger.info("Timeout in RPC session, kill..")
+            # pylint: disable=import-outside-toplevel
+            import psutil
+
+            parent = psutil.Process(self.proc.pid)
+            # terminate worker children
+            for child in parent.children(recursive=True):
+                child.terminate()
+            # terminate the worker
+            self.proc.terminate()
+        elif self._pipe.poll():
+            try:
+                stats = self._pipe.recv()
+            except (EOFError, OSError):
+                pass
+        self._pipe.close()
+        self.work_path.remove()
+        return stats
+
+
 def _parse_server_opt(opts):
     # parse client options
     ret = {}
@@ -128,8 +376,27 @@ def _parse_server_opt(opts):
     return ret
 
 
-def _listen_loop(sock, port, rpc_key, tracker_addr, load_library, custom_addr):
-    """Listening loop of the server."""
+def _listen_loop(
+    sock,
+    port,
+    rpc_key,
+    tracker_addr,
+    load_library,
+    custom_addr,
+    prefork=0,
+    upload_cache=None,
+    metrics=None,
+):
+    """Listening loop of the server.
+
+    With prefork, the session processes are started ahead of the connections, so that
+    a session only waits for the handover of its connection to a ready process.
+    """
+    ready_sessions = collections.deque()
+
+    def _prefork_sessions():
+        while len(ready_sessions) < prefork:
+            ready_sessions.append(_SessionProcess(load_library, upload_cache))
 
     def _accept_conn(listen_sock, tracker_conn, ping_period=2):
         """Accept connection from the other places.
@@ -146,11 +413,25 @@ def _listen_loop(sock, port, rpc_key, tracker_addr, load_library, custom_addr):
             ping tracker every k seconds if no connection is accepted.
         """
         old_keyset = set()
+        # the lease timeout of the session matched with the key, None for no limit
+        lease_timeout = None
+
+        def _put(matchkey):
+            """Report the resource to the tracker, return the lease timeout"""
+            base.sendjson(
+                tracker_conn, [TrackerCode.PUT, rpc_key, (port, matchkey), custom_addr, {}]
+            )
+            ret = base.recvjson(tracker_conn)
+            if ret == TrackerCode.SUCCESS:
+                # the tracker predates lease timeouts
+                return None
+            assert ret[0] == TrackerCode.SUCCESS
+            return ret[1].get("lease_timeout")
+
         # Report resource to tracker
         if tracker_conn:
             matchkey = base.random_key(rpc_key + ":")
-            base.sendjson(tracker_conn, [TrackerCode.PUT, rpc_key, (port, matchkey), custom_addr])
-            assert base.recvjson(tracker_conn) == TrackerCode.SUCCESS
+            lease_timeout = _put(matchkey)
         else:
             matchkey = rpc_key
 
@@ -174,10 +455,7 @@ def _listen_loop(sock, port, rpc_key, tracker_addr, load_library, custom_addr):
                     if unmatch_period_count * ping_period > unmatch_timeout + ping_period:
                         logger.info("no incoming connections, regenerate key ...")
                         matchkey = base.random_key(rpc_key + ":", old_keyset)
-                        base.sendjson(
-                            tracker_conn, [TrackerCode.PUT, rpc_key, (port, matchkey), custom_addr]
-                        )
-                        assert base.recvjson(tracker_conn) == TrackerCode.SUCCESS
+                        lease_timeout = _put(matchkey)
                         unmatch_period_count = 0
                     continue
             conn, addr = listen_sock.accept()
@@ -198,7 +476,11 @@ def _listen_loop(sock, port, rpc_key, tracker_addr, load_library, custom_addr):
             conn.sendall(struct.pack("<i", base.RPC_CODE_SUCCESS))
             conn.sendall(struct.pack("<i", len(server_key)))
             conn.sendall(server_key.encode("utf-8"))
-            return conn, addr, _parse_server_opt(arr[1:])
+            opts = _parse_server_opt(arr[1:])
+            if lease_timeout:
+                # end the session once the lease expires, whatever the client asked
+                opts["timeout"] = min(opts.get("timeout") or lease_timeout, lease_timeout)
+            return conn, addr, opts
 
     # Server logic
     tracker_conn = None
@@ -217,6 +499,7 @@ def _listen_loop(sock, port, rpc_key, tracker_addr, load_library, custom_addr):
                 assert base.recvjson(tracker_conn) == TrackerCode.SUCCESS
 
             # step 2: wait for in-coming connections
+            _prefork_sessions()
             conn, addr, opts = _accept_conn(sock, tracker_conn)
         except (socket.error, IOError):
             # retry when tracker is dropped
@@ -228,30 +511,37 @@ def _listen_loop(sock, port, rpc_key, tracker_addr, load_library, custom_addr):
             raise exc
 
         # step 3: serving
-        work_path = utils.tempdir()
+        setup_start = time.time()
         logger.info("connection from %s", addr)
-        server_proc = multiprocessing.Process(
-            target=_serve_loop, args=(conn, addr, load_library, work_path)
-        )
-
-        server_proc.start()
-        # close from our side.
-        conn.close()
+        if ready_sessions:
+            session = ready_sessions.popleft()
+        else:
+            session = _SessionProcess(load_library, upload_cache)
+        if session.serve(conn, addr):
+            setup_latency = time.time() - setup_start
+            logger.info("session setup took %.2f ms", setup_latency * 1000)
+        else:
+            logger.warning("session process of %s failed to start", addr)
+            setup_latency = None
+        # start the next session process while this session runs
+        _prefork_sessions()
         # wait until server process finish or timeout
-        server_proc.join(opts.get("timeout", None))
-
-        if server_proc.is_alive():
-            logger.info("Timeout in RPC session, kill..")
-            # pylint: disable=import-outside-toplevel
-            import psutil
-
-            parent = psutil.Process(server_proc.pid)
-            # terminate worker children
-            for child in parent.children(recursive=True):
-                child.terminate()
-            # terminate the worker
-            server_proc.terminate()
-        work_path.remove()
+        upload_cache_stats = session.finish(opts.get("timeout", None))
+        if metrics is not None:
+            metrics.add_session(setup_latency, upload_cache_stats)
+            if tracker_conn:
+                # report the metrics along with the server info
+                cinfo = {
+                    "key": "server:" + rpc_key,
+                    "addr": (custom_addr, port),
+                    "metrics": metrics.summary(),
+                }
+                try:
+                    base.sendjson(tracker_conn, [TrackerCode.UPDATE_INFO, cinfo])
+                    assert base.recvjson(tracker_conn) == TrackerCode.SUCCESS
+                except (socket.error, IOError):
+                    tracker_conn.close()
+                    tracker_conn = None
 
 
 def _connect_proxy_loop(addr, key, load_library):
@@ -310,6 +600,9 @@ class PopenRPCServerState(object):
         load_library=None,
         custom_addr=None,
         silent=False,
+        prefork=0,
+        upload_cache_dir=None,
+        upload_cache_max_bytes=1 << 30,
     ):
 
         # start update
@@ -317,6 +610,10 @@ class PopenRPCServerState(object):
         self.port = port
         self.libs = []
         self.custom_addr = custom_addr
+        self.metrics = ServerMetrics()
+        upload_cache = None
+        if upload_cache_dir:
+            upload_cache = UploadCache(upload_cache_dir, upload_cache_max_bytes)
 
         if silent:
             logger.setLevel(logging.ERROR)
@@ -340,7 +637,17 @@ class PopenRPCServerState(object):
             self.sock = sock
             self.thread = threading.Thread(
                 target=_listen_loop,
-                args=(self.sock, self.port, key, tracker_addr, load_library, self.custom_addr),
+                args=(
+                    self.sock,
+                    self.port,
+                    key,
+                    tracker_addr,
+                    load_library,
+                    self.custom_addr,
+                    prefork,
+                    upload_cache,
+                    self.metrics,
+                ),
             )
             self.thread.start()
         else:
@@ -362,6 +669,9 @@ def _popen_start_rpc_server(
     silent=False,
     no_fork=False,
     server_init_callback=None,
+    prefork=0,
+    upload_cache_dir=None,
+    upload_cache_max_bytes=1 << 30,
 ):
     if no_fork:
         multiprocessing.set_start_method("spawn")
@@ -373,13 +683,28 @@ def _popen_start_rpc_server(
     # Popen worker to run on a separate process.
     # Create and start the server in a different thread
     state = PopenRPCServerState(
-        host, port, port_end, is_proxy, tracker_addr, key, load_library, custom_addr, silent
+        host,
+        port,
+        port_end,
+        is_proxy,
+        tracker_addr,
+        key,
+        load_library,
+        custom_addr,
+        silent,
+        prefork,
+        upload_cache_dir,
+        upload_cache_max_bytes,
     )
     PopenRPCServerState.current = state
     # returns the port so that the main can get the port number.
     return state.port
 
 
+def _popen_server_metrics():
+    return PopenRPCServerState.current.metrics.summary()
+
+
 class Server(object):
     """Start RPC server on a separate process.
 
@@ -425,6 +750,19 @@ class Server(object):
     server_init_callback: Callable, optional
         Additional initialization function when starting the server.
 
+    prefork: int, optional
+        The number of session processes kept started ahead of the connections, with
+        the server environment set up, so that a new session does not wait for the
+        startup of its process. Not supported through a proxy.
+
+    upload_cache_dir: str, optional
+        The directory of a cache of the uploaded files, by content hash, which lets
+        clients skip the upload of files the server already has. Not supported
+        through a proxy.
+
+    upload_cache_max_bytes: int, optional
+        The maximum total size of the files in the upload cache.
+
     Note
     ----
     The RPC server only sees functions in the tvm namespace.
@@ -455,6 +793,9 @@ class Server(object):
         silent=False,
         no_fork=False,
         server_init_callback=None,
+        prefork=0,
+        upload_cache_dir=None,
+        upload_cache_max_bytes=1 << 30,
     ):
         try:
             if _ffi_api.ServerLoop is None:
@@ -477,12 +818,27 @@ class Server(object):
                 silent,
                 no_fork,
                 server_init_callback,
+                prefork,
+                upload_cache_dir,
+                upload_cache_max_bytes,
             ],
         )
         # receive the port
         self.port = self.proc.recv()
         self.host = host
 
+    def metrics(self):
+        """Get the session metrics of the server.
+
+        Returns
+        -------
+        summary : dict
+            The number of sessions, the statistics in milliseconds of the setup latency
+            of the recent sessions, and the statistics of the upload cache.
+        """
+        self.proc.send(_popen_server_metrics)
+        return self.proc.recv()
+
     def terminate(self):
         """Terminate the server process"""
         if self.proc:
@@ -34,21 +34,35 @@ List of available APIs:
 - PUT: report resource to tracker
   - input: [TrackerCode.PUT, [port, match-key]]
   - return: TrackerCode.SUCCESS
+  - input: [TrackerCode.PUT, [port, match-key], custom-addr, options]
+  - return: [TrackerCode.SUCCESS, {"lease_timeout": lease-timeout}]
   - note: match-key is a randomly generated identify the resource during connection.
+  - note: the server ends the session matched with match-key after lease-timeout seconds,
+    null for no limit.
 - REQUEST: request a new resource from tracker
   - input: [TrackerCode.REQUEST, [key, user, priority]]
   - return: [TrackerCode.SUCCESS, [url, port, match-key]]
+  - input: [TrackerCode.REQUEST, [key, user, priority, options]]
+  - return: [TrackerCode.SUCCESS, [url, port, match-key, lease-timeout]]
+  - note: the session is expected to end within lease-timeout seconds, null for no limit.
+
+The tracker can also serve its metrics in the Prometheus text format over HTTP.
 """
 # pylint: disable=invalid-name
 
 import asyncio
+import bisect
+import concurrent.futures
 import heapq
+import http.server
 import logging
 import socket
 import threading
 import errno
 import struct
 import json
+import time
+from collections import OrderedDict
 from tvm.contrib.popen_pool import PopenWorker
 
 try:
@@ -107,49 +121,275 @@ class Scheduler(object):
             The resource to remove
         """
 
+    def check_leases(self):
+        """Check the leases of the resources granted, called periodically by the tracker."""
+
     def summary(self):
         """Get summary information of the scheduler."""
         raise NotImplementedError()
 
 
-class PriorityScheduler(Scheduler):
-    """Priority based scheduler, FIFO based on request order"""
+class FairShareScheduler(Scheduler):
+    """Weighted fair share scheduler across users, priority then FIFO based within a user.
+
+    Each user has a virtual time, advanced by 1 / weight for every resource it is
+    granted. The pending request of the highest priority is served first, ties are
+    broken by the user of the smallest virtual time, so that the users of the same
+    priority share the resources in proportion to their weights. A user starts from
+    the current virtual time when it gets a pending request, so that an idle user
+    does not accumulate credit.
+
+    Every resource granted is leased until its server reports it again, or
+    disconnects. The tracker sends lease_timeout to the servers, which end their
+    session once it expires and report their resource again, reclaiming it. The
+    servers and the clients predating lease timeouts do not enforce them, so the
+    leases longer than lease_timeout are also logged and counted as expired.
+
+    Parameters
+    ----------
+    key : str
+        The device key of the resources.
+
+    user_weights : Optional[Dict[str, float]]
+        The weight of each user, 1 for the users not listed.
+
+    lease_timeout : Optional[float]
+        The maximum duration of a lease in seconds, sent to the servers and the clients
+        to be used as session timeout. None for no limit.
+    """
 
-    def __init__(self, key):
+    # upper bounds of the wait time histogram, in seconds
+    WAIT_TIME_BUCKETS = (0.01, 0.1, 1.0, 10.0, 60.0, 600.0, 3600.0)
+
+    def __init__(self, key, user_weights=None, lease_timeout=None):
         self._key = key
+        self._user_weights = dict(user_weights or {})
+        self.lease_timeout = lease_timeout
         self._request_cnt = 0
         self._lock = threading.Lock()
-        self._values = []
-        self._requests = []
+        # free resources in the order they are put
+        self._values = OrderedDict()
+        # heap of (-priority, request count, request time, callback) for each user
+        self._requests = {}
+        # heap of (-priority, virtual time, request count, user) of the first request
+        # of each user, the outdated entries are skipped
+        self._heads = []
+        self._virtual_times = {}
+        self._virtual_time = 0.0
+        self._num_pending = 0
+        # server connection -> (resource, user, start time)
+        self._leases = {}
+        self._expired_leases = set()
+        self._num_granted = {}
+        self._num_expired = 0
+        self._wait_counts = [0] * (len(self.WAIT_TIME_BUCKETS) + 1)
+        self._wait_sum = 0.0
+        self._busy_seconds = 0.0
+        self._total_seconds = 0.0
+        self._last_time = time.time()
+
+    def _user_queue(self, user):
+        """The queue of the requests of a user"""
+        return user
+
+    def _advance(self, now):
+        """Account the resource time until now"""
+        elapsed = max(now - self._last_time, 0.0)
+        self._busy_seconds += len(self._leases) * elapsed
+        self._total_seconds += (len(self._leases) + len(self._values)) * elapsed
+        self._last_time = now
+
+    def _push_head(self, user):
+        requests = self._requests[user]
+        if requests:
+            head = requests[0]
+            heapq.heappush(self._heads, (head[0], self._virtual_times[user], head[1], user))
 
     def _schedule(self):
-        while self._requests and self._values:
-            value = self._values.pop(0)
-            item = heapq.heappop(self._requests)
-            callback = item[-1]
+        while self._values and self._heads:
+            _, virtual_time, request_cnt, user = heapq.heappop(self._heads)
+            requests = self._requests[user]
+            if (
+                not requests
+                or requests[0][1] != request_cnt
+                or self._virtual_times[user] != virtual_time
+            ):
+                # outdated entry, the user has a newer one
+                continue
+            _, _, request_time, callback = heapq.heappop(requests)
+            self._num_pending -= 1
+            value, _ = self._values.popitem(last=False)
+            now = time.time()
             if callback(value[1:]):
                 value[0].pending_matchkeys.remove(value[-1])
+                self._grant(value, user, request_time, now)
             else:
-                self._values.append(value)
+                self._values[value] = now
+            self._push_head(user)
+
+    def _grant(self, value, user, request_time, now):
+        self._advance(now)
+        wait = now - request_time
+        self._wait_counts[bisect.bisect_left(self.WAIT_TIME_BUCKETS, wait)] += 1
+        self._wait_sum += wait
+        self._num_granted[user] = self._num_granted.get(user, 0) + 1
+        self._virtual_time = self._virtual_times[user]
+        self._virtual_times[user] += 1.0 / self._user_weights.get(user, 1.0)
+        self._leases[value[0]] = (value, user, now)
+
+    def _end_lease(self, conn):
+        if self._leases.pop(conn, None) is not None:
+            self._expired_leases.discard(conn)
 
     def put(self, value):
-        self._values.append(value)
+        now = time.time()
+        self._advance(now)
+        # a server reports its resource again once the session ended
+        self._end_lease(value[0])
+        self._values[value] = now
         self._schedule()
 
     def request(self, user, priority, callback):
+        user = self._user_queue(user)
         with self._lock:
-            heapq.heappush(self._requests, (-priority, self._request_cnt, callback))
+            requests = self._requests.setdefault(user, [])
+            if not requests:
+                self._virtual_times[user] = max(
+                    self._virtual_times.get(user, 0.0), self._virtual_time
+                )
+            heapq.heappush(requests, (-priority, self._request_cnt, time.time(), callback))
+            if requests[0][1] == self._request_cnt:
+                self._push_head(user)
             self._request_cnt += 1
+            self._num_pending += 1
         self._schedule()
 
     def remove(self, value):
+        self._advance(time.time())
         if value in self._values:
-            self._values.remove(value)
+            del self._values[value]
             self._schedule()
+        elif value[0] in self._leases and self._leases[value[0]][0] == value:
+            self._end_lease(value[0])
+
+    def check_leases(self, now=None):
+        """Count the leases which exceeded the lease timeout"""
+        if self.lease_timeout is None:
+            return
+        now = time.time() if now is None else now
+        for conn, (value, user, start) in self._leases.items():
+            if now - start > self.lease_timeout and conn not in self._expired_leases:
+                self._expired_leases.add(conn)
+                self._num_expired += 1
+                logger.warning(
+                    "Lease of %s:%s by user %s expired after %g sec",
+                    value[1],
+                    value[2],
+                    user,
+                    now - start,
+                )
 
     def summary(self):
-        """Get summary information of the scheduler."""
-        return {"free": len(self._values), "pending": len(self._requests)}
+        """Get summary information of the scheduler.
+
+        Returns
+        -------
+        summary : dict
+            The numbers of free resources, of pending requests and of leased resources,
+            the number of resources granted and of expired leases, the cumulative
+            histogram of the wait time of the requests, the fraction of the resource
+            time spent leased, and the pending requests and resources granted by user.
+        """
+        now = time.time()
+        self._advance(now)
+        self.check_leases(now)
+        cumulative, histogram = 0, []
+        for upper, count in zip(list(self.WAIT_TIME_BUCKETS) + ["+Inf"], self._wait_counts):
+            cumulative += count
+            histogram.append([upper, cumulative])
+        users = {}
+        for user, requests in self._requests.items():
+            if requests or user in self._num_granted:
+                users[user] = {
+                    "pending": len(requests),
+                    "granted": self._num_granted.get(user, 0),
+                    "weight": self._user_weights.get(user, 1.0),
+                }
+        return {
+            "free": len(self._values),
+            "pending": self._num_pending,
+            "leased": len(self._leases),
+            "granted": sum(self._num_granted.values()),
+            "expired_leases": self._num_expired,
+            "wait_histogram": histogram,
+            "wait_sum": self._wait_sum,
+            "utilization": (
+                self._busy_seconds / self._total_seconds if self._total_seconds else 0.0
+            ),
+            "users": users,
+        }
+
+
+class PriorityScheduler(FairShareScheduler):
+    """Priority based scheduler, FIFO based on request order"""
+
+    def __init__(self, key, lease_timeout=None):
+        super(PriorityScheduler, self).__init__(key, lease_timeout=lease_timeout)
+
+    def _user_queue(self, user):
+        # a single queue shared by all the users
+        return ""
+
+
+def _prometheus_text(queue_info):
+    """Format the summaries of the schedulers in the Prometheus text format"""
+
+    def _label(value):
+        return '"%s"' % str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+    lines = []
+
+    def _metric(name, kind, doc, field):
+        lines.append("# HELP tvm_rpc_tracker_%s %s" % (name, doc))
+        lines.append("# TYPE tvm_rpc_tracker_%s %s" % (name, kind))
+        for key, info in sorted(queue_info.items()):
+            if field in info:
+                lines.append("tvm_rpc_tracker_%s{key=%s} %s" % (name, _label(key), info[field]))
+
+    _metric("queue_length", "gauge", "Number of pending requests.", "pending")
+    _metric("free_servers", "gauge", "Number of free servers.", "free")
+    _metric("leased_servers", "gauge", "Number of servers leased to a client.", "leased")
+    _metric("utilization", "gauge", "Fraction of the server time spent leased.", "utilization")
+    _metric("granted_total", "counter", "Number of servers granted.", "granted")
+    _metric("expired_leases_total", "counter", "Number of expired leases.", "expired_leases")
+
+    lines.append("# HELP tvm_rpc_tracker_wait_seconds Wait time of the requests.")
+    lines.append("# TYPE tvm_rpc_tracker_wait_seconds histogram")
+    for key, info in sorted(queue_info.items()):
+        if "wait_histogram" not in info:
+            continue
+        for upper, count in info["wait_histogram"]:
+            lines.append(
+                "tvm_rpc_tracker_wait_seconds_bucket{key=%s,le=%s} %d"
+                % (_label(key), _label(upper), count)
+            )
+        lines.append(
+            "tvm_rpc_tracker_wait_seconds_sum{key=%s} %s" % (_label(key), info["wait_sum"])
+        )
+        lines.append(
+            "tvm_rpc_tracker_wait_seconds_count{key=%s} %d"
+            % (_label(key), info["wait_histogram"][-1][1])
+        )
+
+    lines.append("# HELP tvm_rpc_tracker_user_granted_total Number of servers granted by user.")
+    lines.append("# TYPE tvm_rpc_tracker_user_granted_total counter")
+    for key, info in sorted(queue_info.items()):
+        for user, user_info in sorted(info.get("users", {}).items()):
+            lines.append(
+                "tvm_rpc_tracker_user_granted_total{key=%s,user=%s} %d"
+                % (_label(key), _label(user), user_info["granted"])
+            )
+    return "\n".join(lines) + "\n"
 
 
 class TCPEventHandler(tornado_util.TCPHandler):
@@ -243,16 +483,26 @@ class TCPEventHandler(tornado_util.TCPHandler):
                 value = (self, self._addr[0], port, matchkey)
             self._tracker.put(key, value)
             self.put_values.append(value)
-            self.ret_value(TrackerCode.SUCCESS)
+            if len(args) >= 5:
+                # servers sending options enforce the lease timeout of their sessions
+                self.ret_value(
+                    [TrackerCode.SUCCESS, {"lease_timeout": self._tracker.lease_timeout}]
+                )
+            else:
+                self.ret_value(TrackerCode.SUCCESS)
         elif code == TrackerCode.REQUEST:
             key = args[1]
             user = args[2]
             priority = args[3]
+            # clients sending options accept the lease timeout in the reply
+            with_lease = len(args) >= 5
 
             def _cb(value):
                 # if the connection is already closed
                 if not self._sock:
                     return False
+                if with_lease:
+                    value = list(value) + [self._tracker.lease_timeout]
                 try:
                     self.ret_value([TrackerCode.SUCCESS, value])
                 except (socket.error, IOError):
@@ -294,9 +544,35 @@ class TCPEventHandler(tornado_util.TCPHandler):
 
 
 class TrackerServerHandler(object):
-    """Tracker that tracks the resources."""
+    """Tracker that tracks the resources.
+
+    Parameters
+    ----------
+    sock : socket.socket
+        The listening socket.
 
-    def __init__(self, sock, stop_key):
+    stop_key : str
+        The key to stop the tracker.
+
+    scheduler : Union[str, Callable[[str], Scheduler]]
+        The scheduler of each device key, either "priority", "fair_share", or a
+        function creating a scheduler from a device key.
+
+    user_weights : Optional[Dict[str, float]]
+        The weights of the users for the fair share scheduler.
+
+    lease_timeout : Optional[float]
+        The maximum duration in seconds of a session. The leases of the schedulers are
+        checked every LEASE_CHECK_PERIOD seconds, or lease_timeout if shorter.
+    """
+
+    # the period in seconds of the check of the leases
+    LEASE_CHECK_PERIOD = 1.0
+
+    def __init__(self, sock, stop_key, scheduler="priority", user_weights=None, lease_timeout=None):
+        self._scheduler = scheduler
+        self._user_weights = user_weights
+        self.lease_timeout = lease_timeout
         self._scheduler_map = {}
         self._sock = sock
         self._sock.setblocking(0)
@@ -308,6 +584,15 @@ class TrackerServerHandler(object):
             self._on_event(events)
 
         self._ioloop.add_handler(self._sock.fileno(), _event_handler, self._ioloop.READ)
+        self._lease_checker = None
+        if lease_timeout is not None:
+            period = min(self.LEASE_CHECK_PERIOD, lease_timeout)
+            self._lease_checker = ioloop.PeriodicCallback(self._check_leases, period * 1000)
+            self._lease_checker.start()
+
+    def _check_leases(self):
+        for scheduler in self._scheduler_map.values():
+            scheduler.check_leases()
 
     def _on_event(self, _):
         while True:
@@ -320,7 +605,11 @@ class TrackerServerHandler(object):
 
     def create_scheduler(self, key):
         """Create a new scheduler."""
-        return PriorityScheduler(key)
+        if self._scheduler == "priority":
+            return PriorityScheduler(key, self.lease_timeout)
+        if self._scheduler == "fair_share":
+            return FairShareScheduler(key, self._user_weights, self.lease_timeout)
+        return self._scheduler(key)
 
     def put(self, key, value):
         """Report a new resource to the tracker."""
@@ -346,6 +635,8 @@ class TrackerServerHandler(object):
         """Safely stop tracker."""
         for conn in list(self._connections):
             conn.close()
+        if self._lease_checker is not None:
+            self._lease_checker.stop()
         self._sock.close()
         self._ioloop.stop()
 
@@ -362,14 +653,64 @@ class TrackerServerHandler(object):
                 cinfo.append(res)
         return {"queue_info": qinfo, "server_info": cinfo}
 
+    def metrics_text(self):
+        """Return the metrics of the schedulers in the Prometheus text format."""
+        return _prometheus_text({k: v.summary() for k, v in self._scheduler_map.items()})
+
+    def run_in_loop(self, func):
+        """Run func in the event loop of the tracker, from any thread.
+
+        Returns
+        -------
+        future : concurrent.futures.Future
+            The future of the result of func.
+        """
+        future = concurrent.futures.Future()
+
+        def _run():
+            # pylint: disable=broad-except
+            try:
+                future.set_result(func())
+            except Exception as err:
+                future.set_exception(err)
+
+        self._ioloop.add_callback(_run)
+        return future
+
     def run(self):
         """Run the tracker server"""
         self._ioloop.start()
 
 
-def _tracker_server(listen_sock, stop_key):
+class _MetricsHandler(http.server.BaseHTTPRequestHandler):
+    """Serve the metrics of the tracker at /metrics."""
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        """Handle a GET request"""
+        if self.path.split("?")[0] != "/metrics":
+            self.send_error(404)
+            return
+        tracker = self.server.tracker
+        if tracker is None:
+            self.send_error(503)
+            return
+        body = tracker.run_in_loop(tracker.metrics_text).result(timeout=10).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        logger.debug(*args)
+
+
+def _tracker_server(listen_sock, stop_key, metrics_server=None, **kwargs):
     asyncio.set_event_loop(asyncio.new_event_loop())
-    handler = TrackerServerHandler(listen_sock, stop_key)
+    handler = TrackerServerHandler(listen_sock, stop_key, **kwargs)
+    if metrics_server is not None:
+        metrics_server.tracker = handler
+        threading.Thread(target=metrics_server.serve_forever, daemon=True).start()
     handler.run()
 
 
@@ -378,9 +719,21 @@ class PopenTrackerServerState(object):
 
     current = None
 
-    def __init__(self, host, port=9190, port_end=9199, silent=False):
+    def __init__(
+        self,
+        host,
+        port=9190,
+        port_end=9199,
+        silent=False,
+        scheduler="priority",
+        user_weights=None,
+        lease_timeout=None,
+        metrics_port=None,
+    ):
         if silent:
             logger.setLevel(logging.WARN)
+        if not callable(scheduler) and scheduler not in ("priority", "fair_share"):
+            raise ValueError("Unknown scheduler %s" % scheduler)
 
         sock = socket.socket(base.get_addr_family((host, port)), socket.SOCK_STREAM)
         self.port = None
@@ -398,19 +751,45 @@ class PopenTrackerServerState(object):
             raise ValueError("cannot bind to any port in [%d, %d)" % (port, port_end))
         logger.info("bind to %s:%d", host, self.port)
         sock.listen(1)
-        self.thread = threading.Thread(target=_tracker_server, args=(sock, self.stop_key))
+        metrics_server = None
+        self.metrics_port = None
+        if metrics_port is not None:
+            metrics_server = http.server.ThreadingHTTPServer((host, metrics_port), _MetricsHandler)
+            metrics_server.tracker = None
+            self.metrics_port = metrics_server.server_address[1]
+            logger.info("serve metrics on %s:%d", host, self.metrics_port)
+        self.thread = threading.Thread(
+            target=_tracker_server,
+            args=(sock, self.stop_key, metrics_server),
+            kwargs={
+                "scheduler": scheduler,
+                "user_weights": user_weights,
+                "lease_timeout": lease_timeout,
+            },
+        )
         self.thread.start()
         self.host = host
 
 
-def _popen_start_tracker_server(host, port=9190, port_end=9199, silent=False):
+def _popen_start_tracker_server(
+    host,
+    port=9190,
+    port_end=9199,
+    silent=False,
+    scheduler="priority",
+    user_weights=None,
+    lease_timeout=None,
+    metrics_port=None,
+):
     # This is a function that will be sent to the
     # Popen worker to run on a separate process.
     # Create and start the server in a different thread
-    state = PopenTrackerServerState(host, port, port_end, silent)
+    state = PopenTrackerServerState(
+        host, port, port_end, silent, scheduler, user_weights, lease_timeout, metrics_port
+    )
     PopenTrackerServerState.current = state
     # returns the port so that the main can get the port number.
-    return (state.port, state.stop_key)
+    return (state.port, state.stop_key, state.metrics_port)
 
 
 class Tracker(object):
@@ -431,9 +810,38 @@ class Tracker(object):
 
     silent: bool, optional
         Whether run in silent mode
+
+    scheduler: Union[str, Callable[[str], Scheduler]], optional
+        The scheduler of the requests for each device key, either "priority" to serve
+        them by priority then request order, "fair_share" to share the servers
+        between the users in proportion to their weights, or a function creating a
+        Scheduler from a device key.
+
+    user_weights: Dict[str, float], optional
+        The weights of the users for the "fair_share" scheduler, 1 by default.
+
+    lease_timeout: float, optional
+        The maximum duration in seconds of a session. The servers end their session
+        once the lease expires and report themselves free again, and the clients use
+        it as their session timeout. Leases of servers predating lease timeouts are
+        not reclaimed, they are only logged and counted as expired.
+
+    metrics_port: int, optional
+        The port to serve the metrics of each device key in the Prometheus text format
+        at /metrics, 0 for any free port. The metrics are not served by default.
     """
 
-    def __init__(self, host="0.0.0.0", port=9190, port_end=9199, silent=False):
+    def __init__(
+        self,
+        host="0.0.0.0",
+        port=9190,
+        port_end=9199,
+        silent=False,
+        scheduler="priority",
+        user_weights=None,
+        lease_timeout=None,
+        metrics_port=None,
+    ):
         if silent:
             logger.setLevel(logging.WARN)
         self.proc = PopenWorker()
@@ -445,10 +853,14 @@ class Tracker(object):
                 port,
                 port_end,
                 silent,
+                scheduler,
+                user_weights,
+                lease_timeout,
+                metrics_port,
             ],
         )
         # receive the port
-        self.port, self.stop_key = self.proc.recv()
+        self.port, self.stop_key, self.metrics_port = self.proc.recv()
         self.host = host
 
     def _stop_tracker(self):
@@ -201,14 +201,23 @@ class NDArray(NDArrayBase):
         )
         return self.numpy()
 
-    def numpy(self):
+    def numpy(self, zero_copy=False):
         """Convert this array to numpy array
 
+        Parameters
+        ----------
+        zero_copy : bool
+            Whether to return a view of the memory of this array instead of a copy.
+            Only supported for compact arrays on CPU. The view keeps this array alive,
+            and writes to either of them are visible in the other.
+
         Returns
         -------
         np_arr : numpy.ndarray
             The corresponding numpy array.
         """
+        if zero_copy:
+            return np.asarray(_NumpyView(self))
         t = DataType(self.dtype)
         shape, dtype = self.shape, self.dtype
         old_dtype = dtype
@@ -279,6 +288,43 @@ class NDArray(NDArrayBase):
         return _ffi_api.TVMArrayCreateView(self, shape)
 
 
+class _NumpyView:
+    """Expose the memory of a CPU NDArray to numpy through the array interface.
+
+    numpy keeps the view object, and therefore the NDArray, alive as the base
+    of the arrays it creates from it.
+    """
+
+    def __init__(self, arr):
+        contents = arr.handle.contents
+        if contents.device.device_type != Device.STR2MASK["cpu"]:
+            raise ValueError("Zero-copy numpy view requires a CPU array, got %s" % arr.device)
+        t = DataType(arr.dtype)
+        shape, dtype = arr.shape, arr.dtype
+        if t.lanes > 1:
+            shape = shape + (t.lanes,)
+            t.lanes = 1
+            dtype = str(t)
+        if dtype == "bfloat16":
+            dtype = "uint16"
+        if dtype == "int4":
+            raise ValueError("Zero-copy numpy view does not support int4 arrays")
+        np_dtype = np.dtype(dtype)
+        if contents.strides:
+            expected = 1
+            for i in reversed(range(contents.ndim)):
+                if contents.shape[i] != 1 and contents.strides[i] != expected:
+                    raise ValueError("Zero-copy numpy view requires a compact array")
+                expected *= contents.shape[i]
+        self.arr = arr
+        self.__array_interface__ = {
+            "data": ((contents.data or 0) + contents.byte_offset, False),
+            "shape": shape,
+            "typestr": np_dtype.str,
+            "version": 3,
+        }
+
+
 def device(dev_type, dev_id=0):
     """Construct a TVM device with given device type and id.
 
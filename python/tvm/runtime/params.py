@@ -16,8 +16,22 @@
 # under the License.
 # pylint: disable=invalid-name
 """Helper utility to save and load parameter dicts."""
+import json
+import mmap
+import struct
+from collections.abc import Mapping
+
+import numpy as np
+
 from . import _ffi_api, ndarray
 
+# Layout of a parameter file: magic, version, size of the JSON index, the JSON index,
+# then the raw data of each parameter, each starting at an aligned offset.
+PARAM_FILE_MAGIC = b"TVMPARAM"
+PARAM_FILE_VERSION = 1
+PARAM_FILE_ALIGNMENT = 64
+_PARAM_FILE_PREFIX = struct.Struct("<8sQQ")
+
 
 def save_param_dict(params):
     """Save parameter dictionary to binary bytes.
@@ -67,3 +81,170 @@ def load_param_dict(param_bytes):
     if isinstance(param_bytes, (bytes, str)):
         param_bytes = bytearray(param_bytes)
     return _ffi_api.LoadParams(param_bytes)
+
+
+def _align(offset):
+    return (offset + PARAM_FILE_ALIGNMENT - 1) // PARAM_FILE_ALIGNMENT * PARAM_FILE_ALIGNMENT
+
+
+def save_param_file(params, path):
+    """Save parameter dictionary to a file that can be memory-mapped.
+
+    Unlike :py:func:`save_param_dict`, the parameters are written one by one, and
+    :py:func:`load_param_file` reads them lazily and without copy. The data of each
+    parameter is aligned so that it can be bound to a graph executor in place.
+
+    Parameters
+    ----------
+    params : dict of str to NDArray or numpy.ndarray
+        The parameter dictionary.
+
+    path : str
+        The path of the file.
+    """
+    index, offset = [], 0
+    for name, value in params.items():
+        if isinstance(value, ndarray.NDArray):
+            dtype, shape = value.dtype, value.shape
+        else:
+            value = np.asarray(value)
+            dtype, shape = str(value.dtype), value.shape
+        if dtype == "int4":
+            raise ValueError("Parameter %s: int4 is not supported in parameter files" % name)
+        t = ndarray.DataType(dtype)
+        nbytes = int(np.prod(shape, dtype="int64")) * (t.bits + 7) // 8 * t.lanes
+        index.append(
+            {
+                "name": name,
+                "dtype": dtype,
+                "shape": [int(dim) for dim in shape],
+                "offset": offset,
+                "nbytes": nbytes,
+            }
+        )
+        offset = _align(offset + nbytes)
+    header = json.dumps({"params": index}).encode("utf-8")
+    data_start = _align(_PARAM_FILE_PREFIX.size + len(header))
+
+    with open(path, "wb") as out:
+        out.write(_PARAM_FILE_PREFIX.pack(PARAM_FILE_MAGIC, PARAM_FILE_VERSION, len(header)))
+        out.write(header)
+        for entry in index:
+            out.write(b"\0" * (data_start + entry["offset"] - out.tell()))
+            value = params[entry["name"]]
+            if isinstance(value, ndarray.NDArray):
+                value = value.numpy()
+            out.write(np.ascontiguousarray(value).data)
+
+
+def is_param_file(path, offset=0):
+    """Check whether a file was saved by :py:func:`save_param_file`.
+
+    Parameters
+    ----------
+    path : str
+        The path of the file.
+
+    offset : int
+        The offset of the parameter file in the file, e.g. of a member of a tar file.
+
+    Returns
+    -------
+    result : bool
+        Whether the file starts with the magic of parameter files.
+    """
+    with open(path, "rb") as infile:
+        infile.seek(offset)
+        return infile.read(len(PARAM_FILE_MAGIC)) == PARAM_FILE_MAGIC
+
+
+class ParamFile(Mapping):
+    """A dictionary of the parameters in a file saved by :py:func:`save_param_file`.
+
+    Parameters cannot be added or replaced. The file is memory-mapped copy-on-write:
+    the parameters are loaded on first access as CPU NDArrays backed by the mapping,
+    so that processes loading the same file share its pages through the page cache.
+    Writes to the data of a parameter are private to the process.
+
+    Parameters
+    ----------
+    path : str
+        The path of the file.
+
+    offset : int
+        The offset of the parameter file in the file, which must be a multiple of
+        PARAM_FILE_ALIGNMENT, e.g. of a member of an uncompressed tar file.
+    """
+
+    def __init__(self, path, offset=0):
+        if offset % PARAM_FILE_ALIGNMENT != 0:
+            raise ValueError("The offset %d of a parameter file is not aligned" % offset)
+        with open(path, "rb") as infile:
+            self._mmap = mmap.mmap(infile.fileno(), 0, access=mmap.ACCESS_COPY)
+        magic, version, header_size = _PARAM_FILE_PREFIX.unpack_from(self._mmap, offset)
+        if magic != PARAM_FILE_MAGIC:
+            raise ValueError("%s is not a parameter file" % path)
+        if version != PARAM_FILE_VERSION:
+            raise ValueError("Unsupported parameter file version %d" % version)
+        start = offset + _PARAM_FILE_PREFIX.size
+        header = json.loads(bytes(self._mmap[start : start + header_size]).decode("utf-8"))
+        self._data_start = offset + _align(_PARAM_FILE_PREFIX.size + header_size)
+        self._index = {entry["name"]: entry for entry in header["params"]}
+        self._params = {}
+
+    def __getitem__(self, name):
+        if name not in self._params:
+            self._params[name] = self._load(self._index[name])
+        return self._params[name]
+
+    def _load(self, entry):
+        dtype, shape = entry["dtype"], tuple(entry["shape"])
+        # the numpy layout of the data, as in NDArray.numpy
+        t = ndarray.DataType(dtype)
+        np_shape = shape + (t.lanes,) if t.lanes > 1 else shape
+        t.lanes = 1
+        np_dtype = np.dtype("uint16" if str(t) == "bfloat16" else str(t))
+        view = np.frombuffer(
+            self._mmap,
+            np_dtype,
+            int(np.prod(np_shape, dtype="int64")),
+            self._data_start + entry["offset"],
+        ).reshape(np_shape)
+        if np_shape == shape and str(np_dtype) == dtype and hasattr(view, "__dlpack__"):
+            return ndarray.from_dlpack(view)
+        # the dtype has no numpy equivalent, e.g. bfloat16
+        return ndarray.empty(shape, dtype).copyfrom(view)
+
+    def __iter__(self):
+        return iter(self._index)
+
+    def __len__(self):
+        return len(self._index)
+
+
+def load_param_file(path, offset=0):
+    """Load parameter dictionary from a file saved by :py:func:`save_param_file`.
+
+    Parameters
+    ----------
+    path : str
+        The path of the file.
+
+    offset : int
+        The offset of the parameter file in the file, see :py:class:`ParamFile`.
+
+    Returns
+    -------
+    params : ParamFile
+        The parameter dictionary, whose parameters are loaded lazily and without copy.
+
+    Examples
+    --------
+    .. code-block:: python
+
+       tvm.runtime.save_param_file(params, "model.params")
+       params = tvm.runtime.load_param_file("model.params")
+       # bind the parameters to the graph in place
+       gmod.set_input_zero_copy(**params)
+    """
+    return ParamFile(path, offset)
@@ -26,7 +26,7 @@ from ._ffi_api import ErrorTest, FrontendTestModule, identity_cpp
 
 from .popen_pool import initializer, after_initializer, register_ffi, call_cpp_ffi
 from .popen_pool import call_py_ffi, call_cpp_py_ffi, fast_summation, slow_summation
-from .popen_pool import timeout_job
+from .popen_pool import timeout_job, sum_and_double
 
 from .tir import check_error
 
@@ -73,3 +73,7 @@ def slow_summation(n):
 
 def timeout_job(n):
     _ffi_api.sleep_in_ffi(n * 1.5)
+
+
+def sum_and_double(array, payload):
+    return array.sum() + len(payload), array * 2
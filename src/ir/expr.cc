@@ -76,6 +76,26 @@ TVM_REGISTER_GLOBAL("ir.IntImm").set_body_typed([](DataType dtype, int64_t value
 
 TVM_REGISTER_NODE_TYPE(IntImmNode);
 
+// Export the values of an array of IntImm as the bytes of an int64 buffer,
+// or None when some element is not an IntImm.
+TVM_REGISTER_GLOBAL("ir.IntImmArrayToBytes").set_body([](TVMArgs args, TVMRetValue* ret) {
+  Array<ObjectRef> arr = args[0];
+  std::vector<int64_t> values;
+  values.reserve(arr.size());
+  for (const ObjectRef& elem : arr) {
+    const auto* imm = elem.as<IntImmNode>();
+    if (imm == nullptr) {
+      *ret = nullptr;
+      return;
+    }
+    values.push_back(imm->value);
+  }
+  TVMByteArray bytes;
+  bytes.data = reinterpret_cast<const char*>(values.data());
+  bytes.size = values.size() * sizeof(int64_t);
+  *ret = bytes;
+});
+
 TVM_STATIC_IR_FUNCTOR(ReprPrinter, vtable)
     .set_dispatch<IntImmNode>([](const ObjectRef& node, ReprPrinter* p) {
       auto* op = static_cast<const IntImmNode*>(node.get());
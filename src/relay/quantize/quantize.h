@@ -74,6 +74,7 @@ class QConfigNode : public Object {
   Array<Expr> debug_enabled_ops = Array<Expr>(ObjectPtr<Object>(nullptr));
   std::string rounding = "UPWARD";
   int calibrate_chunk_by = -1;
+  bool calibrate_streaming = false;
   std::string partition_conversions = "disabled";
 
   void VisitAttrs(AttrVisitor* v) {
@@ -93,6 +94,7 @@ class QConfigNode : public Object {
     v->Visit("debug_enabled_ops", &debug_enabled_ops);
     v->Visit("rounding", &rounding);
     v->Visit("calibrate_chunk_by", &calibrate_chunk_by);
+    v->Visit("calibrate_streaming", &calibrate_streaming);
     v->Visit("partition_conversions", &partition_conversions);
   }
 
@@ -66,6 +66,24 @@ TVM_REGISTER_GLOBAL("runtime.ArraySize").set_body([](TVMArgs args, TVMRetValue*
   *ret = static_cast<int64_t>(static_cast<const ArrayNode*>(ptr)->size());
 });
 
+// Pass all the elements of an array to a callback in a single call,
+// so that the frontend can convert the whole array at once.
+TVM_REGISTER_GLOBAL("runtime.ArrayExport").set_body([](TVMArgs args, TVMRetValue* ret) {
+  ICHECK_EQ(args[0].type_code(), kTVMObjectHandle);
+  Object* ptr = static_cast<Object*>(args[0].value().v_handle);
+  ICHECK(ptr->IsInstance<ArrayNode>());
+  auto* n = static_cast<const ArrayNode*>(ptr);
+  PackedFunc callback = args[1];
+  int num_args = static_cast<int>(n->size());
+  std::vector<TVMValue> values(num_args);
+  std::vector<int> type_codes(num_args);
+  TVMArgsSetter setter(values.data(), type_codes.data());
+  for (int i = 0; i < num_args; ++i) {
+    setter(i, n->at(i));
+  }
+  callback.CallPacked(TVMArgs(values.data(), type_codes.data(), num_args), ret);
+});
+
 // ADT
 
 TVM_REGISTER_OBJECT_TYPE(ADTObj);
@@ -180,6 +198,26 @@ TVM_REGISTER_GLOBAL("runtime.MapItems").set_body([](TVMArgs args, TVMRetValue* r
   *ret = std::move(rkvs);
 });
 
+// Pass all the keys and values of a map to a callback in a single call,
+// as interleaved arguments k0, v0, k1, v1, ...
+TVM_REGISTER_GLOBAL("runtime.MapExport").set_body([](TVMArgs args, TVMRetValue* ret) {
+  ICHECK_EQ(args[0].type_code(), kTVMObjectHandle);
+  Object* ptr = static_cast<Object*>(args[0].value().v_handle);
+  ICHECK(ptr->IsInstance<MapNode>());
+  auto* n = static_cast<const MapNode*>(ptr);
+  PackedFunc callback = args[1];
+  int num_args = static_cast<int>(n->size() * 2);
+  std::vector<TVMValue> values(num_args);
+  std::vector<int> type_codes(num_args);
+  TVMArgsSetter setter(values.data(), type_codes.data());
+  int i = 0;
+  for (const auto& kv : *n) {
+    setter(i++, kv.first);
+    setter(i++, kv.second);
+  }
+  callback.CallPacked(TVMArgs(values.data(), type_codes.data(), num_args), ret);
+});
+
 #if (USE_FALLBACK_STL_MAP == 0)
 TVM_DLL constexpr uint64_t DenseMapNode::kNextProbeLocation[];
 #endif
@@ -60,6 +60,21 @@ def test_fp16_conversion():
         tvm.testing.assert_allclose(expected, real)
 
 
+def test_numpy_zero_copy():
+    x = np.random.uniform(size=(3, 4)).astype("float32")
+    y = tvm.nd.array(x)
+    view = y.numpy(zero_copy=True)
+    np.testing.assert_equal(view, x)
+    view[0, 0] = 42.0
+    assert y.numpy()[0, 0] == 42.0
+
+    # the view keeps the array alive
+    del y
+    np.testing.assert_equal(view[1:], x[1:])
+
+    assert tvm.nd.empty((0,), "int32").numpy(zero_copy=True).shape == (0,)
+
+
 def test_dtype():
     dtype = tvm.DataType("handle")
     assert dtype.type_code == tvm.DataTypeCode.HANDLE
@@ -68,4 +83,5 @@ def test_dtype():
 if __name__ == "__main__":
     test_nd_create()
     test_fp16_conversion()
+    test_numpy_zero_copy()
     test_dtype()
@@ -17,8 +17,10 @@
 """Test PopenPoolExecutor."""
 import pytest
 import os
+import sys
 import psutil
 import time
+import numpy as np
 from tvm.contrib.popen_pool import PopenWorker, PopenPoolExecutor
 from tvm.testing import (
     identity_after,
@@ -32,6 +34,7 @@ from tvm.testing import (
     fast_summation,
     slow_summation,
     timeout_job,
+    sum_and_double,
 )
 
 
@@ -79,6 +82,41 @@ def test_popen_worker_recycles():
     assert not psutil.pid_exists(initial_pid)
 
 
+def test_popen_worker_recycles_by_rss():
+    proc = PopenWorker(maximum_rss=1)
+
+    proc.send(os.getpid)
+    initial_pid = proc.recv()
+
+    # Any process exceeds 1 byte of resident memory, so it is recycled with this send.
+    proc.send(os.getpid)
+    assert proc.recv() != initial_pid
+    assert not psutil.pid_exists(initial_pid)
+
+
+def test_popen_worker_stay_warm():
+    initargs = [1, 2, 3]
+    proc = PopenWorker(initializer=initializer, initargs=initargs, maximum_uses=1, stay_warm=True)
+
+    proc.send(os.getpid)
+    initial_pid = proc.recv()
+    # The process is restarted right after its last use.
+    assert not psutil.pid_exists(initial_pid)
+    assert proc.is_alive()
+
+    proc.send(after_initializer)
+    assert list(proc.recv()) == initargs
+
+    with pytest.raises(TimeoutError):
+        proc.send(identity_after, [1, 100], timeout=0.01)
+        proc.recv()
+    # The process is restarted right after the timeout as well.
+    assert proc.is_alive()
+
+    proc.send(identity_after, [2, 0])
+    assert proc.recv() == 2
+
+
 def test_popen_pool_executor():
     import tvm
 
@@ -179,12 +217,113 @@ def test_popen_pool_executor_recycles():
     assert initial_pid != pool.submit(os.getpid).result()
 
 
+@pytest.mark.skipif(sys.platform == "win32", reason="fork is not available on Windows")
+def test_popen_worker_zygote():
+    initargs = [1, 2, 3]
+    proc = PopenWorker(
+        initializer=initializer, initargs=initargs, maximum_uses=2, start_method="zygote"
+    )
+
+    proc.send(os.getpid)
+    initial_pid = proc.recv()
+    assert initial_pid != os.getpid()
+
+    proc.send(after_initializer)
+    assert list(proc.recv()) == initargs
+
+    # The process should be forked again with this send, and run the initializer.
+    proc.send(os.getpid)
+    assert proc.recv() != initial_pid
+    proc.send(after_initializer)
+    assert list(proc.recv()) == initargs
+
+    with pytest.raises(TimeoutError):
+        proc.send(identity_after, [1, 100], timeout=0.01)
+        proc.recv()
+
+    proc.send(terminate_self)
+    worker = proc._proc
+    # The exit code of sys.exit(-1) is reported as for a worker started by popen
+    assert worker.wait(timeout=10) == 255
+    assert worker.poll() == 255
+    with pytest.raises(ChildProcessError):
+        proc.recv()
+
+    proc.send(identity_after, [2, 0])
+    assert proc.recv() == 2
+    pid = proc._proc.pid
+    proc.kill()
+    assert not psutil.pid_exists(pid)
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="fork is not available on Windows")
+def test_popen_pool_executor_zygote():
+    pool = PopenPoolExecutor(max_workers=2, maximum_process_uses=1, start_method="zygote")
+
+    pids = [pool.submit(os.getpid) for _ in range(8)]
+    assert len(set(future.result() for future in pids)) == 8
+
+    pool = PopenPoolExecutor(max_workers=1, timeout=0.5, start_method="zygote")
+    with pytest.raises(TimeoutError):
+        pool.submit(timeout_job, 0.5).result()
+    assert pool.submit(fast_summation, 10).result() == 55
+
+    with pytest.raises(ValueError):
+        PopenPoolExecutor(start_method="spawn")
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX shared memory is required")
+def test_popen_worker_shared_memory():
+    proc = PopenWorker(shared_memory_threshold=1024)
+    array = np.arange(4096, dtype="float32")
+    payload = bytes(1 << 16)
+
+    proc.send(sum_and_double, [array, payload])
+    total, doubled = proc.recv()
+    assert total == array.sum() + len(payload)
+    np.testing.assert_equal(doubled, array * 2)
+    stats = proc.ipc_stats
+    assert stats.pipe_bytes_sent < 4096
+    assert stats.shared_memory_bytes_sent == array.nbytes + len(payload)
+    assert stats.shared_memory_bytes_cached == 0
+    assert stats.shared_memory_bytes_received == array.nbytes
+
+    # The payloads are cached by the worker
+    proc.send(sum_and_double, [array, payload])
+    proc.recv()
+    assert proc.ipc_stats.shared_memory_bytes_sent == 0
+    assert proc.ipc_stats.shared_memory_bytes_cached == array.nbytes + len(payload)
+
+    # Small payloads stay in the pipe
+    proc.send(sum_and_double, [array[:4], b"a"])
+    proc.recv()
+    assert proc.ipc_stats.shared_memory_bytes_sent == 0
+    assert proc.ipc_stats.shared_memory_bytes_cached == 0
+
+    with pytest.raises(TimeoutError):
+        proc.send(identity_after, [array, 100], timeout=0.01)
+        proc.recv()
+    proc.send(identity_after, [array, 0])
+    np.testing.assert_equal(proc.recv(), array)
+
+    pool = PopenPoolExecutor(max_workers=2, shared_memory_threshold=1024)
+    futures = [pool.submit(sum_and_double, array, payload) for _ in range(4)]
+    for future in futures:
+        assert future.result()[0] == array.sum() + len(payload)
+    assert pool.ipc_stats().shared_memory_bytes_received == 4 * array.nbytes
+
+
 if __name__ == "__main__":
     test_popen_worker()
     test_popen_worker_recycles()
+    test_popen_worker_recycles_by_rss()
+    test_popen_worker_stay_warm()
     test_popen_pool_executor()
     test_popen_initializer()
     test_popen_worker_recycles_with_initializer()
     test_popen_ffi()
     test_popen_pool_executor_timeout()
     test_popen_pool_executor_recycles()
+    test_popen_worker_zygote()
+    test_popen_pool_executor_zygote()
+    test_popen_worker_shared_memory()
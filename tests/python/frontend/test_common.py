@@ -14,7 +14,18 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
-from tvm.relay.frontend.common import StrAttrsDict
+import numpy as np
+
+import tvm
+from tvm import relay
+from tvm.relay.frontend.common import (
+    IncrementalTypeInference,
+    InferValueCache,
+    StrAttrsDict,
+    infer_shape,
+    infer_type,
+    infer_value,
+)
 
 
 def test_key_is_present():
@@ -27,6 +38,55 @@ def test_key_is_not_present():
     assert not attrs.has_attr("b")
 
 
+def test_incremental_type_inference():
+    x = relay.var("x", shape=(4, 8), dtype="float32")
+    y = relay.nn.relu(relay.add(x, relay.const(1.0)))
+    expected = infer_shape(y)
+
+    with IncrementalTypeInference() as scope:
+        assert infer_shape(y) == expected
+        z = relay.reshape(y, (8, 4))
+        assert infer_shape(z) == (8, 4)
+        # Queries with a function fall back to full type inference
+        func = relay.Function([x], z)
+        assert isinstance(infer_type(func).checked_type, relay.FuncType)
+    assert scope.num_incremental == 2
+    assert scope.num_fallback == 1
+    assert IncrementalTypeInference.current is None
+
+    with IncrementalTypeInference(enabled=False) as scope:
+        assert infer_shape(y) == expected
+    assert scope.num_incremental == 0
+
+
+def test_infer_value_cache():
+    x = relay.var("x", shape=(2, 3), dtype="float32")
+    shape = relay.shape_of(x)
+    # Shape -> Gather -> Concat
+    new_shape = relay.concatenate(
+        [relay.take(shape, relay.const([1])), relay.const([-1], "int64")], 0
+    )
+    const_expr = relay.add(relay.const(np.ones(3, "float32")), relay.const(2.0))
+
+    with InferValueCache() as cache:
+        # The shape of the graph input x is known without a value for x
+        np.testing.assert_equal(infer_value(new_shape, {}).numpy(), [3, -1])
+        assert cache.num_numpy == 1
+        np.testing.assert_equal(infer_value(const_expr, {}).numpy(), [3.0, 3.0, 3.0])
+        assert cache.num_folded == 1
+
+        for value in [1.0, 2.0]:
+            y = relay.var("y", shape=(3,), dtype="float32")
+            params = {"y": tvm.nd.array(np.full(3, value, "float32"))}
+            result = infer_value(relay.exp(y), params)
+            np.testing.assert_allclose(result.numpy(), np.exp(np.full(3, value)), rtol=1e-5)
+        assert cache.num_builds == 1
+        assert cache.num_cache_hits == 1
+        assert cache.num_builds_avoided == 3
+
+
 if __name__ == "__main__":
     test_key_is_present()
     test_key_is_present()
+    test_incremental_type_inference()
+    test_infer_value_cache()
@@ -15,6 +15,7 @@
 # specific language governing permissions and limitations
 # under the License.
 import os
+import tarfile
 import numpy as np
 import tvm
 from tvm import te, runtime
@@ -39,6 +40,44 @@ def test_save_load():
     np.testing.assert_equal(param2["y"].numpy(), y)
 
 
+def test_save_load_param_file():
+    x = np.random.uniform(size=(10, 3)).astype("float32")
+    y = np.arange(7).astype("int8")
+    z = tvm.nd.array(np.ones((2, 2)).astype("float16"))
+    path = utils.tempdir().relpath("params.bin")
+    runtime.save_param_file({"x": x, "y": y, "z": z}, path)
+    assert runtime.params.is_param_file(path)
+
+    params = runtime.load_param_file(path)
+    assert sorted(params) == ["x", "y", "z"]
+    np.testing.assert_equal(params["x"].numpy(), x)
+    np.testing.assert_equal(params["y"].numpy(), y)
+    np.testing.assert_equal(params["z"].numpy(), z.numpy())
+    # parameters are mapped without copy, at an aligned address
+    for name in params:
+        assert params[name].handle.contents.data % runtime.params.PARAM_FILE_ALIGNMENT == 0
+
+    # the parameters can be bound to a graph executor in place
+    a = relay.var("x", shape=(10, 3))
+    b = relay.var("b", shape=(10, 3))
+    lib = relay.build(relay.Function([a, b], add(a, b)), target="llvm")
+    mod = graph_executor.GraphModule(lib["default"](tvm.cpu()))
+    mod.set_input_zero_copy(x=params["x"])
+    mod.run(b=np.ones((10, 3), "float32"))
+    np.testing.assert_allclose(mod.get_output(0).numpy(), x + 1)
+
+    # the parameters can be mapped from a member of an uncompressed tar file
+    tar_path = utils.tempdir().relpath("model.tar")
+    with tarfile.open(tar_path, "w") as tar:
+        tar.add(path, "model.params")
+    with tarfile.open(tar_path) as tar:
+        offset = tar.getmember("model.params").offset_data
+    assert runtime.params.is_param_file(tar_path, offset)
+    params = runtime.load_param_file(tar_path, offset)
+    np.testing.assert_equal(params["x"].numpy(), x)
+    np.testing.assert_equal(params["z"].numpy(), z.numpy())
+
+
 def test_ndarray_reflection():
     # Make two `NDArrayWrapper`s that point to the same underlying array.
     np_array = np.random.uniform(size=(10, 2)).astype("float32")
@@ -91,5 +130,6 @@ def test_bigendian_rpc_param():
 
 if __name__ == "__main__":
     test_save_load()
+    test_save_load_param_file()
     test_ndarray_reflection()
     test_bigendian_rpc_param()
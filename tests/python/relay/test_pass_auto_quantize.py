@@ -173,6 +173,39 @@ def test_calibrate_percentile():
         relay.quantize.quantize(mod, params, dataset)
 
 
+@pytest.mark.parametrize("calibrate_mode", ["kl_divergence", "percentile"])
+def test_calibrate_streaming(calibrate_mode):
+    mod, params = testing.synthetic.get_workload()
+    # A generator can only be iterated once
+    dataset = iter(get_calibration_dataset(mod, "data"))
+    with relay.quantize.qconfig(calibrate_mode=calibrate_mode, calibrate_streaming=True):
+        relay.quantize.quantize(mod, params, dataset)
+
+
+def test_streaming_histogram():
+    from tvm.relay.quantize._calibrate import (
+        _StreamingHistogram,
+        _find_scale_by_percentile,
+        _find_scale_by_percentile_histogram,
+    )
+
+    batches = [np.random.normal(scale=scale, size=10000) for scale in [0.5, 2.0, 1.0]]
+    samples = np.concatenate(batches)
+    hist = _StreamingHistogram()
+    for batch in batches:
+        hist.update(batch)
+    assert hist.hist.sum() == samples.size
+    assert hist.min_val == samples.min() and hist.max_val == samples.max()
+    thres = np.abs(samples).max()
+    np.testing.assert_allclose(hist.hist_edges[[0, -1]], [-thres, thres])
+
+    bin_width = 2 * thres / hist.num_bins
+    for percentile in [0.99, 0.99999]:
+        expected = _find_scale_by_percentile(samples, percentile)
+        scale = _find_scale_by_percentile_histogram(hist.hist, hist.hist_edges, percentile)
+        assert abs(scale - expected) <= 2 * bin_width
+
+
 ####################################
 # Quant/Dequant Partitioning Tests #
 ####################################
@@ -448,6 +481,9 @@ if __name__ == "__main__":
     test_calibrate_target(True)
     test_calibrate_memory_bound()
     test_calibrate_percentile()
+    test_calibrate_streaming("kl_divergence")
+    test_calibrate_streaming("percentile")
+    test_streaming_histogram()
 
     test_add_partition()
     test_conv2d_partition()
@@ -17,6 +17,7 @@
 
 """ Test measurement and log serialization. """
 import json
+import os
 
 import multiprocessing
 import numpy as np
@@ -203,6 +204,53 @@ def test_recover_measure_input():
         assert str(correct_inp.state) == str(inp.state)
 
 
+def test_load_best_records():
+    inputs, results = [], []
+    for size, costs in [(128, [0.3, 0.2, 0.4]), (256, [0.5, 0.6])]:
+        task = auto_scheduler.SearchTask(
+            func=matmul_auto_scheduler_test, args=(size, size, size), target="llvm"
+        )
+        inp = auto_scheduler.measure.MeasureInput(task, task.compute_dag.init_state)
+        for cost in costs:
+            inputs.append(inp)
+            results.append(auto_scheduler.measure.MeasureResult([cost], 0, "", 0.2, 1))
+    # A failed record is never the best one
+    results[-1] = auto_scheduler.measure.MeasureResult([0.1], 2, "", 0.2, 1)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        log_file = os.path.join(tmpdir, "log.json")
+        cache_file = log_file + ".best"
+        auto_scheduler.save_records(log_file, inputs, results)
+
+        streamed = list(auto_scheduler.iter_records(log_file, chunk_size=2))
+        assert len(streamed) == len(inputs)
+
+        for _ in range(2):
+            # The second iteration reads the cache file
+            best = auto_scheduler.load_best_records(log_file, cache_file=cache_file)
+            assert [res.costs[0].value for _, res in best] == [0.2, 0.5]
+            assert os.path.exists(cache_file)
+
+        # Appending to the log invalidates the cache
+        auto_scheduler.save_records(
+            log_file,
+            [inputs[0]],
+            [auto_scheduler.measure.MeasureResult([0.1], 0, "", 0.2, 1)],
+        )
+        best = auto_scheduler.load_best_records(log_file, cache_file=cache_file)
+        assert sorted(res.costs[0].value for _, res in best) == [0.1, 0.5]
+
+        ctx = auto_scheduler.ApplyHistoryBest(log_file, cache_best_records=True)
+        assert len(ctx.best_by_targetkey["cpu"]) == 1
+        entry = list(ctx.best_by_targetkey["cpu"].values())[0]
+        assert sorted(cost for _, cost in entry.values()) == [0.1, 0.5]
+
+        # Loading the first lines only sees the records in them
+        ctx = auto_scheduler.ApplyHistoryBest(log_file, n_lines=1)
+        entry = list(ctx.best_by_targetkey["cpu"].values())[0]
+        assert [cost for _, cost in entry.values()] == [0.3]
+
+
 def test_workload_dis_factor():
     calc = auto_scheduler.utils.calc_workload_dis_factor
     decode = auto_scheduler.utils.decode_workload_key
@@ -23,9 +23,11 @@
 import os
 import copy
 import numpy as np
+import pytest
 import tvm
 from tvm import te
 import tvm.relay.testing
+import tvm.contrib.utils
 
 from tvm import autotvm
 from tvm import relay
@@ -231,6 +233,46 @@ def test_graph_tuner_layout_transform_runner():
         )
 
 
+def test_graph_tuner_layout_transform_cache():
+    log_file = "%s/test_tuner.log" % (os.getcwd())
+    target = "llvm"
+    dshape = (1, 3, 8, 8)
+    dtype = "float32"
+    layout = "NCHW"
+    conv2d = relay.op.get("nn.conv2d")
+    target_ops = [conv2d]
+    cache_file = tvm.contrib.utils.tempdir().relpath("layout_transform.log")
+
+    g, records, _, _, _ = _create_data(target, dshape, dtype, layout)
+    executor = DPTuner(g, {"data": dshape}, records, target_ops, target=target, log_file=log_file)
+    executor.benchmark_layout_transform(min_exec_num=1, cache_file=cache_file)
+    measured = executor.layout_transform_perf_records
+    with open(cache_file) as cache:
+        num_rows = len(cache.readlines())
+    # Each distinct layout transformation is measured once
+    assert num_rows == len(measured)
+
+    class _FailingRunner(autotvm.LocalRunner):
+        def set_task(self, task):
+            raise RuntimeError("Layout transformation %s is not cached" % str(task.workload))
+
+    executor = DPTuner(g, {"data": dshape}, records, target_ops, target=target, log_file=log_file)
+    executor.benchmark_layout_transform(cache_file=cache_file, runner=_FailingRunner())
+    cached = executor.layout_transform_perf_records
+    assert sorted(cached) == sorted(measured)
+    for ltf_workload, (_, res) in cached.items():
+        assert res.costs == measured[ltf_workload][1].costs
+    with open(cache_file) as cache:
+        assert len(cache.readlines()) == num_rows
+
+    # Another target does not reuse the records
+    executor = DPTuner(
+        g, {"data": dshape}, records, target_ops, target="llvm -mcpu=core-avx2", log_file=log_file
+    )
+    with pytest.raises(RuntimeError, match="is not cached"):
+        executor.benchmark_layout_transform(cache_file=cache_file, runner=_FailingRunner())
+
+
 def test_DPTuner_run():
     log_file = "%s/test_tuner.log" % (os.getcwd())
     target = "llvm"
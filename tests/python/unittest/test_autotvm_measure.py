@@ -18,6 +18,7 @@
 import logging
 import multiprocessing
 import concurrent
+import os
 
 import numpy as np
 
@@ -50,6 +51,48 @@ def test_task_tuner_without_measurement():
         assert tuner.best_flops > 1
 
 
+class DummyPipelineRunner(DummyRunner):
+    def __init__(self):
+        super(DummyPipelineRunner, self).__init__()
+        self.build_dirs = set()
+
+    def submit(self, measure_input, build_result):
+        self.build_dirs.add(os.path.dirname(build_result.filename))
+        future = concurrent.futures.Future()
+        future.set_result(self.run([measure_input], [build_result])[0])
+        return future
+
+
+def test_task_tuner_pipeline():
+    """test that a pipelined tuning measures every config once"""
+    task, _ = get_sample_task()
+
+    runner = DummyPipelineRunner()
+    measure_option = autotvm.measure_option(builder=autotvm.LocalBuilder(), runner=runner)
+    measured = []
+
+    def record(_, inputs, results):
+        assert len(inputs) == len(results)
+        measured.extend(str(inp.config) for inp in inputs)
+
+    tuner = autotvm.tuner.RandomTuner(task)
+    tuner.tune(n_trial=10, measure_option=measure_option, callbacks=[record], pipeline=True)
+    assert len(measured) == 10
+    assert len(set(measured)) == 10
+    assert tuner.best_flops > 1
+    assert tuner.measure_utilization.build_time > 0
+    # The programs of each batch are removed once the batch is measured
+    assert runner.build_dirs
+    assert not any(os.path.exists(build_dir) for build_dir in runner.build_dirs)
+
+    # GATuner needs the scores of a batch before proposing the next one
+    runner.build_dirs.clear()
+    tuner = autotvm.tuner.GATuner(task, pop_size=4)
+    tuner.tune(n_trial=10, measure_option=measure_option, pipeline=True)
+    assert not runner.build_dirs
+    assert tuner.best_flops > 1
+
+
 def task_tuner_spawn():
     assert multiprocessing.get_start_method(False) == "spawn"
     test_task_tuner_without_measurement()
@@ -91,4 +134,5 @@ if __name__ == "__main__":
 
     test_task_tuner_without_measurement()
     test_task_tuner_without_measurement_spawn()
+    test_task_tuner_pipeline()
     test_task_runner_with_ref_input()
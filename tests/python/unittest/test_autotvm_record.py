@@ -15,6 +15,7 @@
 # specific language governing permissions and limitations
 # under the License.
 """test the correctness of dump and load of data log"""
+import os
 import time
 
 import tvm
@@ -78,6 +79,57 @@ def test_file_io():
     assert str(x) == str(inputs[0][2])
 
 
+def test_record_index():
+    temp = utils.tempdir()
+    file_path = temp.relpath("temp.log")
+
+    tsk, target = get_sample_task()
+    costs = [0.5, 0.3, 0.4, 0.1, 0.2]
+    with open(file_path, "w") as fo:
+        cb = autotvm.callback.log_to_file(fo)
+        cb(
+            None,
+            [MeasureInput(target, tsk, tsk.config_space.get(i)) for i in range(3)],
+            [MeasureResult((cost,), 0, 0, 0) for cost in costs[:3]],
+        )
+
+    best = autotvm.record.load_index(file_path)
+    assert os.path.isfile(file_path + ".idx")
+    records = list(autotvm.record.load_best_from_file(file_path))
+    assert len(records) == 1
+    assert str(records[0][0].config) == str(tsk.config_space.get(1))
+
+    # Append records, including a failed one with a lower cost
+    with open(file_path, "a") as fo:
+        cb = autotvm.callback.log_to_file(fo)
+        cb(
+            None,
+            [MeasureInput(target, tsk, tsk.config_space.get(i)) for i in range(3, 6)],
+            [
+                MeasureResult((costs[3],), 0, 0, 0),
+                MeasureResult((costs[4],), 0, 0, 0),
+                MeasureResult((0.01,), MeasureErrorNo.RUNTIME_DEVICE, 0, 0),
+            ],
+        )
+    best_appended = autotvm.record.load_index(file_path)
+    assert len(best_appended) == len(best)
+    hist_best = ApplyHistoryBest(file_path)
+    x = hist_best.query(target, tsk.workload)
+    assert str(x) == str(tsk.config_space.get(3))
+
+    # Rewrite the log, the index has to be rebuilt
+    with open(file_path, "w") as fo:
+        cb = autotvm.callback.log_to_file(fo)
+        cb(
+            None,
+            [MeasureInput(target, tsk, tsk.config_space.get(i)) for i in range(8)],
+            [MeasureResult((1.0 + i,), 0, 0, 0) for i in range(8)],
+        )
+    hist_best = ApplyHistoryBest(file_path)
+    x = hist_best.query(target, tsk.workload)
+    assert str(x) == str(tsk.config_space.get(0))
+
+
 def test_apply_history_best():
     tsk, target = get_sample_task()
 
@@ -101,3 +153,4 @@ if __name__ == "__main__":
     test_load_dump()
     test_apply_history_best()
     test_file_io()
+    test_record_index()
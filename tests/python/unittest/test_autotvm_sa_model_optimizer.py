@@ -0,0 +1,74 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Test the simulated annealing model optimizer of autotvm"""
+import numpy as np
+import pytest
+
+import tvm
+import tvm.testing
+from tvm.autotvm.tuner.sa_model_optimizer import SimulatedAnnealingOptimizer, random_walk_batch
+from tvm.testing.autotvm import get_sample_task
+
+
+class SinModel:
+    """A deterministic cost model for testing"""
+
+    def predict(self, xs):
+        return np.sin(np.asarray(xs, dtype="float64") * 1.7) + 1.0
+
+
+def test_random_walk_batch():
+    dims = np.array([3, 1, 4, 5], dtype=np.int64)
+    strides = np.array([1, 3, 3, 12], dtype=np.int64)
+    points = np.random.randint(0, 60, size=1000).astype(np.int64)
+    new_points = random_walk_batch(points, dims, strides)
+    assert (new_points != points).all()
+    assert ((new_points >= 0) & (new_points < 60)).all()
+    old_knobs = (points[:, None] // strides) % dims
+    new_knobs = (new_points[:, None] // strides) % dims
+    # exactly one knob changes
+    assert ((old_knobs != new_knobs).sum(axis=1) == 1).all()
+
+
+@pytest.mark.parametrize("vectorized", [True, False])
+def test_find_maximums(vectorized):
+    task, _ = get_sample_task()
+    space_size = len(task.config_space)
+    model = SinModel()
+    exclusive = set(range(0, space_size, 3))
+    num = 8
+
+    # sampling the whole space in the first round finds the global maximums
+    optimizer = SimulatedAnnealingOptimizer(
+        task, n_iter=20, parallel_size=space_size, vectorized=vectorized
+    )
+    maximums = optimizer.find_maximums(model, num, exclusive)
+    candidates = np.array([x for x in range(space_size) if x not in exclusive])
+    expected = candidates[np.argsort(-model.predict(candidates), kind="stable")][:num]
+    assert maximums == list(expected)
+
+    # a partial sample still returns unique, non-excluded points in descending order
+    optimizer = SimulatedAnnealingOptimizer(task, n_iter=20, parallel_size=8, vectorized=vectorized)
+    maximums = optimizer.find_maximums(model, num, exclusive)
+    assert len(maximums) == len(set(maximums)) <= num
+    assert not set(maximums) & exclusive
+    scores = model.predict(maximums)
+    assert (np.diff(scores) <= 0).all()
+
+
+if __name__ == "__main__":
+    tvm.testing.main()
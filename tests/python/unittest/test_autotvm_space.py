@@ -16,6 +16,8 @@
 # under the License.
 """Test space definition primitives"""
 
+import numpy as np
+
 import tvm
 from tvm import te
 from tvm.autotvm.task.space import ConfigSpace, FallbackConfigEntity
@@ -102,5 +104,29 @@ def test_split():
         pass
 
 
+def test_flatten_features():
+    cfg = ConfigSpace()
+    y, x = cfg.axis(64), cfg.axis(32)
+    cfg.define_split("tile_y", y, num_outputs=2)
+    cfg.define_split("tile_x", x, num_outputs=3)
+    cfg.define_reorder("reorder", [y, x], policy="all")
+    cfg.define_annotate("ann", [y, x], policy="try_unroll")
+    cfg.define_knob("unroll", [0, 512, 1500])
+
+    indexes = np.random.randint(0, len(cfg), size=100)
+    feas = cfg.get_flatten_features(indexes)
+    assert feas.dtype == np.float32
+    expected = np.array([cfg.get(int(i)).get_flatten_feature() for i in indexes])
+    np.testing.assert_equal(feas, expected)
+
+    assert cfg.get_flatten_features([]).shape == (0, feas.shape[1])
+    try:
+        cfg.get_flatten_features([len(cfg)])
+        assert False
+    except IndexError:
+        pass
+
+
 if __name__ == "__main__":
     test_split()
+    test_flatten_features()
@@ -23,6 +23,7 @@ import tvm
 from tvm import te
 from tvm import autotvm
 from tvm.autotvm import MeasureInput, MeasureResult
+from tvm.autotvm.tuner.model_based_tuner import ArrayFeatureCache, FeatureCache
 from tvm.autotvm.tuner.xgboost_cost_model import XGBoostCostModel
 
 from tvm.testing.autotvm import get_sample_task, get_sample_records
@@ -87,8 +88,55 @@ def test_update():
     assert all(x in tuner.visited for x in tuner.xs)
 
 
+def test_array_feature_cache():
+    features = {i: np.random.rand(4).astype("float32") for i in range(20)}
+    features[3] = None  # a failed extraction
+    cache = ArrayFeatureCache(max_bytes=8 * 4 * 4)  # 8 rows
+
+    indexes = [0, 1, 2, 3, 0]
+    missing = cache.missing(indexes)
+    assert missing == [0, 1, 2, 3]
+    ret = cache.gather(indexes, {i: features[i] for i in missing})
+    np.testing.assert_equal(ret[[0, 1, 2, 4]], [features[i] for i in [0, 1, 2, 0]])
+    np.testing.assert_equal(ret[3], np.zeros(4))
+    assert cache.missing(indexes) == []
+
+    # A batch larger than the cache is still gathered completely
+    indexes = list(range(4, 20))
+    ret = cache.gather(indexes, {i: features[i] for i in indexes})
+    np.testing.assert_equal(ret, [features[i] for i in indexes])
+    assert cache.max_rows == 8
+    assert len(cache.missing(range(20))) >= 20 - 8 - 1
+
+    # The clock hand skips the recently hit rows
+    cache = ArrayFeatureCache(max_bytes=8 * 4 * 4)
+    cache.gather(list(range(9)), {i: features[i] for i in range(9)})
+    cache.gather([9], {9: features[9]})  # clears all reference bits and evicts 0
+    assert cache.missing(range(10)) == [0]
+    cache.gather([1])
+    cache.gather([10], {10: features[10]})
+    assert cache.missing(range(11)) == [0, 2]
+    np.testing.assert_equal(cache[1], features[1])
+
+
+def test_shared_feature_cache():
+    task, _ = get_sample_task()
+    feature_cache = FeatureCache()
+    model_a = XGBoostCostModel(
+        task, feature_type="knob", loss_type="rank", feature_cache=feature_cache
+    )
+    model_b = XGBoostCostModel(
+        task, feature_type="knob", loss_type="rank", feature_cache=feature_cache
+    )
+    feas = model_a._get_feature(np.arange(10))
+    assert feature_cache.size("knob") == 10
+    np.testing.assert_equal(model_b._get_feature(np.arange(10)), feas)
+
+
 if __name__ == "__main__":
     test_fit()
     test_fit_spawn()
     test_tuner()
     test_update()
+    test_array_feature_cache()
+    test_shared_feature_cache()
@@ -28,6 +28,28 @@ def test_array():
     assert (a_slice[0].value, a_slice[1].value) == (1, 2)
 
 
+def test_array_bulk_conversion():
+    a = tvm.runtime.convert(list(range(10000)))
+    values = a.to_list()
+    assert len(values) == 10000
+    assert [x.value for x in values[:3]] == [0, 1, 2]
+    assert [x.value for x in a][-1] == 9999
+    assert [x.value for x in a[10:20:3]] == [10, 13, 16, 19]
+    assert tvm.runtime.convert([]).to_list() == []
+
+    shape = a.numpy()
+    assert shape.dtype == "int64"
+    np.testing.assert_equal(shape, np.arange(10000))
+    assert tvm.runtime.convert([]).numpy().shape == (0,)
+    with pytest.raises(ValueError):
+        tvm.runtime.convert([1, te.var("n")]).numpy()
+
+    x = tvm.nd.array([1, 2, 3])
+    elems = tvm.runtime.convert([x, "a"]).to_list()
+    assert elems[0].same_as(x)
+    assert elems[1] == "a"
+
+
 def test_array_save_load_json():
     a = tvm.runtime.convert([1, 2, 3])
     json_str = tvm.ir.save_json(a)
@@ -61,6 +83,19 @@ def test_map():
     assert set(amap.values()) == {2, 3}
 
 
+def test_map_bulk_conversion():
+    keys = [te.var("v%d" % i) for i in range(1000)]
+    amap = tvm.runtime.convert({k: i for i, k in enumerate(keys)})
+    dd = amap.to_dict()
+    assert len(dd) == 1000
+    assert all(dd[k].value == i for i, k in enumerate(keys))
+    assert {x.name for x in amap} == {k.name for k in keys}
+    assert sorted(x.value for x in amap.values()) == list(range(1000))
+
+    smap = tvm.runtime.convert({"a": 2, "b": 3}).to_dict()
+    assert {k: v.value for k, v in smap.items()} == {"a": 2, "b": 3}
+
+
 def test_str_map():
     amap = tvm.runtime.convert({"a": 2, "b": 3})
     assert "a" in amap
@@ -134,6 +134,20 @@ def test_meta_schedule_multiple_build():
     _check_build_results(builder_results)
 
 
+def test_meta_schedule_persistent_pool_build():
+    """Test meta schedule builder reusing its process pool across builds"""
+    builder = LocalBuilder(max_workers=2, persistent_pool=True, maximum_process_uses=2)
+    for _ in range(3):
+        builder_inputs = [
+            BuilderInput(MatmulModule, Target("llvm")),
+            BuilderInput(MatmulReluModule, Target("llvm")),
+            BuilderInput(BatchMatmulModule, Target("llvm")),
+        ]
+        builder_results = builder.build(builder_inputs)
+        assert len(builder_results) == len(builder_inputs)
+        _check_build_results(builder_results)
+
+
 def test_meta_schedule_error_handle_test_builder():
     """Test the error handing during building"""
 
@@ -27,6 +27,7 @@ import pytest
 import tvm
 import tvm.testing
 from tvm.meta_schedule.cost_model import PyCostModel, RandomModel, XGBModel
+from tvm.meta_schedule.cost_model.xgb_model import FeatureGroup
 from tvm.meta_schedule.feature_extractor import RandomFeatureExtractor
 from tvm.meta_schedule.runner import RunnerResult
 from tvm.meta_schedule.search_strategy import MeasureCandidate
@@ -228,5 +229,44 @@ def test_meta_schedule_xgb_model_reupdate():
     model.predict(TuneContext(), [_dummy_candidate() for i in range(predict_sample_count)])
 
 
+def test_meta_schedule_xgb_model_incremental():
+    extractor = RandomFeatureExtractor()
+    model = XGBModel(
+        extractor=extractor,
+        num_warmup_samples=2,
+        incremental=True,
+        num_incremental_rounds=10,
+        full_rebuild_interval=3,
+    )
+    update_sample_count = 30
+    predict_sample_count = 100
+    expected_updates_since_rebuild = [0, 1, 2, 0, 1]
+    for expected in expected_updates_since_rebuild:
+        model.update(
+            TuneContext(),
+            [_dummy_candidate() for i in range(update_sample_count)],
+            [_dummy_result() for i in range(update_sample_count)],
+        )
+        assert model.num_updates_since_rebuild == expected
+    assert model.data_size == update_sample_count * len(expected_updates_since_rebuild)
+    res = model.predict(TuneContext(), [_dummy_candidate() for i in range(predict_sample_count)])
+    assert res.shape == (predict_sample_count,)
+
+
+def test_meta_schedule_xgb_model_feature_group():
+    features = [np.random.rand(np.random.randint(1, 6), 8).astype("float32") for _ in range(100)]
+    costs = np.random.rand(100).astype("float32")
+    group = FeatureGroup(group_hash="hash", features=features[:1], costs=costs[:1])
+    for i in range(1, 100, 7):
+        group.append(features[i : i + 7], costs[i : i + 7])
+    assert group.num_candidates == 100
+    assert group.num_rows == sum(x.shape[0] for x in features)
+    assert group.min_cost == np.min(costs)
+    assert len(group.features) == len(features)
+    for f1, f2 in zip(group.features, features):
+        assert (f1 == f2).all()
+    assert (group.matrix == np.concatenate(features, axis=0)).all()
+
+
 if __name__ == "__main__":
     tvm.testing.main()
@@ -27,7 +27,12 @@ import tvm.testing
 from tvm import tir
 from tvm.ir.module import IRModule
 from tvm.meta_schedule.arg_info import ArgInfo
-from tvm.meta_schedule.database import JSONDatabase, TuningRecord
+from tvm.meta_schedule.database import (
+    JSONDatabase,
+    MemoryDatabase,
+    SQLiteDatabase,
+    TuningRecord,
+)
 from tvm.script import tir as T
 from tvm.tir import Schedule
 
@@ -296,5 +301,134 @@ def test_meta_schedule_database_reload():
             _equal_record(ret[1], records[2])
 
 
+def test_meta_schedule_sqlite_database():
+    mod: IRModule = Matmul
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = osp.join(tmpdir, "database.db")
+        database = SQLiteDatabase(path)
+        token = database.commit_workload(mod)
+        assert database.commit_workload(mod).same_as(token)
+        assert database.has_workload(mod)
+        assert not database.has_workload(MatmulRelu)
+        trace = _create_schedule(mod, _schedule_matmul).trace
+        records = [
+            TuningRecord(
+                trace,
+                run_secs,
+                token,
+                tvm.target.Target("llvm"),
+                ArgInfo.from_prim_func(func=mod["main"]),  # pylint: disable=unsubscriptable-object
+            )
+            for run_secs in [[7.0, 8.0, 9.0], [1.0, 2.0, 3.0], [4.0, 5.0, 6.0], []]
+        ]
+        for record in records:
+            database.commit_tuning_record(record)
+        assert len(database) == 4
+        ret = database.get_top_k(token, 2)
+        _equal_record(ret[0], records[1])
+        _equal_record(ret[1], records[2])
+        assert len(database.get_top_k(token, 10)) == 4
+        assert database.get_top_k(database.commit_workload(MatmulRelu), 3) == []
+
+        # A second connection, as from another process, sees the same data
+        other = SQLiteDatabase(path)
+        other_token = other.commit_workload(mod)
+        assert len(other) == 4
+        _equal_record(other.get_top_k(other_token, 1)[0], records[1])
+        other.commit_tuning_record(
+            TuningRecord(
+                trace,
+                [0.5],
+                other_token,
+                tvm.target.Target("llvm"),
+                ArgInfo.from_prim_func(func=mod["main"]),  # pylint: disable=unsubscriptable-object
+            )
+        )
+        assert [float(x) for x in database.get_top_k(token, 1)[0].run_secs] == [0.5]
+
+
+def test_meta_schedule_sqlite_database_json_round_trip():
+    mod: IRModule = Matmul
+    with tempfile.TemporaryDirectory() as tmpdir:
+        json_database = _create_tmp_database(tmpdir)
+        token = json_database.commit_workload(mod)
+        trace = _create_schedule(mod, _schedule_matmul).trace
+        for run_secs in [[3.0], [1.0], [2.0]]:
+            json_database.commit_tuning_record(
+                TuningRecord(
+                    trace,
+                    run_secs,
+                    token,
+                    tvm.target.Target("llvm"),
+                    ArgInfo.from_prim_func(
+                        func=mod["main"]
+                    ),  # pylint: disable=unsubscriptable-object
+                )
+            )
+        database = SQLiteDatabase(osp.join(tmpdir, "database.db"))
+        database.import_json(json_database.path_workload, json_database.path_tuning_record)
+        assert len(database) == 3
+        top = database.get_top_k(database.commit_workload(mod), 3)
+        assert [float(x) for r in top for x in r.run_secs] == [1.0, 2.0, 3.0]
+
+        path_workload = osp.join(tmpdir, "exported_workloads.json")
+        path_tuning_record = osp.join(tmpdir, "exported_tuning_records.json")
+        database.export_json(path_workload, path_tuning_record)
+        exported = JSONDatabase(path_workload, path_tuning_record, allow_missing=False)
+        assert len(exported) == 3
+        for a, b in zip(exported.get_top_k(exported.commit_workload(mod), 3), top):
+            _equal_record(a, b)
+
+
+def test_meta_schedule_memory_database():
+    mod: IRModule = Matmul
+    with tempfile.TemporaryDirectory() as tmpdir:
+        spill_path = osp.join(tmpdir, "spill.json")
+        database = MemoryDatabase(
+            max_records_per_workload=3,
+            max_records_in_memory=4,
+            spill_path=spill_path,
+        )
+        token = database.commit_workload(mod)
+        token_2 = database.commit_workload(MatmulRelu)
+        assert database.commit_workload(mod).same_as(token)
+        assert database.has_workload(MatmulRelu)
+        trace = _create_schedule(mod, _schedule_matmul).trace
+
+        def _record(workload, run_secs):
+            return TuningRecord(
+                trace,
+                run_secs,
+                workload,
+                tvm.target.Target("llvm"),
+                ArgInfo.from_prim_func(func=mod["main"]),  # pylint: disable=unsubscriptable-object
+            )
+
+        for run_sec in [5.0, 3.0, 4.0, 1.0, 2.0]:
+            database.commit_tuning_record(_record(token, [run_sec]))
+        # committing to the second workload spills the records of the first one
+        for run_sec in [6.0, 7.0]:
+            database.commit_tuning_record(_record(token_2, [run_sec]))
+
+        def _num_spilled():
+            with open(spill_path) as spill_file:
+                return len(spill_file.readlines())
+
+        assert len(database) == 7
+        assert _num_spilled() == 3
+        # using the first workload loads its records back and spills those of the second
+        assert [float(r.run_secs[0]) for r in database.get_top_k(token, 5)] == [1.0, 2.0, 3.0]
+        assert _num_spilled() == 2
+        assert [float(r.run_secs[0]) for r in database.get_top_k(token_2, 5)] == [6.0, 7.0]
+        # the records loaded back do not accumulate in the spill file
+        for _ in range(10):
+            database.get_top_k(token, 1)
+            database.get_top_k(token_2, 1)
+        assert _num_spilled() <= 5
+        assert [float(r.run_secs[0]) for r in database.get_top_k(token, 5)] == [1.0, 2.0, 3.0]
+        database.close()
+        assert not osp.exists(spill_path)
+
+
 if __name__ == "__main__":
     tvm.testing.main()
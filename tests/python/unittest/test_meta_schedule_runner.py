@@ -37,6 +37,7 @@ from tvm.meta_schedule.runner import (
     RunnerFuture,
     RunnerInput,
 )
+from tvm.meta_schedule.runner.local_runner import _ArgumentCache
 from tvm.meta_schedule.runner.local_runner import (
     default_alloc_argument as local_default_alloc_argument,
 )
@@ -295,6 +296,65 @@ def test_meta_schedule_rpc_multiple_runs():
         _clean_build(builder_result.artifact_path)
 
 
+def test_meta_schedule_rpc_runner_session_reuse():
+    """Test meta schedule rpc runner measuring several candidates in one session"""
+    mods = [MatmulModule, MatmulReluModule, MatmulModule, BatchMatmulModule, MatmulModule]
+    builder = LocalBuilder()
+    builder_inputs = [BuilderInput(mod, Target("llvm")) for mod in mods]
+    builder_results = builder.build(builder_inputs)
+    for builder_result in builder_results:
+        assert builder_result.artifact_path is not None
+        assert builder_result.error_msg is None
+
+    matmul_args_info = [
+        TensorInfo("float32", (MATMUL_N, MATMUL_N)),
+        TensorInfo("float32", (MATMUL_N, MATMUL_N)),
+        TensorInfo("float32", (MATMUL_N, MATMUL_N)),
+    ]
+    batch_matmul_args_info = [
+        TensorInfo("float32", [16, MATMUL_M, MATMUL_M]),
+        TensorInfo("float32", [16, MATMUL_M, MATMUL_M]),
+        TensorInfo("float32", [16, MATMUL_M, MATMUL_M]),
+    ]
+    runner_inputs = [
+        RunnerInput(
+            builder_result.artifact_path,
+            "llvm",
+            batch_matmul_args_info if mod is BatchMatmulModule else matmul_args_info,
+        )
+        for mod, builder_result in zip(mods, builder_results)
+    ]
+
+    with LocalRPC() as rpc:
+        rpc_config = RPCConfig(
+            tracker_host=rpc.tracker_host,
+            tracker_port=rpc.tracker_port,
+            tracker_key=rpc.tracker_key,
+            session_priority=1,
+            session_timeout_sec=100,
+        )
+        evaluator_config = EvaluatorConfig(
+            number=1,
+            repeat=1,
+            min_repeat_ms=0,
+            enable_cpu_cache_flush=False,
+        )
+        runner = RPCRunner(rpc_config, evaluator_config, max_session_uses=3)
+        runner_futures = runner.run(runner_inputs)
+        runner_results = [runner_future.result() for runner_future in runner_futures]
+
+    for runner_result in runner_results:
+        assert runner_result.error_msg is None
+        for result in runner_result.run_secs:
+            if isinstance(result, FloatImm):
+                result = result.value
+            assert isinstance(result, float)
+            assert result >= 0.0
+
+    for builder_result in builder_results:
+        _clean_build(builder_result.artifact_path)
+
+
 def test_meta_schedule_local_multiple_runs():
     """Test meta schedule local runner for multiple runs"""
     # Build the module
@@ -358,6 +418,71 @@ def test_meta_schedule_local_multiple_runs():
         _clean_build(builder_result.artifact_path)
 
 
+def test_meta_schedule_local_runner_arg_cache():
+    """Test meta schedule local runner reusing cached arguments across runs"""
+    mods = [MatmulModule, MatmulReluModule]
+    builder = LocalBuilder()
+    builder_inputs = [BuilderInput(mod, Target("llvm")) for mod in mods]
+    builder_results = builder.build(builder_inputs)
+    args_info = [
+        TensorInfo("float32", (MATMUL_N, MATMUL_N)),
+        TensorInfo("float32", (MATMUL_N, MATMUL_N)),
+        TensorInfo("float32", (MATMUL_N, MATMUL_N)),
+    ]
+    runner_inputs = [
+        RunnerInput(builder_result.artifact_path, "llvm", args_info)
+        for builder_result in builder_results
+    ]
+    evaluator_config = EvaluatorConfig(
+        number=1,
+        repeat=1,
+        min_repeat_ms=0,
+        enable_cpu_cache_flush=False,
+    )
+    runner = LocalRunner(timeout_sec=100, evaluator_config=evaluator_config, arg_cache_mb=16)
+    for _ in range(2):
+        runner_futures = runner.run(runner_inputs)
+        for runner_future in runner_futures:
+            runner_result = runner_future.result()
+            assert runner_result.error_msg is None
+            assert len(runner_result.run_secs) == 1
+
+    for builder_result in builder_results:
+        _clean_build(builder_result.artifact_path)
+
+
+def test_meta_schedule_local_runner_arg_cache_eviction():
+    """Test the LRU eviction of the argument cache of the local runner"""
+    num_allocs = 0
+
+    def f_alloc(shape):
+        def alloc():
+            nonlocal num_allocs
+            num_allocs += 1
+            return [[tvm.nd.empty(shape, "float32")]]
+
+        return alloc
+
+    # 64 KB budget, each entry takes 16 KB or 48 KB
+    cache = _ArgumentCache(64 * 1024)
+    small, large = (64, 64), (192, 64)
+    args = cache.get(("a", "cpu(0)", 1), f_alloc(small))
+    assert cache.get(("a", "cpu(0)", 1), f_alloc(small)) is args
+    assert num_allocs == 1
+    cache.get(("b", "cpu(0)", 1), f_alloc(large))
+    assert num_allocs == 2
+    assert cache.num_bytes == 64 * 1024
+    # "a" is the least recently used entry, so it is evicted
+    cache.get(("c", "cpu(0)", 1), f_alloc(small))
+    assert num_allocs == 3
+    assert ("a", "cpu(0)", 1) not in cache.entries
+    # an entry larger than the budget is never cached
+    cache.get(("d", "cpu(0)", 1), f_alloc((512, 512)))
+    cache.get(("d", "cpu(0)", 1), f_alloc((512, 512)))
+    assert num_allocs == 5
+    assert cache.num_bytes <= 64 * 1024
+
+
 def test_meta_schedule_py_runner():
     """Test meta schedule PyRunner"""
 
@@ -0,0 +1,97 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import numpy as np
+import pytest
+
+import tvm
+import tvm.testing
+from tvm import relay
+from tvm.contrib.dynamic_batching import DynamicBatcher
+
+
+def _build(batch_size):
+    x = relay.var("x", shape=(batch_size, 4))
+    func = relay.Function([x], relay.Tuple([relay.add(x, relay.const(1.0)), relay.sum(x, axis=1)]))
+    return relay.build(func, target="llvm")
+
+
+@tvm.testing.requires_llvm
+def test_dynamic_batching_graph():
+    models = {size: _build(size) for size in [1, 4, 8]}
+    with DynamicBatcher(models, max_latency_ms=50) as batcher:
+        inputs = [
+            np.random.uniform(size=(np.random.randint(1, 3), 4)).astype("float32")
+            for _ in range(30)
+        ]
+        futures = [batcher.submit({"x": x}) for x in inputs]
+        for x, future in zip(inputs, futures):
+            added, summed = future.result()
+            np.testing.assert_allclose(added, x + 1.0, rtol=1e-6)
+            np.testing.assert_allclose(summed, x.sum(axis=1), rtol=1e-5)
+
+        stats = batcher.stats()
+        assert stats["num_requests"] == 30
+        assert stats["num_batches"] < 30
+        assert stats["mean_batch_size"] <= 8
+
+        with pytest.raises(ValueError):
+            batcher.submit({"x": np.zeros((9, 4), "float32")})
+    with pytest.raises(RuntimeError):
+        batcher.submit({"x": inputs[0]})
+
+
+@tvm.testing.requires_llvm
+def test_dynamic_batching_vm():
+    x = relay.var("x", shape=(relay.Any(), 4))
+    mod = tvm.IRModule.from_expr(relay.Function([x], relay.multiply(x, relay.const(2.0))))
+    exe = relay.vm.compile(mod, target="llvm")
+    vm = tvm.runtime.vm.VirtualMachine(exe, tvm.cpu())
+    with DynamicBatcher(vm, max_batch_size=6, max_latency_ms=50) as batcher:
+        inputs = [np.random.uniform(size=(2, 4)).astype("float32") for _ in range(9)]
+        futures = [batcher.submit({"x": x}) for x in inputs]
+        for x, future in zip(inputs, futures):
+            (out,) = future.result()
+            np.testing.assert_allclose(out, x * 2.0, rtol=1e-6)
+        assert batcher.stats()["padding_ratio"] == 0.0
+
+
+@tvm.testing.requires_llvm
+def test_dynamic_batching_output_without_batch_axis():
+    def _build_reduced(batch_size):
+        x = relay.var("x", shape=(batch_size, 4))
+        return relay.build(relay.Function([x], relay.sum(x, axis=0)), target="llvm")
+
+    # The output of the batch 4 model has 4 rows, the one of the batch 2 model does not
+    with pytest.raises(ValueError, match="batch size 2"):
+        DynamicBatcher({2: _build_reduced(2), 4: _build_reduced(4)})
+
+    x = relay.var("x", shape=(relay.Any(), 3))
+    mod = tvm.IRModule.from_expr(relay.Function([x], relay.sum(x, axis=0)))
+    exe = relay.vm.compile(mod, target="llvm")
+    vm = tvm.runtime.vm.VirtualMachine(exe, tvm.cpu())
+    with DynamicBatcher(vm, max_batch_size=4, max_latency_ms=1) as batcher:
+        # The batch fails instead of stopping the batcher
+        for _ in range(2):
+            with pytest.raises(ValueError, match="batch size"):
+                batcher.submit({"x": np.zeros((2, 3), "float32")}).result(timeout=60)
+        assert batcher.stats()["num_requests"] == 0
+
+
+if __name__ == "__main__":
+    test_dynamic_batching_graph()
+    test_dynamic_batching_vm()
+    test_dynamic_batching_output_without_batch_axis()
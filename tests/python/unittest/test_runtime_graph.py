@@ -19,6 +19,7 @@ import tvm.testing
 from tvm import te, runtime
 import numpy as np
 import json
+import pytest
 from tvm import rpc
 from tvm import relay
 from tvm.contrib import utils, graph_executor
@@ -138,6 +139,72 @@ def test_load_unexpected_params():
     rt_mod.load_params(runtime.save_param_dict(new_params))
 
 
+@tvm.testing.requires_llvm
+def test_graph_zero_copy():
+    x = relay.var("x", shape=(1, 10))
+    y = relay.var("y", shape=(1, 10))
+    func = relay.Function([x, y], relay.add(x, y))
+    lib = relay.build(func, target="llvm")
+    mod = graph_executor.GraphModule(lib["default"](tvm.cpu(0)))
+
+    # aligned buffers are bound in place
+    x_in = tvm.nd.empty((1, 10)).numpy(zero_copy=True)
+    y_in = tvm.nd.empty((1, 10)).numpy(zero_copy=True)
+    out = tvm.nd.empty((1, 10)).numpy(zero_copy=True)
+    x_in[:] = np.random.uniform(size=(1, 10))
+    y_in[:] = np.random.uniform(size=(1, 10))
+    mod.set_input_zero_copy(x=x_in, y=y_in)
+    mod.set_output_zero_copy(0, out)
+    mod.run()
+    np.testing.assert_allclose(out, x_in + y_in)
+    assert mod.get_output(0) is out
+
+    x_in[:] = 1.0
+    mod.run()
+    np.testing.assert_allclose(out, 1.0 + y_in)
+
+    # other inputs are copied, and a copy releases the zero-copy binding
+    y_copy = np.random.uniform(size=(1, 10))
+    mod.set_input_zero_copy("y", y_copy)
+    mod.set_input("x", np.full((1, 10), 2.0, "float32"))
+    x_in[:] = 3.0
+    mod.run()
+    np.testing.assert_allclose(out, 2.0 + y_copy.astype("float32"))
+
+    res = np.empty((1, 10), "float32")
+    assert mod.get_output(0, res) is res
+    np.testing.assert_allclose(res, out)
+
+    with pytest.raises(ValueError):
+        mod.set_output_zero_copy(0, np.empty((1, 10), "float64"))
+
+
+@tvm.testing.requires_llvm
+def test_graph_executor_pool():
+    from tvm.contrib.graph_executor_pool import GraphExecutorPool
+
+    x = relay.var("x", shape=(1, 10))
+    w = relay.var("w", shape=(1, 10))
+    func = relay.Function([x, w], relay.multiply(x, w))
+    w_in = np.random.uniform(size=(1, 10)).astype("float32")
+    lib = relay.build(func, target="llvm", params={"w": w_in})
+
+    with GraphExecutorPool(lib, num_instances=3, cores_per_instance=1) as pool:
+        assert len(pool.instances) == 3
+        inputs = [np.random.uniform(size=(1, 10)).astype("float32") for _ in range(20)]
+        futures = [pool.submit({"x": x_in}) for x_in in inputs]
+        for x_in, future in zip(inputs, futures):
+            (out,) = future.result()
+            np.testing.assert_allclose(out, x_in * w_in, rtol=1e-6)
+
+        with pytest.raises(Exception):
+            pool.submit({"x": np.zeros((2, 3), "float32")}).result()
+    with pytest.raises(RuntimeError):
+        pool.submit({"x": inputs[0]})
+
+
 if __name__ == "__main__":
     test_graph_simple()
     test_load_unexpected_params()
+    test_graph_zero_copy()
+    test_graph_executor_pool()
@@ -17,18 +17,23 @@
 import tvm
 from tvm import te
 import tvm.testing
+import hashlib
 import multiprocessing
 import os
 import stat
+import struct
 import sys
 import time
+import urllib.request
 
 import pytest
 import numpy as np
 from tvm import rpc
 from tvm.relay.backend import Runtime
 from tvm.contrib import utils, cc
-from tvm.rpc.tracker import Tracker
+from tvm.rpc import base
+from tvm.rpc.base import TrackerCode
+from tvm.rpc.tracker import FairShareScheduler, Tracker
 from tvm.rpc.proxy import Proxy
 
 
@@ -234,6 +239,52 @@ def test_rpc_file_exchange():
     check_remote()
 
 
+@tvm.testing.requires_rpc
+def test_rpc_server_prefork_upload_cache():
+    temp = utils.tempdir()
+    server = rpc.Server(key="x1", prefork=1, upload_cache_dir=temp.relpath("cache"))
+    blob = bytearray(np.random.randint(0, 10, size=(1024)))
+
+    for _ in range(2):
+        remote = rpc.connect("127.0.0.1", server.port, key="x1")
+        remote.upload(blob, "dat.bin")
+        assert remote.download("dat.bin") == blob
+        del remote
+
+    # the metrics are recorded when the sessions end
+    for _ in range(100):
+        metrics = server.metrics()
+        if metrics["sessions"] == 2:
+            break
+        time.sleep(0.1)
+    assert metrics["sessions"] == 2
+    assert metrics["setup_latency_ms"]["max"] is not None
+    assert metrics["upload_cache"] == {"hits": 1, "misses": 1, "bytes_saved": len(blob)}
+
+
+def test_rpc_upload_cache_evicts():
+    temp = utils.tempdir()
+    cache = rpc.server.UploadCache(temp.relpath("cache"), max_bytes=10)
+    data = [bytearray(b"a" * 6), bytearray(b"b" * 6)]
+    digests = [hashlib.sha256(x).hexdigest() for x in data]
+
+    assert not cache.lookup(digests[0], temp.relpath("dat.bin"))
+    cache.put(digests[0], data[0])
+    assert cache.lookup(digests[0], temp.relpath("dat.bin"))
+    with open(temp.relpath("dat.bin"), "rb") as in_file:
+        assert in_file.read() == data[0]
+
+    # the least recently used content is evicted
+    cache.put(digests[1], data[1])
+    assert not cache.lookup(digests[0], temp.relpath("dat.bin"))
+    assert cache.lookup(digests[1], temp.relpath("dat.bin"))
+
+    with pytest.raises(ValueError):
+        cache.put(digests[0], data[1])
+    with pytest.raises(ValueError):
+        cache.lookup("../dat.bin", temp.relpath("dat.bin"))
+
+
 @tvm.testing.requires_rpc
 @tvm.testing.requires_llvm
 def test_rpc_remote_module():
@@ -561,6 +612,121 @@ def test_rpc_tracker_request():
     tracker.terminate()
 
 
+class _FakeServerConn:
+    def __init__(self):
+        self.pending_matchkeys = set()
+
+
+def _fake_server_value(index):
+    conn = _FakeServerConn()
+    conn.pending_matchkeys.add("key%d" % index)
+    return (conn, "127.0.0.1", 9000 + index, "key%d" % index)
+
+
+def test_rpc_tracker_fair_share_scheduler():
+    scheduler = FairShareScheduler("test_device", user_weights={"b": 2.0})
+    granted = []
+    for i in range(6):
+        scheduler.request("a", 1, lambda value, i=i: granted.append(("a", i)) or True)
+    for i in range(6):
+        scheduler.request("b", 1, lambda value, i=i: granted.append(("b", i)) or True)
+    values = [_fake_server_value(i) for i in range(6)]
+    for value in values:
+        scheduler.put(value)
+
+    # b gets twice the share of a, each user is served in request order
+    assert [user for user, _ in granted] == ["a", "b", "b", "a", "b", "b"]
+    assert [i for user, i in granted if user == "a"] == [0, 1]
+
+    # a higher priority request is served first
+    scheduler.request("a", 10, lambda value: granted.append(("a", "high")) or True)
+    values[0][0].pending_matchkeys.add(values[0][-1])
+    scheduler.put(values[0])
+    assert granted[-1] == ("a", "high")
+
+    # a request whose client disconnected does not consume the resource
+    scheduler.request("c", 100, lambda value: False)
+    values[1][0].pending_matchkeys.add(values[1][-1])
+    scheduler.put(values[1])
+    assert granted[-1] == ("b", 4)
+
+    summary = scheduler.summary()
+    assert summary["free"] == 0
+    assert summary["leased"] == 6
+    assert summary["pending"] == 5
+    assert summary["granted"] == 8
+    assert summary["wait_histogram"][-1] == ["+Inf", 8]
+    assert summary["users"]["a"] == {"pending": 4, "granted": 3, "weight": 1.0}
+    assert summary["users"]["b"] == {"pending": 1, "granted": 5, "weight": 2.0}
+
+    # the lease ends when the server disconnects
+    scheduler.remove(values[2])
+    assert scheduler.summary()["leased"] == 5
+
+
+@tvm.testing.requires_rpc
+def test_rpc_tracker_lease_and_metrics():
+    tracker = Tracker(
+        port=9000,
+        port_end=10000,
+        scheduler="fair_share",
+        lease_timeout=2,
+        metrics_port=0,
+    )
+    device_key = "test_device"
+    server = rpc.Server(
+        port=9000,
+        port_end=10000,
+        key=device_key,
+        tracker_addr=("127.0.0.1", tracker.port),
+    )
+    client = rpc.connect_tracker("127.0.0.1", tracker.port)
+    time.sleep(0.5)
+
+    # the session is killed by the server once the lease expires
+    remote = client.request(device_key, user="alice")
+    remote.cpu()
+    time.sleep(3)
+    with pytest.raises(tvm.error.TVMError):
+        remote.cpu()
+    time.sleep(0.5)
+
+    # the server also ends the session of a client which does not know about leases
+    tracker_conn = base.connect_with_retry(("127.0.0.1", tracker.port))
+    tracker_conn.sendall(struct.pack("<i", base.RPC_TRACKER_MAGIC))
+    assert struct.unpack("<i", base.recvall(tracker_conn, 4))[0] == base.RPC_TRACKER_MAGIC
+    base.sendjson(tracker_conn, [TrackerCode.REQUEST, device_key, "bob", 1])
+    code, value = base.recvjson(tracker_conn)
+    assert code == TrackerCode.SUCCESS and len(value) == 3
+    url, port, matchkey = value
+    remote = rpc.connect(url, port, key=matchkey)
+    remote.cpu()
+    time.sleep(3)
+    with pytest.raises(tvm.error.TVMError):
+        remote.cpu()
+    tracker_conn.close()
+    time.sleep(0.5)
+
+    summary = client.summary()["queue_info"][device_key]
+    assert summary["free"] == 1
+    assert summary["leased"] == 0
+    assert summary["granted"] == 2
+    assert summary["users"]["alice"]["granted"] == 1
+    assert summary["users"]["bob"]["granted"] == 1
+
+    metrics = (
+        urllib.request.urlopen("http://127.0.0.1:%d/metrics" % tracker.metrics_port)
+        .read()
+        .decode("utf-8")
+    )
+    assert 'tvm_rpc_tracker_free_servers{key="%s"} 1' % device_key in metrics
+    assert 'tvm_rpc_tracker_wait_seconds_count{key="%s"} 2' % device_key in metrics
+    assert 'tvm_rpc_tracker_user_granted_total{key="%s",user="alice"} 1' % device_key in metrics
+
+    server.terminate()
+    tracker.terminate()
+
+
 @tvm.testing.requires_rpc
 def test_rpc_tracker_via_proxy():
     """